@@ -27,6 +27,15 @@ def lxml_writer(ws=None):
     #ws.parent.save("lxml_writer.xlsx")
 
 
+def sheet_data_writer(ws=None):
+    from openpyxl.writer.sheet_data import write_sheet_data
+    if ws is None:
+        ws = make_worksheet()
+
+    out = BytesIO()
+    write_sheet_data(out, ws)
+
+
 def make_dump_worksheet():
     wb = Workbook(write_only=True)
     ws = wb.create_sheet()
@@ -82,9 +82,8 @@ class Cell(StyleableObject):
 
     """
     __slots__ =  (
-        'column',
+        'col_idx',
         'row',
-        'coordinate',
         '_value',
         'data_type',
         'parent',
@@ -108,21 +107,17 @@ class Cell(StyleableObject):
                    TYPE_NULL, TYPE_INLINE, TYPE_ERROR, TYPE_FORMULA_CACHE_STRING)
 
 
-    def __init__(self, worksheet, column, row, value=None, fontId=0,
+    def __init__(self, worksheet, column=None, row=None, value=None, fontId=0,
                  fillId=0, borderId=0, alignmentId=0, protectionId=0, numFmtId=0,
-                 pivotButton=None, quotePrefix=None, xfId=None):
-        self._font_id = fontId
-        self._fill_id = fillId
-        self._border_id = borderId
-        self._alignment_id = alignmentId
-        self._protection_id = protectionId
-        self._number_format_id = numFmtId
-        self.quotePrefix = quotePrefix
-        self.pivotButton = pivotButton
+                 pivotButton=None, quotePrefix=None, xfId=None, col_idx=None):
+        self._style = (fontId, fillId, borderId, alignmentId, protectionId,
+                       numFmtId, pivotButton, quotePrefix)
+        self._style_index = None
         self.parent = worksheet
-        self.column = column
+        if col_idx is None:
+            col_idx = column_index_from_string(column)
+        self.col_idx = col_idx
         self.row = row
-        self.coordinate = '%s%d' % (self.column, self.row)
         # _value is the stored value, while value is the displayed value
         self._value = None
         self._hyperlink_rel = None
@@ -133,6 +128,23 @@ class Cell(StyleableObject):
         self._comment = None
 
 
+    @property
+    def column(self):
+        return get_column_letter(self.col_idx)
+
+    @column.setter
+    def column(self, value):
+        self.col_idx = column_index_from_string(value)
+
+    @property
+    def coordinate(self):
+        return '%s%d' % (get_column_letter(self.col_idx), self.row)
+
+    @coordinate.setter
+    def coordinate(self, value):
+        column, self.row = coordinate_from_string(value)
+        self.col_idx = column_index_from_string(column)
+
     @property
     def encoding(self):
         return self.parent.encoding
@@ -363,7 +375,7 @@ class Cell(StyleableObject):
 
         :rtype: :class:`openpyxl.cell.Cell`
         """
-        offset_column = column_index_from_string(self.column) + column
+        offset_column = self.col_idx + column
         offset_row = self.row + row
         return self.parent.cell(column=offset_column, row=offset_row)
 
@@ -374,7 +386,7 @@ class Cell(StyleableObject):
 
             :rtype: tuple(int, int)
         """
-        left_columns = (column_index_from_string(self.column) - 1)
+        left_columns = self.col_idx - 1
         column_dimensions = self.parent.column_dimensions
         left_anchor = 0
         default_width = points_to_pixels(DEFAULT_COLUMN_WIDTH)
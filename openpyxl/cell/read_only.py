@@ -2,6 +2,8 @@ from __future__ import absolute_import
 # Copyright (c) 2010-2015 openpyxl
 
 
+from collections import namedtuple
+
 from openpyxl.compat import unicode
 
 from openpyxl.cell import Cell
@@ -11,6 +13,45 @@ from openpyxl.styles.numbers import BUILTIN_FORMATS
 from openpyxl.styles.styleable import StyleableObject
 
 
+XfInfo = namedtuple('XfInfo', ['is_date', 'number_format', 'font', 'fill',
+                               'border', 'alignment', 'protection'])
+
+
+DEFAULT_XF = XfInfo(False, "General", 0, 0, 0, 0, 0)
+
+
+class XfTable(list):
+    """
+    Resolved number format and style ids of each cell style of a workbook,
+    by xf index
+    """
+
+    def __init__(self, workbook):
+        self.cell_styles = workbook._cell_styles
+        number_formats = workbook._number_formats
+        for style in self.cell_styles:
+            if style is None:
+                self.append(DEFAULT_XF)
+                continue
+            _id = style.number_format
+            if _id < 164:
+                fmt = BUILTIN_FORMATS.get(_id, "General")
+            else:
+                fmt = number_formats[_id - 164]
+            self.append(XfInfo(is_date_format(fmt), fmt, style.font, style.fill,
+                               style.border, style.alignment, style.protection))
+
+
+def xf_table(workbook):
+    """Table of the cell styles of a workbook, built once"""
+    table = getattr(workbook, '_xf_table', None)
+    styles = workbook._cell_styles
+    if (table is None or table.cell_styles is not styles
+        or len(table) != len(styles)):
+        table = workbook._xf_table = XfTable(workbook)
+    return table
+
+
 class ReadOnlyCell(object):
 
     __slots__ =  ('parent', 'row', 'column', '_value', 'data_type', '_style_id')
@@ -53,44 +94,44 @@ class ReadOnlyCell(object):
             return
         return self.parent.parent._cell_styles[self._style_id]
 
+    @property
+    def _xf(self):
+        return xf_table(self.parent.parent)[self._style_id or 0]
+
     @property
     def number_format(self):
-        if not self.style_id:
+        if not self._style_id:
             return
-        _id = self.style_id.number_format
-        if _id < 164:
-            return BUILTIN_FORMATS.get(_id, "General")
-        else:
-            return self.parent.parent._number_formats[_id - 164]
+        return self._xf.number_format
 
     @property
     def font(self):
-        _id = self.style_id.font
+        _id = self._xf.font
         return self.parent.parent._fonts[_id]
 
     @property
     def fill(self):
-        _id = self.style_id.fill
+        _id = self._xf.fill
         return self.parent.parent._fills[_id]
 
     @property
     def border(self):
-        _id = self.style_id.border
+        _id = self._xf.border
         return self.parent.parent._borders[_id]
 
     @property
     def alignment(self):
-        _id = self.style_id.alignment
+        _id = self._xf.alignment
         return self.parent.parent._alignments[_id]
 
     @property
     def protection(self):
-        _id = self.style_id.protection
+        _id = self._xf.protection
         return self.parent.parent._protections[_id]
 
     @property
     def is_date(self):
-        return self.data_type == 'n' and is_date_format(self.number_format)
+        return self.data_type == 'n' and bool(self._style_id) and self._xf.is_date
 
     @property
     def internal_value(self):
@@ -101,7 +142,7 @@ class ReadOnlyCell(object):
         if self._value is None:
             return
         if self.data_type == 'n':
-            if is_date_format(self.number_format):
+            if self._style_id and self._xf.is_date:
                 return from_excel(self._value, self.base_date)
             return self._value
         if self.data_type == 'b':
@@ -102,6 +102,15 @@ def test_ctor(dummy_cell):
     assert cell.comment is None
 
 
+def test_column_index(dummy_cell):
+    cell = dummy_cell
+    assert cell.col_idx == 1
+    cell.column = 'AB'
+    assert cell.col_idx == 28
+    cell.coordinate = 'C5'
+    assert (cell.column, cell.row, cell.col_idx) == ('C', 5, 3)
+
+
 @pytest.mark.parametrize("datatype", ['n', 'd', 's', 'b', 'f', 'e'])
 def test_null(dummy_cell, datatype):
     cell = dummy_cell
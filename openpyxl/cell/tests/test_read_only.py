@@ -127,3 +127,23 @@ def test_equality():
     assert c1 == c2
     c3 = ReadOnlyCell(None, None, 5, None)
     assert c3 != c1
+
+
+def test_xf_table():
+    from openpyxl.cell.read_only import xf_table
+
+    class DummyWorkbook(object):
+        _cell_styles = IndexedList([StyleId(), StyleId(numFmtId=14)])
+        _number_formats = IndexedList()
+
+    wb = DummyWorkbook()
+    table = xf_table(wb)
+    assert xf_table(wb) is table
+    assert [xf.is_date for xf in table] == [False, True]
+    assert table[1].number_format == 'mm-dd-yy'
+
+    wb._cell_styles.add(StyleId(numFmtId=164))
+    wb._number_formats.add('0.00%')
+    table = xf_table(wb)
+    assert len(table) == 3
+    assert table[2].number_format == '0.00%'
@@ -12,7 +12,7 @@ from .strings import (
     tempfile,
     safe_string
     )
-from .numbers import long, NUMERIC_TYPES
+from .numbers import long, NUMERIC_TYPES, NUMPY
 from .itertools import (
     range,
     iteritems,
@@ -12,3 +12,9 @@ from decimal import Decimal
 
 NUMERIC_TYPES = (int, float, long, Decimal)
 
+try:
+    import numpy
+    NUMPY = True
+except ImportError:
+    NUMPY = False
+
@@ -37,6 +37,10 @@ def pytest_runtest_setup(item):
             pytest.skip("PIL must be installed")
         elif item.get_marker("pil_not_installed") and Image:
             pytest.skip("PIL is installed")
+        elif item.get_marker("numpy_required"):
+            from openpyxl.compat import NUMPY
+            if not NUMPY:
+                pytest.skip("numpy must be installed")
         elif item.get_marker("not_py33"):
             pytest.skip("Ordering is not a given in Python 3")
         elif item.get_marker("lxml_required"):
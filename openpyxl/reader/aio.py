@@ -0,0 +1,168 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Load workbooks and read rows from an asyncio event loop.
+
+The work is done in a pool of threads of its own, of bounded size, so that
+large workbooks neither block the loop nor take all of its default executor.
+Rows are read in chunks, one chunk ahead of the consumer at most.
+
+Requires Python 3.5, for `async for` and StopAsyncIteration.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from multiprocessing import cpu_count
+
+from openpyxl.reader import excel
+
+CHUNK_SIZE = 1000
+
+_executor = []
+
+
+def default_executor():
+    """Pool of threads shared by all readers, one per core"""
+    if not _executor:
+        _executor.append(ThreadPoolExecutor(cpu_count()))
+    return _executor[0]
+
+
+def _future(loop):
+    create_future = getattr(loop, 'create_future', None)
+    if create_future is not None:
+        return create_future()
+    return asyncio.Future(loop=loop)
+
+
+def load_workbook(filename, executor=None, loop=None, **kw):
+    """
+    Load a workbook in the executor, by default the shared pool of threads.
+    Takes the same arguments as :func:`openpyxl.reader.excel.load_workbook`
+    and returns a future of the workbook.
+    """
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    if executor is None:
+        executor = default_executor()
+    return loop.run_in_executor(executor,
+                                partial(excel.load_workbook, filename, **kw))
+
+
+def _take(rows, size):
+    """The next rows and the error which stopped them, if any"""
+    chunk = []
+    try:
+        chunk.extend(islice(rows, size))
+    except Exception as e:
+        return chunk, e
+    return chunk, None
+
+
+class AsyncRowIterator(object):
+    """
+    Asynchronous iterator over rows which are read in chunks in an executor.
+    A chunk is read while the previous one is consumed, no more.
+    """
+
+    def __init__(self, rows, executor=None, loop=None, chunk_size=CHUNK_SIZE):
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        if executor is None:
+            executor = default_executor()
+        self._rows = iter(rows)
+        self._executor = executor
+        self._loop = loop
+        self.chunk_size = chunk_size
+        self._buffer = deque()
+        self._waiters = deque()
+        self._pending = None
+        self._error = None
+        self._done = False
+        self._closed = False
+
+
+    def __aiter__(self):
+        return self
+
+
+    def __anext__(self):
+        waiter = _future(self._loop)
+        self._waiters.append(waiter)
+        self._wake()
+        return waiter
+
+
+    def _fetch(self):
+        self._pending = self._loop.run_in_executor(
+            self._executor, _take, self._rows, self.chunk_size)
+        self._pending.add_done_callback(self._chunk_done)
+
+
+    def _chunk_done(self, chunk):
+        self._pending = None
+        if self._closed:
+            self._close_rows()
+            return
+        if chunk.cancelled():
+            self._error = asyncio.CancelledError()
+            self._done = True
+        elif chunk.exception() is not None:
+            self._error = chunk.exception()
+            self._done = True
+        else:
+            rows, self._error = chunk.result()
+            if self._error is not None or len(rows) < self.chunk_size:
+                self._done = True
+            self._buffer.extend(rows)
+        self._wake()
+
+
+    def _wake(self):
+        """Hand rows to the waiters and keep one chunk ahead"""
+        while self._waiters and (self._buffer or self._done):
+            waiter = self._waiters.popleft()
+            if waiter.cancelled():
+                continue
+            if self._buffer:
+                waiter.set_result(self._buffer.popleft())
+            elif self._error is not None:
+                waiter.set_exception(self._error)
+            else:
+                waiter.set_exception(StopAsyncIteration())
+        if (self._pending is None and not self._done
+            and len(self._buffer) < self.chunk_size):
+            self._fetch()
+
+
+    def _close_rows(self):
+        close = getattr(self._rows, 'close', None)
+        if close is not None:
+            close()
+
+
+    def close(self):
+        """
+        Stop reading. Rows which are being read are discarded when the chunk
+        is complete.
+        """
+        if self._closed:
+            return
+        self._closed = self._done = True
+        self._buffer.clear()
+        self._wake()
+        if self._pending is None:
+            self._close_rows()
+
+
+def iter_rows(worksheet, executor=None, loop=None, chunk_size=CHUNK_SIZE, **kw):
+    """
+    Asynchronous iterator over the rows of a worksheet. Keyword arguments are
+    passed to the `iter_rows()` method of the worksheet.
+    """
+    return AsyncRowIterator(worksheet.iter_rows(**kw), executor, loop,
+                            chunk_size)
@@ -22,6 +22,7 @@ except ImportError:
 
 # package imports
 from openpyxl.utils.exceptions import InvalidFileException
+from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.xml.constants import (
     ARC_SHARED_STRINGS,
     ARC_CORE,
@@ -37,7 +38,11 @@ from openpyxl.xml.constants import (
 from openpyxl.workbook import Workbook
 from openpyxl.workbook.names.external import detect_external_links
 from openpyxl.workbook.names.named_range import read_named_ranges
-from openpyxl.reader.strings import read_string_table
+from openpyxl.reader.strings import (
+    read_string_table,
+    iter_strings,
+    DiskStringTable
+    )
 from openpyxl.reader.style import read_style_table
 from openpyxl.reader.workbook import (
     read_content_types,
@@ -47,7 +52,11 @@ from openpyxl.reader.workbook import (
     read_workbook_code_name,
 )
 from openpyxl.workbook.properties import read_properties, DocumentProperties
-from openpyxl.reader.worksheet import read_worksheet
+from openpyxl.reader.worksheet import (
+    read_worksheet,
+    read_worksheets,
+    LazyWorksheet
+    )
 from openpyxl.reader.comments import read_comments, get_comments_file
 # Use exc_info for Python 2 compatibility with "except Exception[,/ as] e"
 
@@ -75,7 +84,8 @@ def repair_central_directory(zipFile, is_file_instance):
     return f
 
 
-def load_workbook(filename, read_only=False, use_iterators=False, keep_vba=KEEP_VBA, guess_types=False, data_only=False):
+def load_workbook(filename, read_only=False, use_iterators=False, keep_vba=KEEP_VBA, guess_types=False, data_only=False, workers=None, lazy=False,
+                  strings_on_disk=False):
     """Open the given filename and return the workbook
 
     :param filename: the path to open or a file-like object
@@ -84,7 +94,7 @@ def load_workbook(filename, read_only=False, use_iterators=False, keep_vba=KEEP_
     :param read_only: optimised for reading, content cannot be edited
     :type read_only: bool
 
-    :param use_iterators: use lazy load for cells
+    :param use_iterators: same as `read_only`, kept for compatibility
     :type use_iterators: bool
 
     :param keep_vba: preseve vba content (this does NOT mean you can use it)
@@ -96,13 +106,26 @@ def load_workbook(filename, read_only=False, use_iterators=False, keep_vba=KEEP_
     :param data_only: controls whether cells with formulae have either the formula (default) or the value stored the last time Excel read the sheet
     :type data_only: bool
 
+    :param workers: number of processes used to parse worksheets, worksheets are parsed one after another by default
+    :type workers: int
+
+    :param lazy: only parse worksheets when they are first used, worksheets which are not used are saved unchanged
+    :type lazy: bool
+
+    :param strings_on_disk: keep the shared strings of read-only workbooks in a temporary file rather than in memory
+    :type strings_on_disk: bool
+
     :rtype: :class:`openpyxl.workbook.Workbook`
 
     .. note::
 
-        When using lazy load, all worksheets will be :class:`openpyxl.worksheet.iter_worksheet.IterableWorksheet`
+        In read-only mode (`read_only=True`), all worksheets will be :class:`openpyxl.worksheet.iter_worksheet.IterableWorksheet`
         and the returned workbook will be read-only.
 
+        With `lazy=True` the workbook can be edited: its worksheets are
+        :class:`openpyxl.reader.worksheet.LazyWorksheet` objects parsed when
+        first used, and those which are never used are saved unchanged.
+
     """
     read_only = read_only or use_iterators
 
@@ -146,7 +169,8 @@ def load_workbook(filename, read_only=False, use_iterators=False, keep_vba=KEEP_
         warnings.warn('Data types are not guessed when using iterator reader')
 
     try:
-        _load_workbook(wb, archive, filename, read_only, keep_vba)
+        _load_workbook(wb, archive, filename, read_only, keep_vba, workers, lazy,
+                       strings_on_disk)
     except KeyError:
         e = exc_info()[1]
         raise InvalidFileException(unicode(e))
@@ -155,7 +179,8 @@ def load_workbook(filename, read_only=False, use_iterators=False, keep_vba=KEEP_
     return wb
 
 
-def _load_workbook(wb, archive, filename, read_only, keep_vba):
+def _load_workbook(wb, archive, filename, read_only, keep_vba, workers=None,
+                   lazy=False, strings_on_disk=False):
 
     valid_files = archive.namelist()
 
@@ -173,8 +198,10 @@ def _load_workbook(wb, archive, filename, read_only, keep_vba):
             filename.seek(pos)
         wb.vba_archive = ZipFile(BytesIO(s), 'r')
 
-    if read_only:
+    lazy = lazy and not read_only
+    if read_only or lazy:
         wb._archive = ZipFile(filename)
+        wb._resources.append(wb._archive)
 
     # get workbook-level information
     try:
@@ -190,10 +217,21 @@ def _load_workbook(wb, archive, filename, read_only, keep_vba):
     if strings_path is not None:
         if strings_path.startswith("/"):
             strings_path = strings_path[1:]
-        shared_strings = read_string_table(archive.read(strings_path))
+        if not read_only:
+            shared_strings = read_string_table(archive.open(strings_path))
+        elif strings_on_disk:
+            shared_strings = DiskStringTable(iter_strings(archive.open(strings_path)))
+            wb._resources.append(shared_strings)
+        else:
+            # no reverse lookup is needed to read values
+            shared_strings = list(iter_strings(archive.open(strings_path)))
     else:
         shared_strings = []
 
+    if lazy:
+        # worksheets copied from the source refer to its shared strings
+        wb.shared_strings = IndexedList(shared_strings)
+
     wb.is_template = XLTX in cts or XLTM in cts
 
     try:
@@ -219,17 +257,28 @@ def _load_workbook(wb, archive, filename, read_only, keep_vba):
 
     # get worksheets
     wb.worksheets = []  # remove preset worksheet
-    for sheet in detect_worksheets(archive):
+    sheets = [sheet for sheet in detect_worksheets(archive)
+              if sheet['path'] in valid_files]
+
+    parsed = None
+    if workers and not (read_only or lazy):
+        sources = [(sheet['title'], archive.read(sheet['path'])) for sheet in sheets]
+        parsed = read_worksheets(sources, wb, shared_strings, workers)
+
+    for idx, sheet in enumerate(sheets):
         sheet_name = sheet['title']
         worksheet_path = sheet['path']
-        if not worksheet_path in valid_files:
-            continue
 
         if read_only:
             new_ws = read_worksheet(None, wb, sheet_name, shared_strings,
                                     wb.shared_styles,
                                     color_index=wb._colors,
                                     worksheet_path=worksheet_path)
+        elif lazy:
+            new_ws = LazyWorksheet(wb, sheet_name, worksheet_path,
+                                   shared_strings)
+        elif parsed is not None:
+            new_ws = parsed[idx]
         else:
             new_ws = read_worksheet(archive.read(worksheet_path), wb,
                                     sheet_name, shared_strings, wb.shared_styles,
@@ -237,7 +286,7 @@ def _load_workbook(wb, archive, filename, read_only, keep_vba):
         new_ws.sheet_state = sheet.get('state') or 'visible'
         wb._add_sheet(new_ws)
 
-        if not read_only:
+        if not (read_only or lazy):
         # load comments into the worksheet cells
             comments_file = get_comments_file(worksheet_path, archive, valid_files)
             if comments_file is not None:
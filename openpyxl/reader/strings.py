@@ -3,20 +3,94 @@ from __future__ import absolute_import
 
 """Read the shared strings table."""
 
-from openpyxl.compat import unicode
+from array import array
+from mmap import mmap, ACCESS_READ
+from tempfile import TemporaryFile
+
+from openpyxl.compat import unicode, range
 
 # package imports
 from openpyxl.utils.indexed_list import IndexedList
-from openpyxl.xml.functions import fromstring, safe_iterator
+from openpyxl.xml.functions import iterparse, get_xml_iter
 from openpyxl.xml.constants import SHEET_MAIN_NS, XML_NS
 
+try:
+    array('q')
+    OFFSET_TYPE = 'q'
+except ValueError:
+    # Python 2 has no long long arrays
+    OFFSET_TYPE = 'l'
+
+SST_TAG = '{%s}sst' % SHEET_MAIN_NS
+SI_TAG = '{%s}si' % SHEET_MAIN_NS
+
+
+def iter_strings(xml_source):
+    """
+    Yield the shared strings one after another.
+    Elements are discarded as soon as they have been read.
+    """
+    stream = get_xml_iter(xml_source)
+    root = None
+    for event, element in iterparse(stream, events=('start', 'end')):
+        if event == 'start':
+            if element.tag == SST_TAG:
+                root = element
+        elif element.tag == SI_TAG:
+            yield get_string(element)
+            if root is not None:
+                root.clear()
+
 
 def read_string_table(xml_source):
     """Read in all shared strings in the table"""
-    root = fromstring(text=xml_source)
-    nodes = safe_iterator(root, '{%s}si' % SHEET_MAIN_NS)
-    strings = (get_string(node) for node in nodes)
-    return IndexedList(strings)
+    return IndexedList(iter_strings(xml_source))
+
+
+class DiskStringTable(object):
+    """
+    Read-only shared string table kept in a temporary file.
+    Only the offsets of the strings are held in memory. Lookups do not change
+    any state so the table can be shared between threads.
+    """
+
+    def __init__(self, strings=()):
+        self._file = TemporaryFile()
+        self._offsets = array(OFFSET_TYPE, [0])
+        pos = 0
+        for value in strings:
+            value = value.encode("utf-8")
+            self._file.write(value)
+            pos += len(value)
+            self._offsets.append(pos)
+        self._file.flush()
+        self._map = None
+        if pos:
+            self._map = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, idx):
+        size = len(self)
+        if idx < 0:
+            idx += size
+        if not 0 <= idx < size:
+            raise IndexError("string index out of range")
+        start, end = self._offsets[idx], self._offsets[idx + 1]
+        if start == end:
+            return unicode('')
+        return self._map[start:end].decode("utf-8")
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
 
 
 def get_string(string_index_node):
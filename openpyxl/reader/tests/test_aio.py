@@ -0,0 +1,67 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 5),
+                                reason="Requires Python 3.5")
+
+asyncio = pytest.importorskip("asyncio")
+
+
+@pytest.fixture
+def loop(request):
+    loop = asyncio.new_event_loop()
+    request.addfinalizer(loop.close)
+    return loop
+
+
+def _rows(loop, iterator):
+    rows = []
+    while True:
+        try:
+            rows.append(loop.run_until_complete(iterator.__anext__()))
+        except StopAsyncIteration:
+            return rows
+
+
+def test_load_workbook(datadir, loop):
+    from ..aio import load_workbook
+    datadir.chdir()
+    wb = loop.run_until_complete(
+        load_workbook("complex-styles.xlsx", loop=loop, read_only=True))
+    assert wb.sheetnames == ['Sheet1']
+
+
+def test_iter_rows(datadir, loop):
+    from ..aio import load_workbook, iter_rows
+    datadir.chdir()
+    wb = loop.run_until_complete(
+        load_workbook("complex-styles.xlsx", loop=loop, read_only=True))
+    ws = wb.active
+    expected = list(ws.iter_rows(values_only=True))
+    rows = iter_rows(ws, loop=loop, chunk_size=2, values_only=True)
+    assert _rows(loop, rows) == expected
+
+
+def test_close(loop):
+    from ..aio import AsyncRowIterator
+    rows = AsyncRowIterator(iter(range(10)), loop=loop, chunk_size=3)
+    assert loop.run_until_complete(rows.__anext__()) == 0
+    rows.close()
+    assert _rows(loop, rows) == []
+
+
+def test_error(loop):
+    from ..aio import AsyncRowIterator
+
+    def failing():
+        yield 1
+        raise ValueError
+
+    rows = AsyncRowIterator(failing(), loop=loop)
+    assert loop.run_until_complete(rows.__anext__()) == 1
+    with pytest.raises(ValueError):
+        loop.run_until_complete(rows.__anext__())
@@ -67,3 +67,63 @@ def test_read_stringio():
     # Test invalid file-like objects are detected and not handled as regular files
     with pytest.raises(BadZipfile):
         load_workbook(filelike)
+
+
+def test_load_workbook_with_workers(datadir):
+    datadir.chdir()
+    wb = load_workbook("complex-styles.xlsx")
+    parallel = load_workbook("complex-styles.xlsx", workers=2)
+
+    assert parallel.sheetnames == wb.sheetnames
+    for ws1, ws2 in zip(wb, parallel):
+        assert ws2.parent is parallel
+        assert sorted(ws1._cells) == sorted(ws2._cells)
+        for coord, cell in ws1._cells.items():
+            other = ws2._cells[coord]
+            assert other.parent is ws2
+            assert other.value == cell.value
+            assert other.font == cell.font
+            assert other.number_format == cell.number_format
+
+
+def test_load_workbook_with_workers_keep_vba(datadir):
+    from zipfile import ZipFile
+    datadir.join("..", "..", "..", "tests", "data", "reader").chdir()
+    wb = load_workbook("vba+comments.xlsm", keep_vba=True)
+    parallel = load_workbook("vba+comments.xlsm", keep_vba=True, workers=2)
+    assert isinstance(parallel.vba_archive, ZipFile)
+    assert ([ws.vba_controls for ws in parallel] ==
+            [ws.vba_controls for ws in wb])
+
+
+def test_load_workbook_lazy():
+    from zipfile import ZipFile
+    from openpyxl import Workbook
+    from openpyxl.writer.excel import save_virtual_workbook
+
+    wb = Workbook()
+    ws1 = wb.active
+    ws1.title = "Used"
+    ws1.append(["first", 1])
+    ws2 = wb.create_sheet(title="Untouched")
+    ws2.append(["second", 2.5])
+    ws2.auto_filter.ref = "A1:B1"
+    src = BytesIO(save_virtual_workbook(wb))
+
+    lazy = load_workbook(src, lazy=True)
+    assert lazy.sheetnames == ["Used", "Untouched"]
+    used, untouched = lazy.worksheets
+    assert not used.loaded
+    assert used['A1'].value == "first"
+    assert used.loaded
+    used['A2'] = "new"
+
+    out = BytesIO(save_virtual_workbook(lazy))
+    assert not untouched.loaded
+    source = ZipFile(src).read("xl/worksheets/sheet2.xml")
+    assert ZipFile(out).read("xl/worksheets/sheet2.xml") == source
+
+    wb = load_workbook(out)
+    assert wb["Used"]['A2'].value == "new"
+    assert [c.value for c in wb["Untouched"].rows[0]] == ["second", 2.5]
+    assert wb["Untouched"].auto_filter.ref == "A1:B1"
@@ -30,3 +30,29 @@ def test_formatted_string_table(datadir):
             'Welcome', 'to the best shop in town', "     let's play "]
 
 
+
+
+def test_iter_strings(datadir):
+    from openpyxl.reader.strings import iter_strings
+    datadir.chdir()
+    with open('shared-strings-rich.xml', 'rb') as src:
+        assert list(iter_strings(src)) == [
+            'Welcome', 'to the best shop in town', "     let's play "]
+
+
+def test_disk_string_table():
+    from openpyxl.reader.strings import DiskStringTable
+    strings = [u'Welcome', u'', u'caf\xe9', u'\u5168\u89d2']
+    table = DiskStringTable(strings)
+    assert len(table) == 4
+    assert table[2] == u'caf\xe9'
+    assert table[-1] == u'\u5168\u89d2'
+    assert list(table) == strings
+    table.close()
+
+
+def test_empty_disk_string_table():
+    from openpyxl.reader.strings import DiskStringTable
+    table = DiskStringTable()
+    assert len(table) == 0
+    assert list(table) == []
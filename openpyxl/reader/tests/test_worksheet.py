@@ -13,6 +13,7 @@ from openpyxl import load_workbook
 from openpyxl.compat import unicode
 from openpyxl.xml.constants import SHEET_MAIN_NS
 from openpyxl.cell import Cell
+from openpyxl.utils import coordinate_from_string, column_index_from_string
 from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.styles import Style
 
@@ -112,15 +113,23 @@ def Worksheet(Workbook):
             self.header_footer = HeaderFooter()
             self.vba_controls = None
 
+        def _track_row(self, row):
+            pass
+
+        def _track_column(self, col_idx):
+            pass
+
         def _add_cell(self, cell):
-            self._cells[cell.coordinate] = cell
+            self._cells[(cell.row, cell.col_idx)] = cell
 
         def __getitem__(self, value):
-            cell = self._cells.get(value)
+            column, row = coordinate_from_string(value)
+            key = (row, column_index_from_string(column))
+            cell = self._cells.get(key)
 
             if cell is None:
                 cell = Cell(self, 'A', 1)
-                self._cells[value] = cell
+                self._cells[key] = cell
             return cell
 
         def get_style(self, coordinate):
@@ -219,6 +228,33 @@ def test_styled_row(datadir, Worksheet, WorkSheetParser):
     assert dict(rd) == {'s':'28', 'customFormat':'1'}
 
 
+def test_row_cells(Worksheet, WorkSheetParser):
+    ws = Worksheet
+    parser = WorkSheetParser
+    parser.shared_strings = ["a string"]
+
+    src = """
+    <row r="4" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <c r="A4"><v>7</v></c>
+      <c r="B4"><v>2.5E-3</v></c>
+      <c r="C4" t="s"><v>0</v></c>
+      <c r="AA4" s="2"/>
+      <c r="AB4"><f>A4+1</f><v>8</v></c>
+    </row>
+    """
+    parser.parse_row_dimensions(fromstring(src))
+
+    assert ws['A4'].value == 7
+    assert ws['B4'].value == 0.0025
+    assert ws['C4'].value == "a string"
+    assert ws['C4'].data_type == 's'
+    assert ws['AA4'].value is None
+    assert ws['AA4'].column == "AA"
+    assert ws['AA4'].row == 4
+    assert ws['AB4'].value == "=A4+1"
+    assert ws['AB4'].data_type == 'f'
+
+
 def test_sheet_protection(datadir, Worksheet, WorkSheetParser):
     datadir.chdir()
     ws = Worksheet
@@ -451,7 +487,7 @@ def test_cell_exotic_style(WorkSheetParser, datadir):
     datadir.chdir()
     parser = WorkSheetParser
     ws = parser.ws
-    parser.styles = [None, None, {'pivotButton':True, 'quotePrefix':True}]
+    parser.styles = [None, None, (0, 0, 0, 0, 0, 0, True, True)]
 
     src = """
     <x:c xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main" r="D4" s="2">
@@ -495,6 +531,20 @@ def test_legacy_document_keep(WorkSheetParserKeepVBA, datadir):
     assert parser.ws.vba_controls == 'vbaControlId'
 
 
+def test_legacy_document_keep_argument(Worksheet, datadir):
+    from .. worksheet import WorkSheetParser
+    parser = WorkSheetParser(Worksheet, None, {0:'a'}, {}, keep_vba=True)
+    assert Worksheet.parent.vba_archive is None
+    datadir.chdir()
+
+    with open("legacy_drawing_worksheet.xml") as src:
+        sheet = fromstring(src.read())
+
+    element = sheet.find("{%s}legacyDrawing" % SHEET_MAIN_NS)
+    parser.parse_legacy_drawing(element)
+    assert parser.ws.vba_controls == 'vbaControlId'
+
+
 def test_legacy_document_no_keep(WorkSheetParser, datadir):
     parser = WorkSheetParser
     datadir.chdir()
@@ -2,19 +2,28 @@ from __future__ import absolute_import
 # Copyright (c) 2010-2015 openpyxl
 
 """Reader for a single worksheet."""
-from io import BytesIO
+from string import digits as DIGITS
+from multiprocessing import Pool
+import os.path
+import re
 
 # compatibility imports
 from openpyxl.xml.functions import iterparse
 
 # package imports
+from openpyxl.compat import iteritems
+from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.cell import Cell
 from openpyxl.worksheet import Worksheet, ColumnDimension, RowDimension
 from openpyxl.worksheet.iter_worksheet import IterableWorksheet
 from openpyxl.worksheet.page import PageMargins, PrintOptions, PageSetup
 from openpyxl.worksheet.protection import SheetProtection
 from openpyxl.worksheet.views import SheetView
-from openpyxl.xml.constants import SHEET_MAIN_NS, REL_NS
+from openpyxl.xml.constants import (
+    SHEET_MAIN_NS,
+    REL_NS,
+    PACKAGE_WORKSHEET_RELS
+    )
 from openpyxl.xml.functions import safe_iterator
 from openpyxl.styles import Color
 from openpyxl.formatting import ConditionalFormatting
@@ -24,25 +33,8 @@ from openpyxl.utils import (
     get_column_letter,
     column_index_from_string
     )
-
-
-def _get_xml_iter(xml_source):
-    """
-    Possible inputs: strings, bytes, members of zipfile, temporary file
-    Always return a file like object
-    """
-    if not hasattr(xml_source, 'read'):
-        try:
-            xml_source = xml_source.encode("utf-8")
-        except (AttributeError, UnicodeDecodeError):
-            pass
-        return BytesIO(xml_source)
-    else:
-        try:
-            xml_source.seek(0)
-        except:
-            pass
-        return xml_source
+from openpyxl.reader.comments import read_comments, get_comments_file
+from openpyxl.xml.functions import get_xml_iter as _get_xml_iter
 
 
 class WorkSheetParser(object):
@@ -56,7 +48,8 @@ class WorkSheetParser(object):
     INLINE_STRING = "{%s}is/{%s}t" % (SHEET_MAIN_NS, SHEET_MAIN_NS)
     INLINE_RICHTEXT = "{%s}is/{%s}r/{%s}t" % (SHEET_MAIN_NS, SHEET_MAIN_NS, SHEET_MAIN_NS)
 
-    def __init__(self, ws, xml_source, shared_strings, style_table, color_index=None):
+    def __init__(self, ws, xml_source, shared_strings, style_table, color_index=None,
+                 keep_vba=None):
         self.ws = ws
         self.source = xml_source
         self.shared_strings = shared_strings
@@ -64,8 +57,16 @@ class WorkSheetParser(object):
         self.color_index = color_index
         self.guess_types = ws.parent._guess_types
         self.data_only = ws.parent.data_only
-        self.styles = [dict(style) for style in self.ws.parent._cell_styles]
-        self.keep_vba = ws.parent.vba_archive is not None
+        # positional arguments of Cell for each style
+        self.styles = [(style.fontId, style.fillId, style.borderId,
+                        style.alignmentId, style.protectionId, style.numFmtId,
+                        style.pivotButton, style.quotePrefix)
+                       for style in self.ws.parent._cell_styles]
+        # column letters seen so far, with their indices
+        self._columns = {}
+        if keep_vba is None:
+            keep_vba = ws.parent.vba_archive is not None
+        self.keep_vba = keep_vba
 
     def parse(self):
         dispatcher = {
@@ -99,14 +100,18 @@ class WorkSheetParser(object):
             self.ws.conditional_formatting.update(self.ws.conditional_formatting.parse_rules)
 
     def parse_cell(self, element):
-        value = element.find(self.VALUE_TAG)
-        if value is not None:
-            value = value.text
-        formula = element.find(self.FORMULA_TAG)
         data_type = element.get('t', 'n')
         coordinate = element.get('r')
         style_id = element.get('s')
 
+        # walk the children once rather than searching for each of them
+        value = formula = None
+        for child in element:
+            if child.tag == self.VALUE_TAG:
+                value = child.text
+            elif child.tag == self.FORMULA_TAG:
+                formula = child
+
         # assign formula to cell value unless only the data is desired
         if formula is not None and not self.data_only:
             data_type = 'f'
@@ -124,23 +129,25 @@ class WorkSheetParser(object):
                 if ref:
                     self.ws.formula_attributes[coordinate]['ref'] = ref
 
-
-        style = {}
+        # the row is always at the end of the coordinate
+        column = coordinate.rstrip(DIGITS)
+        row = int(coordinate[len(column):])
         if style_id is not None:
-            style_id = int(style_id)
-            style = self.styles[style_id]
-
-        column, row = coordinate_from_string(coordinate)
-        cell = Cell(self.ws, column, row, **style)
+            cell = Cell(self.ws, column, row, None, *self.styles[int(style_id)])
+        else:
+            cell = Cell(self.ws, column, row)
         self.ws._add_cell(cell)
 
         if value is not None:
             if data_type == 'n':
-                value = cell._cast_numeric(value)
-            elif data_type == 'b':
-                value = bool(int(value))
+                try:
+                    value = int(value)
+                except ValueError:
+                    value = cell._cast_numeric(value)
             elif data_type == 's':
                 value = self.shared_strings[int(value)]
+            elif data_type == 'b':
+                value = bool(int(value))
             elif data_type == 'str':
                 data_type = 's'
 
@@ -178,15 +185,77 @@ class WorkSheetParser(object):
                 if column not in self.ws.column_dimensions:
                     dim = ColumnDimension(**attrs)
                     self.ws.column_dimensions[column] = dim
+                    self.ws._track_column(colId)
 
     def parse_row_dimensions(self, row):
         attrs = dict(row.attrib)
-        attrs['worksheet'] = self.ws
-        dim = RowDimension(**attrs)
-        self.ws.row_dimensions[dim.index] = dim
+        index = int(attrs.get('r', 0))
+        if index:
+            self.ws._track_row(index)
+        # rows without formatting do not need a dimension
+        if any(key not in ('r', 'spans') and not key.startswith('{')
+               for key in attrs):
+            attrs['worksheet'] = self.ws
+            self.ws.row_dimensions[index] = RowDimension(**attrs)
+
+        if self.guess_types:
+            for cell in row:
+                if cell.tag == self.CELL_TAG:
+                    self.parse_cell(cell)
+            return
+
+        # fast path for numbers and shared strings without formulae
+        ws = self.ws
+        cells = ws._cells
+        columns = self._columns
+        styles = self.styles
+        shared_strings = self.shared_strings
+        min_col = max_col = None
+        for element in row:
+            if element.tag != self.CELL_TAG:
+                continue
+            data_type = element.get('t', 'n')
+            if (data_type not in ('n', 's') or len(element) > 1
+                or len(element) and element[0].tag != self.VALUE_TAG):
+                self.parse_cell(element)
+                continue
 
-        for cell in safe_iterator(row, self.CELL_TAG):
-            self.parse_cell(cell)
+            coordinate = element.get('r')
+            column = coordinate.rstrip(DIGITS)
+            col_idx = columns.get(column)
+            if col_idx is None:
+                col_idx = columns[column] = column_index_from_string(column)
+            row_idx = int(coordinate[len(column):])
+            style_id = element.get('s')
+            if style_id is not None:
+                cell = Cell(ws, None, row_idx, None, *styles[int(style_id)],
+                            col_idx=col_idx)
+            else:
+                cell = Cell(ws, None, row_idx, col_idx=col_idx)
+            cells[(row_idx, col_idx)] = cell
+            ws._track_row(row_idx)
+            if min_col is None or col_idx < min_col:
+                min_col = col_idx
+            if max_col is None or col_idx > max_col:
+                max_col = col_idx
+
+            if len(element):
+                value = element[0].text
+                if data_type == 's':
+                    cell._value = shared_strings[int(value)]
+                    cell.data_type = data_type
+                else:
+                    try:
+                        cell._value = int(value)
+                    except ValueError:
+                        try:
+                            cell._value = float(value)
+                        except ValueError:
+                            cell._value = cell._cast_numeric(value)
+
+        if min_col is not None:
+            ws._track_column(min_col)
+            ws._track_column(max_col)
 
     def parse_print_options(self, element):
         self.ws.print_options = PrintOptions(**element.attrib)
@@ -310,8 +379,9 @@ class WorkSheetParser(object):
         self.ws.sheet_view = SheetView.from_tree(el)
 
 
-def fast_parse(ws, xml_source, shared_strings, style_table, color_index=None, keep_vba=False):
-    parser = WorkSheetParser(ws, xml_source, shared_strings, style_table, color_index)
+def fast_parse(ws, xml_source, shared_strings, style_table, color_index=None, keep_vba=None):
+    parser = WorkSheetParser(ws, xml_source, shared_strings, style_table,
+                             color_index, keep_vba)
     parser.parse()
     del parser
 
@@ -326,3 +396,152 @@ def read_worksheet(xml_source, parent, preset_title, shared_strings,
         ws = Worksheet(parent, preset_title)
         fast_parse(ws, xml_source, shared_strings, style_table, color_index)
     return ws
+
+
+AUTO_FILTER_RE = re.compile(br'<(?:\w+:)?autoFilter\b[^>]*?\sref="([^"]+)"')
+
+
+class LazyWorksheet(Worksheet):
+    """
+    Worksheet which is only parsed from the source archive when its content is
+    first used. Worksheets which have not been used can be saved verbatim.
+    """
+
+    # attributes available without parsing the worksheet
+    _eager = ('_parent', '_title', 'sheet_state', '_charts', '_images',
+              '_comment_count', 'relationships', 'vba_controls')
+
+    def __init__(self, parent_workbook, title, worksheet_path, shared_strings):
+        Worksheet.__init__(self, parent_workbook, title)
+        defaults = dict((key, value) for key, value in self.__dict__.items()
+                        if key not in self._eager)
+        for key in defaults:
+            del self.__dict__[key]
+        self.__dict__['_defaults'] = defaults
+        self.__dict__['_source'] = (worksheet_path, shared_strings)
+
+    def __getattr__(self, name):
+        if name in self.__dict__.get('_defaults', ()):
+            self.load()
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name in self.__dict__.get('_defaults', ()):
+            self.load()
+        Worksheet.__setattr__(self, name, value)
+
+    @property
+    def loaded(self):
+        return '_source' not in self.__dict__
+
+    def load(self):
+        """Parse the worksheet and its comments from the source archive"""
+        if self.loaded:
+            return
+        worksheet_path, shared_strings = self.__dict__.pop('_source')
+        self.__dict__.update(self.__dict__.pop('_defaults'))
+
+        archive = self.parent._archive
+        fast_parse(self, archive.read(worksheet_path), shared_strings, None)
+        comments_file = get_comments_file(worksheet_path, archive,
+                                          archive.namelist())
+        if comments_file is not None:
+            read_comments(self, archive.read(comments_file))
+
+    def source_xml(self):
+        """
+        Return the xml of the worksheet in the source archive if it can be
+        saved as it is, None otherwise
+        """
+        if self.loaded:
+            return
+        wb = self.parent
+        if wb.data_only or wb._guess_types:
+            return
+        if (self._charts or self._images or self.relationships
+            or self._comment_count or self.vba_controls is not None):
+            return
+        worksheet_path = self._source[0]
+        rels_file = "%s/%s.rels" % (PACKAGE_WORKSHEET_RELS,
+                                    os.path.split(worksheet_path)[-1])
+        if rels_file in wb._archive.namelist():
+            return
+        return wb._archive.read(worksheet_path)
+
+    def source_auto_filter(self):
+        """Range of the auto filter in the source archive"""
+        xml = self.source_xml()
+        if xml is not None:
+            match = AUTO_FILTER_RE.search(xml)
+            if match is not None:
+                return match.group(1).decode("utf-8")
+
+
+_worker = {}
+
+
+def _init_worker(shared_strings, cell_styles, guess_types, data_only, keep_vba):
+    """
+    Set up the workbook-level tables once per worker process
+    """
+    from openpyxl.workbook import Workbook
+    wb = Workbook(guess_types=guess_types, data_only=data_only)
+    wb.worksheets = []
+    wb._cell_styles = cell_styles
+    _worker['workbook'] = wb
+    _worker['shared_strings'] = shared_strings
+    _worker['keep_vba'] = keep_vba
+
+
+def _parse_worksheet(args):
+    """
+    Parse a worksheet and return it without its cells, with the distinct
+    styles of its cells and the cells as (row, column, value, data type,
+    style position) tuples: these are much cheaper to send back than cell
+    objects.
+    """
+    title, xml_source = args
+    ws = Worksheet(_worker['workbook'], title)
+    fast_parse(ws, xml_source, _worker['shared_strings'], None,
+               keep_vba=_worker['keep_vba'])
+    styles = IndexedList()
+    add_style = styles.add
+    cells = [(row, col_idx, cell._value, cell.data_type, add_style(cell._style))
+             for (row, col_idx), cell in iteritems(ws._cells)]
+    ws._cells = {}
+    # the worksheet is reattached to the real workbook by the caller
+    ws._parent = None
+    return ws, list(styles), cells
+
+
+def _add_cells(ws, styles, cells):
+    store = ws._cells
+    for row, col_idx, value, data_type, style in cells:
+        cell = Cell(ws, row=row, col_idx=col_idx)
+        cell._style = styles[style]
+        cell._value = value
+        cell.data_type = data_type
+        store[(row, col_idx)] = cell
+
+
+def read_worksheets(sources, parent, shared_strings, workers):
+    """
+    Read xml worksheets in a pool of processes.
+    Worksheets are returned in the same order as the (title, xml) sources
+    """
+    initargs = (list(shared_strings), list(parent._cell_styles),
+                parent._guess_types, parent.data_only,
+                parent.vba_archive is not None)
+    pool = Pool(workers, _init_worker, initargs)
+    try:
+        parsed = pool.map(_parse_worksheet, sources, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    worksheets = []
+    for ws, styles, cells in parsed:
+        ws._parent = parent
+        _add_cells(ws, styles, cells)
+        worksheets.append(ws)
+    return worksheets
@@ -49,9 +49,66 @@ class NumberFormatDescriptor(object):
         return coll[idx - 164]
 
 
+# fields of the packed style of an object, in order
+STYLE_FIELDS = ('_font_id', '_fill_id', '_border_id', '_alignment_id',
+                '_protection_id', '_number_format_id', 'pivotButton',
+                'quotePrefix')
+DEFAULT_STYLE = (0, 0, 0, 0, 0, 0, None, None)
+
+
+class StyleIndex(dict):
+    """
+    Index of packed styles in the cell styles of a workbook
+    """
+
+    def __init__(self, cell_styles):
+        self.cell_styles = cell_styles
+
+    def __missing__(self, style):
+        font, fill, border, alignment, protection, number_format, pivot, quote = style
+        idx = self.cell_styles.add(StyleId(
+            alignmentId=alignment,
+            borderId=border,
+            fillId=fill,
+            fontId=font,
+            numFmtId=number_format,
+            protectionId=protection,
+            pivotButton=pivot,
+            quotePrefix=quote
+        ))
+        self[style] = idx
+        return idx
+
+
+def style_index(workbook):
+    """Index of the packed styles of a workbook"""
+    index = getattr(workbook, '_style_ids', None)
+    if index is None or index.cell_styles is not workbook._cell_styles:
+        index = workbook._style_ids = StyleIndex(workbook._cell_styles)
+    return index
+
+
+def _style_field(idx):
+
+    def get(self):
+        return self._style[idx]
+
+    def set(self, value):
+        style = list(self._style)
+        style[idx] = value
+        self._style = tuple(style)
+        self._style_index = None
+
+    return property(get, set)
+
+
 class StyleableObject(object):
     """
     Base class for styleble objects implementing proxy and lookup functions
+
+    The ids of the formatting objects are packed in a tuple, the index of
+    this style in the workbook is kept, together with the style index it
+    comes from, until one of them changes.
     """
 
     font = StyleDescriptor('_fonts', '_font_id')
@@ -61,49 +118,30 @@ class StyleableObject(object):
     protection = StyleDescriptor('_protections', '_protection_id')
     alignment = StyleDescriptor('_alignments', '_alignment_id')
 
-    __slots__ = ('parent', '_font_id', '_border_id', '_fill_id',
-                 '_alignment_id', '_protection_id', '_number_format_id', 'pivotButton',
-                 'quotePrefix')
+    __slots__ = ('parent', '_style', '_style_index')
 
     def __init__(self, sheet, fontId=0, fillId=0, borderId=0, alignmentId=0,
                  protectionId=0, numFmtId=0, pivotButton=None, quotePrefix=None):
-        self._font_id = fontId
-        self._fill_id = fillId
-        self._border_id = borderId
-        self._alignment_id = alignmentId
-        self._protection_id = protectionId
-        self._number_format_id = numFmtId
+        self._style = (fontId, fillId, borderId, alignmentId, protectionId,
+                       numFmtId, pivotButton, quotePrefix)
+        self._style_index = None
         self.parent = sheet
-        self.pivotButton = pivotButton
-        self.quotePrefix = quotePrefix
 
 
     @property
     def style_id(self):
-        style = StyleId(
-            alignmentId=self._alignment_id,
-            borderId=self._border_id,
-            fillId=self._fill_id,
-            fontId=self._font_id,
-            numFmtId=self._number_format_id,
-            protectionId=self._protection_id,
-            pivotButton=self.pivotButton,
-            quotePrefix=self.quotePrefix
-        )
-
-        return self.parent.parent._cell_styles.add(style)
+        index = style_index(self.parent.parent)
+        cached = self._style_index
+        # styles of another workbook, or replaced ones, have another index
+        if cached is not None and cached[0] is index:
+            return cached[1]
+        idx = index[self._style]
+        self._style_index = (index, idx)
+        return idx
 
     @property
     def has_style(self):
-        return bool(self._alignment_id
-               or self._border_id
-               or self._fill_id
-               or self._font_id
-               or self._number_format_id
-               or self._protection_id
-               or self.pivotButton
-               or self.quotePrefix
-               )
+        return self._style != DEFAULT_STYLE and any(self._style)
 
     #legacy
     @property
@@ -127,3 +165,8 @@ class StyleableObject(object):
         self.protection = value.protection.copy()
         self.alignment = value.alignment.copy()
         self.number_format = value.number_format
+
+
+for _idx, _name in enumerate(STYLE_FIELDS):
+    setattr(StyleableObject, _name, _style_field(_idx))
+del _idx, _name
@@ -69,3 +69,38 @@ def test_assign_style(StyleableObject):
     style = Style(font=Font(underline="single"))
     so.style = style
     assert style.font == Font(underline="single")
+
+
+def test_style_id(StyleableObject):
+    from ..styleable import StyleId
+
+    class Workbook(DummyWorkbook):
+        _fonts = IndexedList([Font()])
+        _cell_styles = IndexedList([StyleId()])
+
+    class Worksheet:
+        parent = Workbook()
+
+    so = StyleableObject(sheet=Worksheet())
+    assert so._style == (0, 0, 0, 0, 0, 0, None, None)
+    assert so.style_id == 0
+
+    so.font = Font(bold=True)
+    assert so._style_index is None
+    assert so.style_id == 1
+    assert so._style_index[1] == 1
+    assert Worksheet.parent._cell_styles[1] == StyleId(fontId=1)
+
+    other = StyleableObject(Worksheet(), fontId=1)
+    assert other.style_id == 1
+    assert len(Worksheet.parent._cell_styles) == 2
+
+    # cached indices are dropped with the styles of the workbook
+    Worksheet.parent._cell_styles = IndexedList([StyleId(fontId=1)])
+    assert so.style_id == 0
+
+    class Moved:
+        parent = Workbook()
+    so.parent = Moved()
+    Moved.parent._cell_styles = IndexedList([StyleId(), StyleId(fillId=1)])
+    assert so.style_id == 2
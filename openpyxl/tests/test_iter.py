@@ -2,6 +2,7 @@ from __future__ import absolute_import
 # Copyright (c) 2010-2015 openpyxl
 
 import datetime
+import operator
 from io import BytesIO
 
 import pytest
@@ -75,6 +76,46 @@ def sample_workbook(request, datadir):
     return wb
 
 
+@pytest.mark.parametrize("sheetname",
+                         ['Sheet1 - Text', 'Sheet2 - Numbers', 'Sheet3 - Formulas',
+                          'Sheet4 - Dates'])
+def test_values_only(sample_workbook, sheetname):
+    ws = sample_workbook[sheetname]
+    expected = [tuple(c.value for c in row) for row in ws.iter_rows()]
+    assert list(ws.iter_rows(values_only=True)) == expected
+
+
+@pytest.mark.parametrize("read_only",
+                         [
+                             False,
+                             True
+                         ]
+                         )
+def test_iter_rows_selection(read_only, datadir):
+    datadir.join("genuine").chdir()
+    wb = load_workbook(filename="empty.xlsx", read_only=read_only)
+    ws = wb['Sheet2 - Numbers']
+    rows = list(ws.iter_rows(columns=['AA', 'K', 4], values_only=True))
+    assert len(rows) == 30
+    assert rows[0] == (100, 0.01, 1)
+
+    rows = ws.iter_rows(columns=['AA', 'D'], key_column='D',
+                        predicate=lambda value: value in (3, 20))
+    assert [tuple(c.value for c in row) for row in rows] == [(102, 3), (119, 20)]
+
+
+def _count_rows(rows):
+    return [len(list(rows))]
+
+
+def test_map_rows(datadir):
+    datadir.join("genuine").chdir()
+    wb = load_workbook(filename="empty.xlsx", read_only=True)
+    ws = wb['Sheet2 - Numbers']
+    assert ws.map_rows(_count_rows, workers=2, chunks=4) == [[8], [8], [8], [6]]
+    assert ws.map_rows(_count_rows, operator.add, workers=2, chunks=3) == [10, 10, 10]
+
+
 def test_calculate_dimension(datadir):
     """
     Behaviour differs between implementations
@@ -106,6 +147,19 @@ def test_getitem(sample_workbook):
     assert list(ws.iter_rows("A1:D30")) == list(ws["A1":"D30"])
 
 
+def test_strings_on_disk(datadir):
+    datadir.join("genuine").chdir()
+    wb = load_workbook(filename="empty.xlsx", read_only=True,
+                       strings_on_disk=True)
+    ws = wb['Sheet1 - Text']
+    assert ws['A1'].value == 'This is cell A1 in Sheet 1'
+
+    strings = ws.shared_strings
+    wb.close()
+    assert strings._file.closed
+    assert wb._archive.fp is None
+
+
 def test_max_row(sample_workbook):
     wb = sample_workbook
     sheet2 = wb['Sheet2 - Numbers']
@@ -332,3 +386,126 @@ def test_read_empty_rows(datadir, DummyWorkbook):
     ws = IterableWorksheet(DummyWorkbook, "Sheet", "", "empty_rows.xml", [], [])
     rows = tuple(ws.rows)
     assert len(rows) == 7
+
+
+@pytest.mark.numpy_required
+def test_get_column_arrays(datadir):
+    datadir.join("genuine").chdir()
+    wb = load_workbook("empty.xlsx", read_only=True)
+    ws = wb['Sheet2 - Numbers']
+    ints, mixed, floats = ws.get_column_arrays(4, 1, 4, 30) + \
+        ws.get_column_arrays(7, 1, 7, 10) + ws.get_column_arrays(11, 1, 11, 30)
+    assert ints.dtype == "int64"
+    assert list(ints) == list(range(1, 31))
+    assert floats.dtype == "float64"
+    assert floats[0] == 0.01
+    assert mixed.dtype == object
+    assert list(mixed.mask) == [True] * 4 + [False] + [True] * 3 + [False, False]
+    assert list(mixed.compressed()) == ['This is cell G5', True, False]
+
+
+@pytest.mark.numpy_required
+def test_get_column_arrays_strings_and_dates(datadir):
+    datadir.join("genuine").chdir()
+    wb = load_workbook("empty.xlsx", read_only=True)
+    text = wb['Sheet1 - Text'].get_column_arrays()
+    assert len(text) == 7
+    assert list(text[0].compressed()) == ['This is cell A1 in Sheet 1']
+    assert text[1].mask.all()
+
+    dates = wb['Sheet4 - Dates'].get_column_arrays()
+    assert dates[0].dtype == "datetime64[us]"
+    assert dates[2][0] == datetime.datetime(1973, 5, 20, 9, 15, 2)
+
+
+@pytest.mark.numpy_required
+def test_get_column_arrays_missing_rows(datadir, DummyWorkbook):
+    datadir.join("reader").chdir()
+    from openpyxl.worksheet.iter_worksheet import IterableWorksheet
+    ws = IterableWorksheet(DummyWorkbook, "Sheet", "", "bug393-worksheet.xml", [], [])
+    arrays = ws.get_column_arrays(max_col=5)
+    assert [a.dtype for a in arrays] == ["int64"] * 5
+    assert list(arrays[0].mask) == [False, True, False, False]
+    assert list(arrays[4].filled(0)) == [5, 3, 0, 3]
+
+
+@pytest.mark.parametrize("compression", ["ZIP_STORED", "ZIP_DEFLATED"])
+def test_row_index(tmpdir, compression, monkeypatch):
+    import zipfile
+    from openpyxl.worksheet.row_index import RowIndex
+
+    monkeypatch.setattr(RowIndex, "interval", 256)
+    monkeypatch.setattr(RowIndex, "chunk_size", 64)
+    rows = "".join('<row r="%d"><c r="A%d"><v>%d</v></c></row>' % (r, r, r * 10)
+                   for r in range(1, 201) if r != 150)
+    xml = ('<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+           '<sheetData>%s</sheetData></worksheet>' % rows)
+    tmpdir.chdir()
+    with zipfile.ZipFile("sheet.zip", "w", getattr(zipfile, compression)) as archive:
+        archive.writestr("sheet1.xml", xml)
+    archive = zipfile.ZipFile("sheet.zip")
+
+    index = RowIndex.from_archive(archive, "sheet1.xml")
+    stream = index.open(120)
+    assert index.last_row >= 120
+    assert index.rows[0] == 1
+    assert len(index.rows) > 2
+
+    tree = fromstring(stream.read())
+    values = [int(v.text) for v in
+              tree.iter('{http://schemas.openxmlformats.org/spreadsheetml/2006/main}v')]
+    assert values[0] <= 1200
+    assert values[-1] == 2000
+    assert 1500 not in values
+
+
+def test_read_from_row_index(datadir, monkeypatch):
+    from openpyxl.worksheet.row_index import RowIndex
+
+    monkeypatch.setattr(RowIndex, "interval", 512)
+    monkeypatch.setattr(RowIndex, "chunk_size", 128)
+    datadir.join("genuine").chdir()
+    wb = load_workbook(filename="empty.xlsx", read_only=True)
+    ws = wb['Sheet2 - Numbers']
+    assert ws.row_index is not None
+    ws._row_index = False # read from the start
+    expected = [tuple(c.value for c in row) for row in ws.get_squared_range(1, 25, 27, 30)]
+    ws._row_index = None
+
+    streams = []
+    index_open = RowIndex.open
+    def spy(self, row):
+        stream = index_open(self, row)
+        streams.append(stream)
+        return stream
+    monkeypatch.setattr(RowIndex, "open", spy)
+
+    assert ws['D29'].value == expected[4][3]
+    assert [tuple(c.value for c in row) for row in ws.get_squared_range(1, 25, 27, 30)] == expected
+    assert len(ws.row_index.checkpoints) > 1
+
+    rows = ws.get_squared_range(1, 25, 27, 30)
+    next(rows)
+    rows.close()
+    assert streams
+    assert all(s._src.closed for s in streams if s is not None)
+
+
+@pytest.mark.parametrize("string_mode", ["shared", "inline", "hybrid"])
+def test_read_inline_strings(tmpdir, string_mode):
+    from openpyxl.workbook import Workbook
+    tmpdir.chdir()
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.string_mode = string_mode
+    ws.max_shared_strings = 1
+    ws.append(["a", 1, " b "])
+    ws.append(["c", None, "d"])
+    wb.save("inline.xlsx")
+
+    expected = [("a", 1, " b "), ("c", None, "d")]
+    for read_only in (True, False):
+        wb = load_workbook("inline.xlsx", read_only=read_only)
+        ws = wb.active
+        rows = [tuple(c.value for c in row) for row in ws.iter_rows()]
+        assert rows == expected
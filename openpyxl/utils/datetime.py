@@ -8,19 +8,18 @@ from __future__ import division
 import datetime
 import re
 
-from jdcal import (
-    gcal2jd,
-    jd2gcal,
-    MJD_0
-)
+from openpyxl.compat import NUMPY
 
-from openpyxl.compat import lru_cache
+if NUMPY:
+    import numpy
 
 # constants
 MAC_EPOCH = datetime.date(1904, 1, 1)
 WINDOWS_EPOCH = datetime.date(1899, 12, 30)
-CALENDAR_WINDOWS_1900 = sum(gcal2jd(WINDOWS_EPOCH.year, WINDOWS_EPOCH.month, WINDOWS_EPOCH.day))
-CALENDAR_MAC_1904 = sum(gcal2jd(MAC_EPOCH.year, MAC_EPOCH.month, MAC_EPOCH.day))
+# Julian day of the ordinal 0, epochs are given as Julian days
+JULIAN_ORDINAL = 1721424.5
+CALENDAR_WINDOWS_1900 = WINDOWS_EPOCH.toordinal() + JULIAN_ORDINAL
+CALENDAR_MAC_1904 = MAC_EPOCH.toordinal() + JULIAN_ORDINAL
 SECS_PER_DAY = 86400
 
 EPOCH = datetime.datetime.utcfromtimestamp(0)
@@ -40,36 +39,36 @@ def W3CDTF_to_datetime(formatted_string):
     return datetime.datetime(*dt)
 
 
-@lru_cache()
+def _epoch_ordinal(offset):
+    return int(round(offset - JULIAN_ORDINAL))
+
+
 def to_excel(dt, offset=CALENDAR_WINDOWS_1900):
-    jul = sum(gcal2jd(dt.year, dt.month, dt.day)) - offset
+    jul = dt.toordinal() + JULIAN_ORDINAL - offset
     if jul <= 60 and offset == CALENDAR_WINDOWS_1900:
+        # Excel counts 1900-02-29
         jul -= 1
     if hasattr(dt, 'time'):
         jul += time_to_days(dt)
     return jul
 
 
-@lru_cache()
 def from_excel(value, offset=CALENDAR_WINDOWS_1900):
     if value is None:
         return
     if 1 < value < 60 and offset == CALENDAR_WINDOWS_1900:
         value += 1
-    parts = list(jd2gcal(MJD_0, value + offset - MJD_0))
-    _, fraction = divmod(value, 1)
-    jumped = (parts[-1] == 0 and fraction > 0)
-    diff = datetime.timedelta(days=fraction)
-
+    day, fraction = divmod(value, 1)
     if 0 < abs(value) < 1:
-        return days_to_time(diff)
-    if not jumped:
-        return datetime.datetime(*parts[:3]) + diff
-    else:
-        return datetime.datetime(*parts[:3] + [0])
+        return days_to_time(datetime.timedelta(days=fraction))
+    day = datetime.datetime.fromordinal(int(day) + _epoch_ordinal(offset))
+    jul = (value + offset) - (day.toordinal() + JULIAN_ORDINAL)
+    if jul == 0 or jul == 1:
+        # within the precision of a Julian date of midnight
+        return day + datetime.timedelta(days=jul)
+    return day + datetime.timedelta(days=fraction)
 
 
-@lru_cache()
 def time_to_days(value):
     """Convert a time value to fractions of day"""
     return (
@@ -79,7 +78,7 @@ def time_to_days(value):
         + value.microsecond / 10**6
         ) / SECS_PER_DAY
 
-@lru_cache()
+
 def timedelta_to_days(value):
     """Convert a timedelta value to fractions of a day"""
     if not hasattr(value, 'total_seconds'):
@@ -89,8 +88,59 @@ def timedelta_to_days(value):
         secs =value.total_seconds()
     return secs / SECS_PER_DAY
 
-@lru_cache()
+
 def days_to_time(value):
     mins, seconds = divmod(value.seconds, 60)
     hours, mins = divmod(mins, 60)
     return datetime.time(hours, mins, seconds, value.microseconds)
+
+
+US_PER_DAY = SECS_PER_DAY * 10**6
+
+
+def _epoch64(offset):
+    epoch = datetime.date.fromordinal(_epoch_ordinal(offset))
+    return numpy.datetime64(epoch, 'us')
+
+
+def to_excel_array(values, offset=CALENDAR_WINDOWS_1900):
+    """
+    Convert an array of datetime64 to Excel serial numbers as float64,
+    NaT becomes NaN. Results are the same as `to_excel` for each value.
+    """
+    values = numpy.asarray(values).astype('datetime64[us]')
+    missing = numpy.isnat(values)
+    delta = (values - _epoch64(offset)).astype(numpy.int64)
+    days = delta // US_PER_DAY
+    micro = delta % US_PER_DAY
+    secs = micro // 10**6
+    micro = micro % 10**6
+    serial = days.astype(numpy.float64)
+    if offset == CALENDAR_WINDOWS_1900:
+        serial[days <= 60] -= 1
+    serial += (secs + micro / 10**6) / SECS_PER_DAY
+    serial[missing] = numpy.nan
+    return serial
+
+
+def from_excel_array(values, offset=CALENDAR_WINDOWS_1900):
+    """
+    Convert an array of Excel serial numbers to datetime64[us], NaN becomes
+    NaT. Times of day (serials between -1 and 1) are returned as datetimes
+    of the epoch.
+    """
+    values = numpy.array(values, dtype=numpy.float64)
+    missing = ~numpy.isfinite(values)
+    values[missing] = 0
+    if offset == CALENDAR_WINDOWS_1900:
+        values[(values > 1) & (values < 60)] += 1
+    days = numpy.floor(values)
+    micro = numpy.rint((values - days) * US_PER_DAY)
+    # within the precision of a Julian date of midnight
+    jul = (values + offset) - (days + offset)
+    midnight = (jul == 0) | (jul == 1)
+    micro[midnight] = jul[midnight] * US_PER_DAY
+    delta = days.astype(numpy.int64) * US_PER_DAY + micro.astype(numpy.int64)
+    result = _epoch64(offset) + delta.astype('timedelta64[us]')
+    result[missing] = numpy.datetime64('NaT')
+    return result
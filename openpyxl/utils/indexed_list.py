@@ -20,11 +20,9 @@ class IndexedList(list):
 
     def _rebuild_dict(self):
         self._dict = {}
-        idx = 0
-        for value in self:
+        for idx, value in enumerate(self):
             if value not in self._dict:
                 self._dict[value] = idx
-                idx += 1
         self.clean = True
 
     def __contains__(self, value):
@@ -103,3 +103,29 @@ def test_days_to_time():
     td = timedelta(0, 51320, 1600)
     FUT = days_to_time
     assert FUT(td) == time(14, 15, 20, 1600)
+
+
+@pytest.mark.numpy_required
+def test_to_excel_array():
+    import numpy
+    from ..datetime import to_excel_array, CALENDAR_MAC_1904
+    values = numpy.array(['1900-01-15', '1900-03-01T00:00', '2010-01-18T14:15:20.0016',
+                          'NaT'], dtype='datetime64[us]')
+    serials = to_excel_array(values)
+    assert serials[:3].tolist() == [15, 61, 40196.5939815]
+    assert numpy.isnan(serials[3])
+    assert to_excel_array(values[2:3], CALENDAR_MAC_1904).tolist() == [38734.5939815]
+
+
+@pytest.mark.numpy_required
+def test_from_excel_array():
+    import numpy
+    from ..datetime import from_excel_array, CALENDAR_MAC_1904
+    values = from_excel_array([59, 40196.5939815, 42126.999999999884, numpy.nan])
+    assert values[:3].tolist() == [
+        datetime(1900, 2, 28),
+        datetime(2010, 1, 18, 14, 15, 20, 1600),
+        datetime(2015, 5, 3),
+    ]
+    assert numpy.isnat(values[3])
+    assert from_excel_array([0], CALENDAR_MAC_1904).tolist() == [datetime(1904, 1, 1)]
@@ -52,3 +52,9 @@ def test_table_builder(list):
             sb.append(letter)
         assert sb.index(letter) == result[letter]
     assert sb == ['a', 'b', 'c', 'd']
+
+
+def test_index_with_duplicates(list):
+    l = list(['a', 'a', 'b'])
+    assert l.index('b') == 2
+    assert l.add('c') == 3
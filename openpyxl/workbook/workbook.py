@@ -13,7 +13,11 @@ import threading
 from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.utils.datetime  import CALENDAR_WINDOWS_1900
 from openpyxl.worksheet import Worksheet
-from openpyxl.writer.dump_worksheet import DumpWorksheet, save_dump
+from openpyxl.writer.dump_worksheet import (
+    DumpWorksheet,
+    WorksheetStream,
+    save_dump,
+)
 from . names.named_range import NamedRange
 from openpyxl.styles import Style
 from openpyxl.styles.styleable import StyleId
@@ -51,6 +55,8 @@ class Workbook(object):
         self.__read_only = read_only
         self.__thread_local_data = threading.local()
         self.shared_strings = IndexedList()
+        self._stream = None
+        self._resources = [] # files held by read-only, lazy and streamed workbooks
 
         self._setup_styles()
         self.loaded_theme = None
@@ -171,6 +177,8 @@ class Workbook(object):
             raise ReadOnlyWorkbookException('Cannot create new sheet in a read-only workbook')
 
         if self.write_only :
+            if self._stream is not None and index is not None:
+                raise ValueError("Worksheets cannot be inserted in a streamed workbook")
             new_ws = self._optimized_worksheet_class(parent_workbook=self,
                                                       title=title)
             self._worksheet_class = self._optimized_worksheet_class
@@ -281,10 +289,39 @@ class Workbook(object):
         """Remove a named_range from this workbook."""
         self._named_ranges.remove(named_range)
 
-    def save(self, filename):
+    def stream_to(self, filename, compression=None, compress_threads=None):
+        """Write the worksheets of a write-only workbook directly into
+        the file `filename` instead of temporary files.
+
+        Worksheets must be filled one after another: writing rows to a
+        worksheet closes the previous one. The workbook must then be saved
+        to the same file, or closed to give the file up.
+        """
+        if not self.write_only:
+            raise TypeError("Only write-only workbooks can be streamed")
+        self._stream = WorksheetStream(filename, compression, compress_threads)
+        self._resources.append(self._stream)
+
+    def close(self):
+        """
+        Close the archive of a read-only or lazy workbook and the temporary
+        file of its shared strings, if any, or the archive a write-only
+        workbook is streamed to
+        """
+        while self._resources:
+            self._resources.pop().close()
+
+    def save(self, filename, workers=None, compression=None,
+             compress_threads=None):
         """Save the current workbook under the given `filename`.
         Use this function instead of using an `ExcelWriter`.
 
+        Worksheets are serialised in a pool of `workers` processes if given
+        and the platform forks processes, otherwise with a warning one after
+        another.
+        `compression` maps path patterns of the parts to zlib compression
+        levels and parts are compressed in `compress_threads` threads.
+
         .. warning::
             When creating your workbook using `write_only` set to True,
             you will only be able to call this function once. Subsequents attempts to
@@ -293,6 +330,8 @@ class Workbook(object):
         if self.read_only:
             raise TypeError("""Workbook is read-only""")
         if self.write_only:
-            save_dump(self, filename)
+            save_dump(self, filename, compression, compress_threads)
         else:
-            save_workbook(self, filename)
+            save_workbook(self, filename, workers=workers,
+                          compression=compression,
+                          compress_threads=compress_threads)
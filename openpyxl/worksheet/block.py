@@ -0,0 +1,174 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Rectangular blocks of values held in NumPy arrays.
+
+A block is either a 2D array or a dict of 1D arrays, one per column, whose
+keys are used as a header. Each column is converted in one pass: its data
+type is worked out from the dtype, missing values are found with array
+operations and strings are checked once per distinct value. Infinities
+cannot be stored in a worksheet and are rejected. Dates are
+converted to Excel serial numbers as a whole column.
+"""
+
+from openpyxl.compat import NUMPY, range, unicode, basestring, NUMERIC_TYPES
+from openpyxl.cell.cell import ERROR_CODES, ILLEGAL_CHARACTERS_RE
+from openpyxl.styles.numbers import FORMAT_DATE_DATETIME
+from openpyxl.utils.datetime import CALENDAR_WINDOWS_1900, to_excel_array
+from openpyxl.utils.exceptions import IllegalCharacterError
+
+if NUMPY:
+    import numpy
+
+
+def is_block(value):
+    """Whether the value is an array or a dict of columns"""
+    return NUMPY and isinstance(value, (numpy.ndarray, dict))
+
+
+class BlockColumn(object):
+    """
+    Values of a column of a block as a list.
+
+    `data_type` is 'n', 'b' or 's' when all values have this type and None
+    when they must be converted one by one. `missing` is a boolean array of
+    the rows without a value or None; except for untyped columns the values
+    of these rows are meaningless. Numeric columns of dates have a
+    `number_format`.
+    """
+
+    __slots__ = ('values', 'data_type', 'missing', 'strings', 'inverse',
+                 'number_format')
+
+    def __init__(self, values, data_type=None, missing=None):
+        self.values = values
+        self.data_type = data_type
+        self.missing = missing
+        self.strings = None
+        self.inverse = None
+        self.number_format = None
+
+
+    def string_indices(self, string_table):
+        """
+        Add the distinct strings of the column to the table and return the
+        index of each value
+        """
+        indices = [string_table.add(s) for s in self.strings] + [0]
+        return numpy.array(indices, dtype=numpy.int64)[self.inverse].tolist()
+
+
+def _missing(data):
+    missing = numpy.ma.getmaskarray(data)
+    data = numpy.ma.getdata(data)
+    if data.dtype.kind == 'f':
+        if numpy.isinf(data[~missing]).any():
+            raise ValueError("Infinite values cannot be written to a worksheet")
+        missing = missing | numpy.isnan(data)
+    elif data.dtype.kind == 'O':
+        missing = missing | numpy.equal(data, None)
+    elif data.dtype.kind == 'M':
+        missing = missing | numpy.isnat(data)
+    return data, missing
+
+
+def _check_strings(strings, encoding):
+    """Checked unicode strings, None if some are formulae or errors"""
+    checked = []
+    for value in strings:
+        if not isinstance(value, unicode):
+            value = unicode(value, encoding)
+        value = value[:32767]
+        if ILLEGAL_CHARACTERS_RE.search(value) is not None:
+            raise IllegalCharacterError
+        if len(value) > 1 and value.startswith("=") or value in ERROR_CODES:
+            return
+        checked.append(value)
+    return checked
+
+
+def _string_column(data, missing, encoding):
+    present = data
+    if missing is not None:
+        present = data[~missing]
+    strings, inverse = numpy.unique(present, return_inverse=True)
+    strings = _check_strings(strings.tolist(), encoding)
+    if strings is None:
+        return
+    if missing is not None:
+        # missing rows point past the distinct strings
+        full = numpy.empty(len(data), dtype=inverse.dtype)
+        full[~missing] = inverse
+        full[missing] = len(strings)
+        inverse = full
+    values = numpy.array(strings + [None], dtype=object)
+    column = BlockColumn(values[inverse].tolist(), 's', missing)
+    column.strings = strings
+    column.inverse = inverse
+    return column
+
+
+def convert_column(data, encoding="utf-8", guess_types=False,
+                   base_date=CALENDAR_WINDOWS_1900):
+    """
+    Convert a 1D array to a column
+    """
+    data, missing = _missing(data)
+    if not missing.any():
+        missing = None
+        present = data
+    else:
+        present = data[~missing]
+    kind = data.dtype.kind
+
+    if kind == 'O' and len(present):
+        types = set(type(v) for v in present.tolist())
+        if all(issubclass(t, basestring) for t in types):
+            kind = 'U'
+        elif not (bool in types) and all(issubclass(t, NUMERIC_TYPES) for t in types):
+            kind = 'f'
+
+    column = None
+    if kind == 'b':
+        column = BlockColumn(data.tolist(), 'b', missing)
+    elif kind in 'iuf':
+        column = BlockColumn(data.tolist(), 'n', missing)
+    elif kind in 'US' and not guess_types:
+        column = _string_column(data, missing, encoding)
+    elif kind == 'M':
+        column = BlockColumn(to_excel_array(data, base_date).tolist(), 'n',
+                             missing)
+        column.number_format = FORMAT_DATE_DATETIME
+    if column is not None:
+        return column
+
+    # convert value by value
+    values = data.astype(object)
+    if missing is not None:
+        values[missing] = None
+    return BlockColumn(values.tolist(), None, missing)
+
+
+def block_columns(block, encoding="utf-8", guess_types=False,
+                  base_date=CALENDAR_WINDOWS_1900):
+    """
+    Return the header, if any, and the columns of a block
+    """
+    header = None
+    if isinstance(block, dict):
+        header = list(block)
+        arrays = [numpy.ma.asanyarray(block[key]) for key in header]
+        if any(a.ndim != 1 for a in arrays):
+            raise ValueError("Columns must be one dimensional")
+        if len(set(len(a) for a in arrays)) > 1:
+            raise ValueError("All columns of a block must have the same length")
+    else:
+        block = numpy.ma.asanyarray(block)
+        if block.ndim != 2:
+            raise ValueError("Blocks must be two dimensional")
+        arrays = [block[:, idx] for idx in range(block.shape[1])]
+
+    columns = [convert_column(a, encoding, guess_types, base_date)
+               for a in arrays]
+    return header, columns
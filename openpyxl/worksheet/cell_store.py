@@ -0,0 +1,274 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Column oriented storage of cells for dense worksheets.
+
+Values, data types and styles are kept in one set of arrays per column.
+Numbers are held in an array of doubles, other values in a dict by row.
+Cells are only created as views on these arrays when they are accessed.
+"""
+
+from array import array
+from collections import MutableMapping
+
+from openpyxl.compat import range, long
+from openpyxl.cell import Cell
+from openpyxl.utils.indexed_list import IndexedList
+
+from .worksheet import Worksheet
+
+
+DATA_TYPES = ('n', 's', 'f', 'b', 'e', 'inlineStr', 'str')
+TYPE_CODES = dict((t, code) for code, t in enumerate(DATA_TYPES))
+
+# packed style of the cell followed by its xf_index
+DEFAULT_STYLE = (0, 0, 0, 0, 0, 0, None, None, 0)
+
+# how the value of a cell is stored
+EMPTY, FLOAT, INTEGER, OBJECT = range(4)
+# integers beyond this lose precision as doubles
+MAX_INTEGER = 2 ** 53
+
+
+class ColumnArrays(object):
+    """
+    Contents of the cells of a column, indexed by row - 1
+    """
+
+    __slots__ = ('numbers', 'objects', 'kinds', 'types', 'styles', 'present')
+
+    def __init__(self):
+        self.numbers = array('d')
+        self.objects = {}
+        self.kinds = bytearray()
+        self.types = bytearray()
+        self.styles = array('I')
+        self.present = bytearray()
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def grow(self, size):
+        extra = size - len(self.kinds)
+        if extra > 0:
+            self.numbers.extend([0.0] * extra)
+            self.kinds.extend(bytearray(extra))
+            self.types.extend(bytearray(extra))
+            self.styles.extend([0] * extra)
+            self.present.extend(bytearray(extra))
+
+    def get_value(self, idx):
+        kind = self.kinds[idx]
+        if kind == FLOAT:
+            return self.numbers[idx]
+        elif kind == INTEGER:
+            return int(self.numbers[idx])
+        elif kind == OBJECT:
+            return self.objects[idx]
+
+    def set_value(self, idx, value):
+        self.objects.pop(idx, None)
+        self.numbers[idx] = 0.0
+        if value is None:
+            kind = EMPTY
+        elif type(value) is float:
+            kind = FLOAT
+            self.numbers[idx] = value
+        elif (type(value) in (int, long)
+              and -MAX_INTEGER <= value <= MAX_INTEGER):
+            kind = INTEGER
+            self.numbers[idx] = value
+        else:
+            kind = OBJECT
+            self.objects[idx] = value
+        self.kinds[idx] = kind
+
+
+def _get_style(self):
+    return self._store.styles[self._arrays.styles[self._idx]]
+
+
+def _set_style(self, style):
+    self._arrays.styles[self._idx] = self._store.styles.add(style)
+
+
+class CellView(Cell):
+    """
+    Cell whose contents are held by a cell store
+    """
+
+    __slots__ = ('_store', '_arrays', '_idx')
+
+    def __eq__(self, other):
+        return (isinstance(other, CellView)
+                and other._arrays is self._arrays and other._idx == self._idx)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((id(self._arrays), self._idx))
+
+    @property
+    def _value(self):
+        return self._arrays.get_value(self._idx)
+
+    @_value.setter
+    def _value(self, value):
+        self._arrays.set_value(self._idx, value)
+
+    @property
+    def data_type(self):
+        return DATA_TYPES[self._arrays.types[self._idx]]
+
+    @data_type.setter
+    def data_type(self, value):
+        self._arrays.types[self._idx] = TYPE_CODES[value]
+
+    @property
+    def _hyperlink_rel(self):
+        return self._store.hyperlinks.get((self.row, self.col_idx))
+
+    @_hyperlink_rel.setter
+    def _hyperlink_rel(self, value):
+        self._store._set_extra(self._store.hyperlinks, (self.row, self.col_idx), value)
+
+    @property
+    def _comment(self):
+        return self._store.comments.get((self.row, self.col_idx))
+
+    @_comment.setter
+    def _comment(self, value):
+        self._store._set_extra(self._store.comments, (self.row, self.col_idx), value)
+
+
+    @property
+    def _style(self):
+        return _get_style(self)[:-1]
+
+    @_style.setter
+    def _style(self, value):
+        _set_style(self, value + _get_style(self)[-1:])
+
+    @property
+    def _style_index(self):
+        # views are short-lived, the index is not worth caching
+        return None
+
+    @_style_index.setter
+    def _style_index(self, value):
+        pass
+
+    @property
+    def xf_index(self):
+        return _get_style(self)[-1]
+
+    @xf_index.setter
+    def xf_index(self, value):
+        _set_style(self, _get_style(self)[:-1] + (value,))
+
+
+class CellStore(MutableMapping):
+    """
+    Mapping of (row, column) to cells for a worksheet, backed by arrays.
+    Memory is allocated for every row up to the last one of each column
+    so this is only suitable for sheets without large gaps. Numeric cells
+    take about 15 bytes each, other values are kept as Python objects.
+    """
+
+    def __init__(self, worksheet):
+        self.worksheet = worksheet
+        self.columns = {}
+        self.styles = IndexedList([DEFAULT_STYLE])
+        self.hyperlinks = {}
+        self.comments = {}
+        self._size = 0
+
+
+    def _set_extra(self, extras, key, value):
+        if value is None:
+            extras.pop(key, None)
+        else:
+            extras[key] = value
+
+
+    def _arrays(self, key):
+        """Column arrays of an existing cell"""
+        row, col_idx = key
+        arrays = self.columns.get(col_idx)
+        if arrays is None or row > len(arrays) or not arrays.present[row - 1]:
+            raise KeyError(key)
+        return arrays
+
+
+    def __contains__(self, key):
+        try:
+            self._arrays(key)
+        except KeyError:
+            return False
+        return True
+
+
+    def __getitem__(self, key):
+        arrays = self._arrays(key)
+        cell = CellView.__new__(CellView)
+        cell.parent = self.worksheet
+        cell.row, cell.col_idx = key
+        cell._store = self
+        cell._arrays = arrays
+        cell._idx = cell.row - 1
+        return cell
+
+
+    def __setitem__(self, key, cell):
+        row, col_idx = key
+        arrays = self.columns.get(col_idx)
+        if arrays is None:
+            arrays = self.columns[col_idx] = ColumnArrays()
+        idx = row - 1
+        arrays.grow(row)
+        if not arrays.present[idx]:
+            arrays.present[idx] = 1
+            self._size += 1
+        arrays.set_value(idx, cell._value)
+        arrays.types[idx] = TYPE_CODES[cell.data_type]
+        style = cell._style + (cell.xf_index,)
+        arrays.styles[idx] = self.styles.add(style)
+        self._set_extra(self.hyperlinks, key, cell._hyperlink_rel)
+        self._set_extra(self.comments, key, cell._comment)
+
+
+    def __delitem__(self, key):
+        arrays = self._arrays(key)
+        idx = key[0] - 1
+        arrays.present[idx] = 0
+        arrays.set_value(idx, None)
+        arrays.types[idx] = 0
+        arrays.styles[idx] = 0
+        self.hyperlinks.pop(key, None)
+        self.comments.pop(key, None)
+        self._size -= 1
+
+
+    def __iter__(self):
+        for col_idx in sorted(self.columns):
+            present = self.columns[col_idx].present
+            for idx in range(len(present)):
+                if present[idx]:
+                    yield (idx + 1, col_idx)
+
+
+    def __len__(self):
+        return self._size
+
+
+class DenseWorksheet(Worksheet):
+    """
+    Worksheet keeping its cells in per-column arrays rather than as cell
+    objects. Use it with ``Workbook(worksheet_class=DenseWorksheet)``.
+    """
+
+    def __init__(self, parent_workbook, title='Sheet'):
+        Worksheet.__init__(self, parent_workbook, title)
+        self._cells = CellStore(self)
@@ -1,7 +1,7 @@
 from __future__ import absolute_import
 # Copyright (c) 2010-2015 openpyxl
 
-from openpyxl.compat import safe_string
+from openpyxl.compat import safe_string, iteritems
 from openpyxl.cell import get_column_interval, column_index_from_string
 from openpyxl.descriptors import Integer, Float, Bool, Strict, String, Alias
 from openpyxl.compat import OrderedDict
@@ -21,6 +21,7 @@ class Dimension(Strict, StyleableObject):
     outline_level = Alias('outlineLevel')
     collapsed = Bool()
     _style_id = None
+    _pending = None # (holder, key) until the dimension is added to its holder
 
     def __init__(self, index, hidden, outlineLevel,
                  collapsed, worksheet, visible=True, style=None):
@@ -40,6 +41,15 @@ class Dimension(Strict, StyleableObject):
             self._number_format_id = style.numFmtId
 
 
+    def __setattr__(self, name, value):
+        super(Dimension, self).__setattr__(name, value)
+        pending = self._pending
+        if pending is not None and name != "_pending":
+            self._pending = None
+            holder, key = pending
+            holder[key] = self
+
+
     def __iter__(self):
         for key in self.__fields__[1:]:
             value = getattr(self, key)
@@ -183,12 +193,30 @@ class ColumnDimension(Dimension):
 
 
 class DimensionHolder(OrderedDict):
-    "hold (row|column)dimensions and allow operations over them"
-    def __init__(self, worksheet, direction, *args, **kwargs):
+    """
+    hold (row|column)dimensions and allow operations over them
+
+    Looking up a missing dimension returns a new one with default values
+    which is only added once one of its attributes is set.
+    """
+    def __init__(self, worksheet, direction, default_factory=None, *args, **kwargs):
         self.worksheet = worksheet
         self.direction = direction
+        if default_factory is None:
+            default_factory = ColumnDimension
+        self.default_factory = default_factory
         super(DimensionHolder, self).__init__(*args, **kwargs)
 
+    def __reduce__(self):
+        return (self.__class__, (self.worksheet, self.direction,
+                                 self.default_factory), None, None,
+                iteritems(self))
+
+    def __missing__(self, key):
+        dim = self.default_factory(worksheet=self.worksheet, index=key)
+        dim._pending = (self, key)
+        return dim
+
     def group(self, start, end=None, outline_level=1, hidden=False):
         """allow grouping a range of consecutive columns together
 
@@ -5,8 +5,16 @@ from __future__ import absolute_import
 *Still very raw*
 """
 
+import datetime
+import sys
+from functools import reduce as fold
+from multiprocessing import Pool, cpu_count
+
 # compatibility
-from openpyxl.compat import range
+from openpyxl.compat import range, zip, unicode, NUMPY
+
+if NUMPY:
+    import numpy
 
 # package
 from openpyxl.xml.functions import iterparse
@@ -14,13 +22,15 @@ from openpyxl.xml.functions import safe_iterator
 from openpyxl.xml.constants import SHEET_MAIN_NS
 
 from openpyxl.worksheet import Worksheet
+from openpyxl.worksheet.row_index import RowIndex
 from openpyxl.utils import (
     ABSOLUTE_RE,
     coordinate_from_string,
     column_index_from_string,
     get_column_letter,
 )
-from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL
+from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL, xf_table
+from openpyxl.utils.datetime import from_excel, from_excel_array
 
 
 def read_dimension(source):
@@ -29,7 +39,9 @@ def read_dimension(source):
     min_row = min_col =  max_row = max_col = None
     DIMENSION_TAG = '{%s}dimension' % SHEET_MAIN_NS
     DATA_TAG = '{%s}sheetData' % SHEET_MAIN_NS
-    it = iterparse(source, tag=[DIMENSION_TAG, DATA_TAG])
+    # stop at the start of the data rather than parsing it when the
+    # dimension is missing
+    it = iterparse(source, events=('start',))
     for _event, element in it:
         if element.tag == DIMENSION_TAG:
             dim = element.get("ref")
@@ -46,19 +58,24 @@ def read_dimension(source):
         elif element.tag == DATA_TAG:
             # Dimensions missing
             break
-        element.clear()
 
 
 ROW_TAG = '{%s}row' % SHEET_MAIN_NS
 CELL_TAG = '{%s}c' % SHEET_MAIN_NS
 VALUE_TAG = '{%s}v' % SHEET_MAIN_NS
 FORMULA_TAG = '{%s}f' % SHEET_MAIN_NS
+INLINE_TAG = '{%s}is' % SHEET_MAIN_NS
+TEXT_TAG = '{%s}t' % SHEET_MAIN_NS
+RUN_TAG = '{%s}r' % SHEET_MAIN_NS
+RICH_TEXT_TAG = '%s/%s' % (RUN_TAG, TEXT_TAG)
+DIGITS = '0123456789'
 DIMENSION_TAG = '{%s}dimension' % SHEET_MAIN_NS
 
 
 class IterableWorksheet(Worksheet):
 
     _xml = None
+    _row_index = None
     min_col = 'A'
     min_row = 1
     max_col = max_row = None
@@ -88,84 +105,404 @@ class IterableWorksheet(Worksheet):
         self._xml = value
 
 
-    def get_squared_range(self, min_col, min_row, max_col, max_row):
+    @property
+    def row_index(self):
+        """
+        Sparse index of the rows in the archive, None if the worksheet cannot
+        be read from an arbitrary row
+        """
+        if self._row_index is None and self._xml is None:
+            index = RowIndex.from_archive(self.parent._archive,
+                                          self.worksheet_path)
+            self._row_index = index or False
+        return self._row_index or None
+
+
+    def map_rows(self, func, reduce=None, workers=None, chunks=None,
+                 min_col=1, max_col=None, values_only=True):
+        """
+        Split the rows of the worksheet into ranges which are read in a pool
+        of processes, each with its own handle on the file. `func` is called
+        with an iterator over the rows of each range, as returned by
+        `get_squared_range()`, and the results are returned in order.
+        With `reduce` they are combined as they come instead, like
+        `functools.reduce()` does.
+
+        The workbook must have been loaded from a file. Under Windows `func`
+        must be defined at the top level of a module.
+        """
+        filename = self.parent._archive.filename
+        if filename is None:
+            raise ValueError("Only worksheets loaded from a file can be read in parallel")
+        if workers is None:
+            workers = cpu_count()
+        if chunks is None:
+            chunks = workers
+        if max_col is None and self.max_col is not None:
+            max_col = column_index_from_string(self.max_col)
+
+        ranges = _row_ranges(self.min_row, self._last_row(), chunks)
+        if not ranges:
+            return [] if reduce is None else None
+        initargs = (filename, self.title, self.parent.data_only, func,
+                    min_col, max_col, values_only)
+        pool = Pool(workers, _init_worker, initargs)
+        try:
+            results = pool.imap(_map_rows, ranges)
+            if reduce is None:
+                return list(results)
+            return fold(reduce, results)
+        finally:
+            pool.close()
+            pool.join()
+
+
+    def _last_row(self):
+        """Last row from the dimensions or, if they are missing, a scan"""
+        if self.max_row is not None:
+            return self.max_row
+        index = self.row_index
+        if index is not None:
+            index.scan(sys.maxsize)
+            return index.last_row
+        row_id = 0
+        for row_id, _ in self._get_rows():
+            pass
+        return row_id
+
+
+    def get_squared_range(self, min_col, min_row, max_col, max_row,
+                          values_only=False):
         """
         The source worksheet file may have columns or rows missing.
         Missing cells will be created.
+        With `values_only` the values are decoded without creating cells.
         """
+        empty = EMPTY_CELL
+        get_row = self._get_row
+        if values_only:
+            empty = None
+            get_row = self._get_row_values
         if max_col is not None:
-            empty_row = tuple(EMPTY_CELL for column in range(min_col, max_col + 1))
+            empty_row = tuple(empty for column in range(min_col, max_col + 1))
         else:
             empty_row = []
         row_counter = min_row
 
-        p = iterparse(self.xml_source, tag=[ROW_TAG], remove_blank_text=True)
-        for _event, element in p:
-            if element.tag == ROW_TAG:
-                row_id = int(element.get("r"))
+        for row_id, element in self._get_rows(min_row, max_row):
+            # some rows are missing
+            for row_counter in range(row_counter, row_id):
+                row_counter += 1
+                yield empty_row
 
-                # got all the rows we need
-                if max_row is not None and row_id > max_row:
-                    break
+            # return cells from a row
+            yield tuple(get_row(element, min_col, max_col))
+            row_counter += 1
 
-                # some rows are missing
-                for row_counter in range(row_counter, row_id):
-                    row_counter += 1
-                    yield empty_row
 
-                # return cells from a row
-                if min_row <= row_id:
-                    yield tuple(self._get_row(element, min_col, max_col))
-                    row_counter += 1
+    def _get_rows(self, min_row=1, max_row=None):
+        """
+        Return row elements within the range as they are parsed.
+        Each element is cleared once the next row is requested.
+        """
+        stream = None
+        if min_row > 1 and self.row_index is not None:
+            stream = self.row_index.open(min_row)
+        source = stream
+        if source is None:
+            source = self.xml_source
+        try:
+            p = iterparse(source, tag=[ROW_TAG], remove_blank_text=True)
+            for _event, element in p:
+                if element.tag == ROW_TAG:
+                    row_id = int(element.get("r"))
+
+                    # got all the rows we need
+                    if max_row is not None and row_id > max_row:
+                        break
+
+                    if min_row <= row_id:
+                        yield row_id, element
+
+                if element.tag in (CELL_TAG, VALUE_TAG, FORMULA_TAG, INLINE_TAG,
+                                   TEXT_TAG, RUN_TAG):
+                    # sub-elements of rows should be skipped as handled within a cell
+                    continue
+                element.clear()
+        finally:
+            # rows read from the index hold a file open until closed
+            if stream is not None:
+                stream.close()
+
+
+    def _get_cells(self, element, min_col=1, max_col=None):
+        """
+        Return the raw contents of the cells in a row:
+        row, column letter, column index, value, data type and style id
+        """
+        for cell in safe_iterator(element, CELL_TAG):
+            coord = cell.get('r')
+            column_str, row = coordinate_from_string(coord)
+            column = column_index_from_string(column_str)
 
-            if element.tag in (CELL_TAG, VALUE_TAG, FORMULA_TAG):
-                # sub-elements of rows should be skipped as handled within a cell
+            if max_col is not None and column > max_col:
+                break
+            if column < min_col:
                 continue
-            element.clear()
+
+            value, data_type, style_id = self._cell_contents(cell)
+            yield row, column_str, column, value, data_type, style_id
+
+
+    def _cell_contents(self, cell):
+        """Raw value, data type and style id of a cell element"""
+        data_type = cell.get('t', 'n')
+        style_id = int(cell.get('s', 0))
+        formula = cell.findtext(FORMULA_TAG)
+        value = cell.find(VALUE_TAG)
+        if value is not None:
+            value = value.text
+        elif data_type == 'inlineStr':
+            value = self._inline_string(cell)
+        if formula is not None:
+            if not self.parent.data_only:
+                data_type = 'f'
+                value = "=%s" % formula
+        return value, data_type, style_id
+
+
+    def _iter_selection(self, min_row, max_row, columns, key_column,
+                        predicate, values_only):
+        """
+        Cells are matched on the letters of their reference and only those
+        of the selected columns are decoded. The key cell is decoded first so
+        that rejected rows are dropped before anything else is built.
+        """
+        letters = [get_column_letter(col) for col in columns]
+        wanted = set(letters)
+        key = get_column_letter(key_column)
+        wanted.add(key)
+        last = max((len(l), l) for l in wanted)
+        empty = None if values_only else EMPTY_CELL
+        styles = xf_table(self.parent)
+        decode = self._decode
+
+        def missing_rows(start, stop):
+            if start >= stop:
+                return
+            if predicate is not None and not predicate(None):
+                return
+            for _ in range(start, stop):
+                yield tuple(empty for _ in letters)
+
+        row_counter = min_row
+        for row_id, element in self._get_rows(min_row, max_row):
+            for row in missing_rows(row_counter, row_id):
+                yield row
+            row_counter = row_id + 1
+
+            found = {}
+            for cell in safe_iterator(element, CELL_TAG):
+                column = cell.get('r').rstrip(DIGITS)
+                if column in wanted:
+                    found[column] = cell
+                elif (len(column), column) > last:
+                    break
+
+            if predicate is not None:
+                value = None
+                cell = found.get(key)
+                if cell is not None:
+                    value, data_type, style_id = self._cell_contents(cell)
+                    value = decode(value, data_type, style_id, styles)
+                if not predicate(value):
+                    continue
+
+            row = []
+            for column in letters:
+                cell = found.get(column)
+                if cell is None:
+                    row.append(empty)
+                    continue
+                value, data_type, style_id = self._cell_contents(cell)
+                if values_only:
+                    row.append(decode(value, data_type, style_id, styles))
+                else:
+                    row.append(ReadOnlyCell(self, row_id, column, value,
+                                            data_type, style_id))
+            yield tuple(row)
+
+
+    def _inline_string(self, cell):
+        """Text of an inline string, plain or rich"""
+        inline = cell.find(INLINE_TAG)
+        if inline is None:
+            return
+        texts = inline.findall(TEXT_TAG) or inline.findall(RICH_TEXT_TAG)
+        return u"".join(t.text or u"" for t in texts)
 
 
     def _get_row(self, element, min_col=1, max_col=None):
         """Return cells from a particular row"""
         col_counter = min_col
 
-        for cell in safe_iterator(element, CELL_TAG):
-            coord = cell.get('r')
-            column_str, row = coordinate_from_string(coord)
-            column = column_index_from_string(column_str)
+        for row, column_str, column, value, data_type, style_id in self._get_cells(
+            element, min_col, max_col):
+            if col_counter < column:
+                for col_counter in range(col_counter, column):
+                    # pad row with missing cells
+                    yield EMPTY_CELL
 
-            if max_col is not None and column > max_col:
-                break
-
-            if min_col <= column:
-                if col_counter < column:
-                    for col_counter in range(max(col_counter, min_col), column):
-                        # pad row with missing cells
-                        yield EMPTY_CELL
-
-                data_type = cell.get('t', 'n')
-                style_id = int(cell.get('s', 0))
-                formula = cell.findtext(FORMULA_TAG)
-                value = cell.find(VALUE_TAG)
-                if value is not None:
-                    value = value.text
-                if formula is not None:
-                    if not self.parent.data_only:
-                        data_type = 'f'
-                        value = "=%s" % formula
-
-                yield ReadOnlyCell(self, row, column_str,
-                                   value, data_type, style_id)
+            yield ReadOnlyCell(self, row, column_str,
+                               value, data_type, style_id)
             col_counter = column + 1
         if max_col is not None:
             for _ in range(col_counter, max_col+1):
                 yield EMPTY_CELL
 
 
-    def _get_cell(self, coordinate):
+    def _get_row_values(self, element, min_col=1, max_col=None):
+        """Return the values of the cells of a row"""
+        values = []
+        styles = xf_table(self.parent)
+        for _, _, column, value, data_type, style_id in self._get_cells(
+            element, min_col, max_col):
+            missing = column - min_col - len(values)
+            if missing:
+                values.extend([None] * missing)
+            values.append(self._decode(value, data_type, style_id, styles))
+        if max_col is not None:
+            values.extend([None] * (max_col - min_col + 1 - len(values)))
+        return values
+
+
+    def _decode(self, value, data_type, style_id, styles):
+        """Value of a cell from its contents, as for a read-only cell"""
+        if value is None:
+            return
+        if data_type == 'n':
+            try:
+                value = int(value)
+            except ValueError:
+                value = float(value)
+            if style_id and styles[style_id].is_date:
+                return from_excel(value, self.base_date)
+            return value
+        elif data_type == 's':
+            return unicode(self.shared_strings[int(value)])
+        elif data_type == 'b':
+            return value == '1'
+        elif data_type in ('inlineStr', 'str'):
+            return unicode(value)
+        return value
+
+
+    def get_column_arrays(self, min_col=1, min_row=1, max_col=None, max_row=None):
+        """
+        Return a block of cells as NumPy masked arrays, one per column.
+
+        Each column gets the narrowest suitable dtype: int64, float64,
+        datetime64 for date formatted numbers, bool or object for text and
+        mixed content. Missing cells are masked.
+
+        :rtype: list of :class:`numpy.ma.MaskedArray`
+        """
+        if not NUMPY:
+            raise ImportError("You must install numpy to export cells as arrays")
+
+        if max_col is None and self.max_col is not None:
+            max_col = column_index_from_string(self.max_col)
+        if max_row is None:
+            max_row = self.max_row
+
+        columns = {}
+        last_row = min_row - 1
+        for row_id, element in self._get_rows(min_row, max_row):
+            last_row = row_id
+            for _, _, column, value, data_type, style_id in self._get_cells(
+                element, min_col, max_col):
+                if value is None:
+                    continue
+                cells = columns.setdefault(column, ([], [], [], []))
+                cells[0].append(row_id - min_row)
+                cells[1].append(value)
+                cells[2].append(data_type)
+                cells[3].append(style_id)
+
+        if max_row is None:
+            max_row = last_row
+        if max_col is None:
+            max_col = max(columns or [min_col])
+        size = max(max_row - min_row + 1, 0)
+
+        date_styles = {}
+        arrays = []
+        for column in range(min_col, max_col + 1):
+            if column not in columns:
+                data = numpy.empty(size, dtype=object)
+                arrays.append(numpy.ma.masked_array(data, mask=True))
+                continue
+            positions, values, data_types, style_ids = columns[column]
+            data = self._column_array(values, data_types, style_ids, date_styles)
+            block = numpy.zeros(size, dtype=data.dtype)
+            if data.dtype == object:
+                block.fill(None)
+            block[positions] = data
+            mask = numpy.ones(size, dtype=bool)
+            mask[positions] = False
+            arrays.append(numpy.ma.masked_array(block, mask=mask))
+        return arrays
+
+
+    def _column_array(self, values, data_types, style_ids, date_styles):
+        """
+        Convert the raw values of a column into a typed array.
+        Shared strings and date formats are resolved once per distinct
+        index and style rather than once per cell.
+        """
+        kinds = set(data_types)
+        if len(kinds) == 1:
+            kind = data_types[0]
+
+            if kind == 'n':
+                for style_id in set(style_ids):
+                    if style_id not in date_styles:
+                        date_styles[style_id] = self._is_date_style(style_id)
+                dates = set(date_styles[style_id] for style_id in set(style_ids))
+                if dates == set([False]):
+                    try:
+                        return numpy.array(values, dtype=numpy.int64)
+                    except (ValueError, OverflowError):
+                        return numpy.array(values, dtype=numpy.float64)
+                if dates == set([True]):
+                    serials = numpy.array(values, dtype=numpy.float64)
+                    times = (serials > -1) & (serials < 1) & (serials != 0)
+                    if not times.any():
+                        return from_excel_array(serials, self.base_date)
+
+            elif kind == 's':
+                indices = numpy.array(values, dtype=numpy.int64)
+                unique, inverse = numpy.unique(indices, return_inverse=True)
+                strings = numpy.empty(len(unique), dtype=object)
+                strings[:] = [unicode(self.shared_strings[idx]) for idx in unique]
+                return strings[inverse]
+
+            elif kind == 'b':
+                return numpy.array(values, dtype=object) == '1'
+
+        data = numpy.empty(len(values), dtype=object)
+        data[:] = [ReadOnlyCell(self, None, None, value, data_type, style_id).value
+                   for value, data_type, style_id in zip(values, data_types, style_ids)]
+        return data
+
+
+    def _is_date_style(self, style_id):
+        return bool(style_id) and xf_table(self.parent)[style_id].is_date
+
+
+    def _get_cell(self, row, column):
         """Cells are returned by a generator which can be empty"""
-        col, row = coordinate_from_string(coordinate)
-        col = column_index_from_string(col)
-        cell = tuple(self.get_squared_range(col, row, col, row))[0]
+        cell = tuple(self.get_squared_range(column, row, column, row))[0]
         if cell:
             return cell[0]
         return EMPTY_CELL
@@ -203,3 +540,36 @@ class IterableWorksheet(Worksheet):
 
     def get_style(self, coordinate):
         raise NotImplementedError("use `cell.style` instead")
+
+
+def _row_ranges(min_row, max_row, chunks):
+    """Split rows into at most the number of (first, last) ranges"""
+    count = max_row - min_row + 1
+    if count < 1:
+        return []
+    size = -(-count // chunks)
+    return [(start, min(start + size - 1, max_row))
+            for start in range(min_row, max_row + 1, size)]
+
+
+_worker = {}
+
+
+def _init_worker(filename, title, data_only, func, min_col, max_col,
+                 values_only):
+    """
+    Open the worksheet once per worker process
+    """
+    from openpyxl.reader.excel import load_workbook
+    wb = load_workbook(filename, read_only=True, data_only=data_only)
+    _worker['worksheet'] = wb[title]
+    _worker['func'] = func
+    _worker['columns'] = min_col, max_col, values_only
+
+
+def _map_rows(rows):
+    min_row, max_row = rows
+    min_col, max_col, values_only = _worker['columns']
+    ws = _worker['worksheet']
+    return _worker['func'](ws.get_squared_range(min_col, min_row, max_col,
+                                                max_row, values_only))
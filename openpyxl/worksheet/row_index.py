@@ -0,0 +1,200 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Sparse index of the rows of a worksheet stored in an archive so that
+read-only worksheets can start reading close to a given row.
+"""
+
+import os.path
+import re
+import struct
+import zlib
+from bisect import bisect_right
+from zipfile import ZIP_STORED, ZIP_DEFLATED, sizeFileHeader, structFileHeader
+
+
+ROW_RE = re.compile(br'<(?:\w+:)?row\b[^>]*?\sr="(\d+)"')
+SHEET_DATA_RE = re.compile(br'<(?:\w+:)?sheetData\b[^>]*?(/?)>')
+
+
+class RowIndex(object):
+    """
+    The worksheet is inflated once and at regular intervals the state of the
+    decompressor is kept along with the position of the next row. Reading a
+    row starts from the closest preceding checkpoint instead of the start of
+    the worksheet. The index is only extended as far as rows are requested.
+    """
+
+    interval = 2**19 # decompressed bytes between checkpoints
+    chunk_size = 2**14
+
+    def __init__(self, filename, info):
+        self.filename = filename
+        self.info = info
+        self.header = None # worksheet up to and including <sheetData>
+        self.rows = [] # first row after each checkpoint
+        self.offsets = [] # their positions in the worksheet
+        self.checkpoints = []
+        self.last_row = 0
+        self.complete = False
+
+        with open(filename, 'rb') as src:
+            src.seek(info.header_offset)
+            header = struct.unpack(structFileHeader, src.read(sizeFileHeader))
+        self.data_offset = (info.header_offset + sizeFileHeader
+                            + header[10] + header[11])
+
+        self._pos = 0
+        self._pending = None # checkpoint waiting for a row
+        self._buffer = b''
+        self._buffer_offset = 0
+        self._inflate = None
+        if info.compress_type == ZIP_DEFLATED:
+            self._inflate = zlib.decompressobj(-zlib.MAX_WBITS)
+
+
+    @classmethod
+    def from_archive(cls, archive, path):
+        """
+        Index for a member of an archive, None if the member cannot be read
+        directly from the archive's file
+        """
+        filename = archive.filename
+        if filename is None or not os.path.isfile(filename):
+            return
+        info = archive.getinfo(path)
+        if info.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+            return
+        if info.flag_bits & 0x1:
+            return # encrypted
+        return cls(filename, info)
+
+
+    def scan(self, row):
+        """Extend the index until it covers the row"""
+        if self.complete or self.last_row >= row:
+            return
+
+        with open(self.filename, 'rb') as src:
+            src.seek(self.data_offset + self._pos)
+            while not self.complete and self.last_row < row:
+                self._scan_chunk(src)
+
+
+    def _scan_chunk(self, src):
+        end = self._buffer_offset + len(self._buffer)
+        if not self.checkpoints or end - self.checkpoints[-1][0] >= self.interval:
+            inflate = self._inflate and self._inflate.copy()
+            self.checkpoints.append((end, self._pos, inflate))
+            self._pending = len(self.checkpoints) - 1
+
+        size = min(self.chunk_size, self.info.compress_size - self._pos)
+        data = src.read(size)
+        self._pos += len(data)
+        if self._inflate is not None:
+            data = self._inflate.decompress(data)
+        if self._pos >= self.info.compress_size:
+            if self._inflate is not None:
+                data += self._inflate.flush()
+            self.complete = True
+
+        buf = self._buffer + data
+        base = self._buffer_offset
+        start = 0
+        if self.header is None:
+            match = SHEET_DATA_RE.search(buf)
+            if match is None:
+                self._buffer = buf
+                return
+            if match.group(1):
+                # no rows at all
+                self.complete = True
+                return
+            self.header = buf[:match.end()]
+            start = match.end()
+
+        # tags may be cut at the end of the chunk
+        stop = len(buf)
+        if not self.complete:
+            stop = max(buf.rfind(b'<'), start)
+        for match in ROW_RE.finditer(buf, start, stop):
+            row = int(match.group(1))
+            offset = base + match.start()
+            self.last_row = row
+            checkpoint = self._pending
+            if checkpoint is not None and offset >= self.checkpoints[checkpoint][0]:
+                self.rows.append(row)
+                self.offsets.append((offset, checkpoint))
+                self._pending = None
+
+        self._buffer = buf[stop:]
+        self._buffer_offset = base + stop
+
+
+    def open(self, row):
+        """
+        Return a file-like object with the worksheet xml starting at the
+        last indexed row before the row, None if there is no such row.
+        """
+        self.scan(row)
+        idx = bisect_right(self.rows, row)
+        if not idx or self.header is None:
+            return
+        offset, checkpoint = self.offsets[idx - 1]
+        return RowStream(self, offset, self.checkpoints[checkpoint])
+
+
+class RowStream(object):
+    """
+    Worksheet header followed by the worksheet from a given position,
+    inflated as it is read
+    """
+
+    def __init__(self, index, offset, checkpoint):
+        start, pos, inflate = checkpoint
+        self.index = index
+        self._src = open(index.filename, 'rb')
+        self._src.seek(index.data_offset + pos)
+        self._remaining = index.info.compress_size - pos
+        self._inflate = inflate and inflate.copy()
+        self._skip = offset - start
+        self._buffer = index.header
+
+
+    def _fill(self):
+        data = b''
+        while not data and self._remaining:
+            chunk = self._src.read(min(self.index.chunk_size, self._remaining))
+            self._remaining -= len(chunk)
+            if not chunk:
+                self._remaining = 0
+            data = chunk
+            if self._inflate is not None:
+                data = self._inflate.decompress(chunk)
+                if not self._remaining:
+                    data += self._inflate.flush()
+            if self._skip:
+                skipped = min(self._skip, len(data))
+                data = data[skipped:]
+                self._skip -= skipped
+        return data
+
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            data = self._fill()
+            if not data:
+                break
+            self._buffer += data
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        if not data:
+            self.close()
+        return data
+
+
+    def close(self):
+        if not self._src.closed:
+            self._src.close()
@@ -0,0 +1,99 @@
+# Copyright (c) 2010-2015 openpyxl
+
+import pytest
+
+from openpyxl.compat import NUMPY
+if NUMPY:
+    import numpy
+
+pytestmark = pytest.mark.numpy_required
+
+
+def test_numbers():
+    from ..block import convert_column
+    col = convert_column(numpy.array([1.5, numpy.nan, 3]))
+    assert col.data_type == 'n'
+    assert list(col.missing) == [False, True, False]
+    assert col.values[0] == 1.5
+
+
+def test_infinity():
+    from ..block import convert_column
+    with pytest.raises(ValueError):
+        convert_column(numpy.array([1.5, numpy.inf]))
+    col = convert_column(numpy.ma.masked_array([1.5, -numpy.inf], mask=[0, 1]))
+    assert list(col.missing) == [False, True]
+
+
+def test_bools():
+    from ..block import convert_column
+    col = convert_column(numpy.ma.masked_array([True, False], mask=[0, 1]))
+    assert col.data_type == 'b'
+    assert list(col.missing) == [False, True]
+
+
+def test_strings():
+    from ..block import convert_column
+    from openpyxl.utils.indexed_list import IndexedList
+    col = convert_column(numpy.array(["b", None, "a", "b"], dtype=object))
+    assert col.data_type == 's'
+    assert col.values == ["b", None, "a", "b"]
+    assert col.strings == ["a", "b"]
+
+    table = IndexedList(["b"])
+    indices = col.string_indices(table)
+    assert list(table) == ["b", "a"]
+    assert [indices[0], indices[2], indices[3]] == [0, 1, 0]
+
+
+@pytest.mark.parametrize("value", ["=A1", "#N/A"])
+def test_formula_strings(value):
+    from ..block import convert_column
+    col = convert_column(numpy.array(["a", value]))
+    assert col.data_type is None
+    assert col.values == ["a", value]
+
+
+def test_illegal_strings():
+    from ..block import convert_column
+    from openpyxl.utils.exceptions import IllegalCharacterError
+    with pytest.raises(IllegalCharacterError):
+        convert_column(numpy.array(["\x01"]))
+
+
+def test_dates():
+    from ..block import convert_column
+    col = convert_column(numpy.array(["2015-01-01", "NaT"], dtype="datetime64[D]"))
+    assert col.data_type == 'n'
+    assert col.values[0] == 42005
+    assert col.missing.tolist() == [False, True]
+    assert col.number_format == 'yyyy-mm-dd h:mm:ss'
+
+
+def test_dates_mac():
+    from ..block import convert_column
+    from openpyxl.utils.datetime import CALENDAR_MAC_1904
+    col = convert_column(numpy.array(["1904-01-02T12:00"], dtype="datetime64[m]"),
+                         base_date=CALENDAR_MAC_1904)
+    assert col.values == [1.5]
+
+
+def test_block_columns():
+    from ..block import block_columns
+    header, columns = block_columns(numpy.arange(6).reshape(3, 2))
+    assert header is None
+    assert [c.values for c in columns] == [[0, 2, 4], [1, 3, 5]]
+
+    header, columns = block_columns({'a': [1, 2]})
+    assert header == ['a']
+    assert columns[0].values == [1, 2]
+
+
+@pytest.mark.parametrize("block", [
+    numpy.arange(3) if NUMPY else None,
+    {'a': [1, 2], 'b': [1]},
+    ])
+def test_invalid_block(block):
+    from ..block import block_columns
+    with pytest.raises(ValueError):
+        block_columns(block)
@@ -0,0 +1,102 @@
+# Copyright (c) 2010-2015 openpyxl
+
+import pytest
+
+from openpyxl.workbook import Workbook
+from openpyxl.cell import Cell
+from openpyxl.styles import Font
+
+
+@pytest.fixture
+def DenseWorksheet():
+    from ..cell_store import DenseWorksheet
+    return DenseWorksheet
+
+
+@pytest.fixture
+def ws(DenseWorksheet):
+    wb = Workbook(worksheet_class=DenseWorksheet)
+    return wb.active
+
+
+def test_ctor(ws):
+    from ..cell_store import CellStore
+    assert isinstance(ws._cells, CellStore)
+    assert len(ws._cells) == 0
+
+
+def test_store(ws):
+    store = ws._cells
+    store[(3, 3)] = Cell(ws, 'C', 3, 15)
+    assert (3, 3) in store
+    assert (2, 3) not in store
+    assert (3, 4) not in store
+    assert len(store) == 1
+    assert len(store.columns[3]) == 3
+
+    cell = store[(3, 3)]
+    assert cell.value == 15
+    assert cell.coordinate == 'C3'
+    assert cell == store[(3, 3)]
+
+    del store[(3, 3)]
+    assert (3, 3) not in store
+    assert len(store) == 0
+    with pytest.raises(KeyError):
+        store[(3, 3)]
+
+
+def test_view_writes_through(ws):
+    cell = ws.cell(row=2, column=2)
+    cell.value = "text"
+    cell.font = Font(bold=True)
+
+    other = ws['B2']
+    assert other is not cell
+    assert other.value == "text"
+    assert other.data_type == 's'
+    assert other.font.b is True
+    assert other.has_style
+    assert ws['A1'].font.b is False
+
+
+def test_iteration(ws):
+    ws.append([1, 2])
+    ws['A3'] = 3
+    assert list(ws._cells) == [(1, 1), (3, 1), (1, 2)]
+    assert sorted(c.value for c in ws.get_cell_collection()) == [1, 2, 3]
+
+
+def test_write(ws):
+    from openpyxl.writer.worksheet import write_worksheet
+    ws.append([1, "string", 2.5, None])
+    ws['B2'] = "=A1+1"
+    ws['B2'].font = Font(italic=True)
+
+    wb = Workbook()
+    plain = wb.active
+    plain.append([1, "string", 2.5, None])
+    plain['B2'] = "=A1+1"
+    plain['B2'].font = Font(italic=True)
+
+    assert write_worksheet(ws, ws.parent.shared_strings) == \
+        write_worksheet(plain, wb.shared_strings)
+
+
+def test_numbers(ws):
+    from ..cell_store import FLOAT, INTEGER, OBJECT
+    values = [1, 2.5, 2**60, True, "text", None]
+    ws.append(values)
+    arrays = [ws._cells.columns[idx] for idx in range(1, 7)]
+
+    assert [a.kinds[0] for a in arrays[:5]] == [INTEGER, FLOAT, OBJECT, OBJECT, OBJECT]
+    assert arrays[0].numbers[0] == 1
+    assert arrays[1].numbers[0] == 2.5
+    assert arrays[0].objects == {}
+    assert [ws.cell(row=1, column=idx).value for idx in range(1, 7)] == values
+    assert type(ws['A1'].value) is int
+    assert type(ws['C1'].value) is type(2**60)
+
+    ws['A1'] = "replaced"
+    assert ws['A1'].value == "replaced"
+    assert arrays[0].numbers[0] == 0
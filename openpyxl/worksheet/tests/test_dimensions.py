@@ -86,3 +86,22 @@ def test_group_columns_collapse():
     dims.group('A', 'C', 1, hidden=True)
     group = list(dims.values())[0]
     assert group.hidden
+
+
+def test_dimension_added_when_set():
+    from ..worksheet import Worksheet
+    from ..dimensions import RowDimension
+    ws = Worksheet(parent_workbook=DummyWorkbook())
+    ws.cell(row=2, column=2)
+    assert len(ws.row_dimensions) == 0
+    assert len(ws.column_dimensions) == 0
+
+    rd = ws.row_dimensions[2]
+    assert isinstance(rd, RowDimension)
+    assert rd.index == 2
+    assert rd.height is None
+    assert 2 not in ws.row_dimensions
+
+    ws.column_dimensions['B'].width = 20
+    assert ws.column_dimensions['B'].width == 20
+    assert list(ws.column_dimensions) == ['B']
@@ -1,5 +1,8 @@
 # Copyright (c) 2010-2015 openpyxl
 
+# Python stdlib imports
+import datetime
+
 # test imports
 import pytest
 
@@ -66,6 +69,13 @@ class TestWorksheet:
         cell = ws.cell(row=1, column=1)
         assert cell.coordinate == 'A1'
 
+    def test_cells_by_index(self, Worksheet):
+        ws = Worksheet(Workbook())
+        cell = ws.cell(row=3, column=2)
+        assert ws._cells[(3, 2)] is cell
+        assert ws['B3'] is cell
+        assert ws.cell('$B$3') is cell
+
     def test_set_bad_title(self, Worksheet):
         with pytest.raises(SheetTitleException):
             Worksheet(Workbook(), 'X' * 50)
@@ -101,6 +111,18 @@ class TestWorksheet:
         assert 'A12:B12' == ws.calculate_dimension()
 
 
+    def test_bounds(self, Worksheet):
+        ws = Worksheet(Workbook())
+        assert (ws.min_row, ws.max_row, ws.min_col, ws.max_column) == (1, 0, 1, 1)
+        ws.cell(row=5, column=4)
+        ws.cell(row=3, column=6)
+        assert (ws.min_row, ws.max_row, ws.min_col, ws.max_column) == (3, 5, 4, 6)
+        ws.append([])
+        assert ws.max_row == 6
+        ws.merge_cells('D5:F6')
+        assert ws.max_row == 6
+
+
     def test_squared_range(self, Worksheet):
         ws = Worksheet(Workbook())
         expected = [
@@ -142,6 +164,33 @@ class TestWorksheet:
             assert tuple(c.coordinate for c in row) == coord
 
 
+    def test_iter_rows_values_only(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['A1'] = 1
+        ws['C2'] = "text"
+        ws['B3'] = datetime.date(2015, 6, 1)
+        rows = list(ws.iter_rows('A1:C3', values_only=True))
+        assert rows == [
+            (1, None, None),
+            (None, None, "text"),
+            (None, datetime.datetime(2015, 6, 1), None),
+        ]
+        assert len(ws._cells) == 3
+
+
+    def test_iter_rows_selection(self, Worksheet):
+        ws = Worksheet(Workbook())
+        for idx in range(1, 5):
+            ws.append([idx, None, idx * 10])
+        rows = ws.iter_rows(columns=['C', 1], predicate=lambda v: v > 20,
+                            key_column='C', values_only=True)
+        assert list(rows) == [(30, 3), (40, 4)]
+        assert len(ws._cells) == 12
+
+        rows = ws.iter_rows('A2:C3', columns=[3])
+        assert [row[0].coordinate for row in rows] == ['C2', 'C3']
+
+
     def test_worksheet(self, Worksheet, recwarn):
         ws = Worksheet(Workbook())
         rows = ws.range("A1:D4")
@@ -276,6 +325,30 @@ class TestWorksheet:
         assert ws.max_row == 0
 
 
+    @pytest.mark.numpy_required
+    def test_write_block(self, Worksheet):
+        import numpy
+        wb = Workbook()
+        ws = Worksheet(wb)
+        ws.append([1])
+        ws.write_block(numpy.array([[1.5, numpy.nan], [2, 3]]))
+        assert ws['A2'].value == 1.5
+        assert ws['A2'].data_type == 'n'
+        assert ws['B3'].value == 3
+        assert ws._cells.get((2, 2)) is None
+        assert ws.max_row == 3
+
+        ws.write_block({'name': numpy.array(['a', 'b'])}, row=1, column=4)
+        assert ws['D1'].value == 'name'
+        assert ws['D3'].value == 'b'
+        assert ws['D3'].data_type == 's'
+        assert 'b' not in wb.shared_strings
+        assert ws.max_column == 4
+
+        with pytest.raises(ValueError):
+            ws.write_block(numpy.array([[1.5, numpy.inf]]))
+
+
     def test_append_range(self, Worksheet):
         ws = Worksheet(Workbook())
         ws.append(range(30))
@@ -449,7 +522,7 @@ class TestWorksheet:
         ws['D4'] = 16
         ws.merge_cells(range_string="A1:D4")
         assert ws._merged_cells == ["A1:D4"]
-        assert 'D4' not in ws._cells
+        assert (4, 4) not in ws._cells
 
 
     def test_merge_coordinate(self, Worksheet):
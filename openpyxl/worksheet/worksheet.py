@@ -16,7 +16,8 @@ from openpyxl.compat import (
     basestring,
     iteritems,
     deprecated,
-    safe_string
+    safe_string,
+    NUMPY,
 )
 
 # package imports
@@ -49,6 +50,7 @@ from .header_footer import HeaderFooter
 from .relationship import Relationship
 from .page import PageSetup, PageMargins, PrintOptions
 from .dimensions import ColumnDimension, RowDimension, DimensionHolder
+from .block import block_columns
 from .protection import SheetProtection
 from .filters import AutoFilter
 from .views import SheetView, Pane, Selection
@@ -62,6 +64,13 @@ def flatten(results):
         yield(c.value for c in row)
 
 
+def _column_index(column):
+    """Index of a column given as a letter or an index"""
+    if isinstance(column, basestring):
+        return column_index_from_string(column.upper())
+    return column
+
+
 class Worksheet(object):
     """Represents a worksheet.
 
@@ -104,11 +113,16 @@ class Worksheet(object):
             self.title = 'Sheet%d' % (1 + len(self._parent.worksheets))
         else:
             self.title = title
-        self.row_dimensions = {}
+        self.row_dimensions = DimensionHolder(worksheet=self,
+                                              direction=[],
+                                              default_factory=RowDimension)
         self.column_dimensions = DimensionHolder(worksheet=self,
                                                  direction=[])
         self.page_breaks = []
         self._cells = {}
+        # bounds of the cells and rows in use, 0 when there are none
+        self._min_row = self._max_row = 0
+        self._min_col = self._max_col = 0
         self._styles = {}
         self._charts = []
         self._images = []
@@ -346,28 +360,27 @@ class Worksheet(object):
                 msg = "You have to provide a value either for " \
                     "'coordinate' or for 'row' *and* 'column'"
                 raise InsufficientCoordinatesException(msg)
-            else:
-                column = get_column_letter(column)
-                coordinate = '%s%s' % (column, row)
         else:
-            coordinate = coordinate.upper().replace('$', '')
+            column, row = coordinate_from_string(coordinate.replace('$', ''))
+            column = column_index_from_string(column)
 
-        cell = self._get_cell(coordinate)
+        cell = self._get_cell(row, column)
         if value is not None:
             cell.value = value
         return cell
 
 
-    def _get_cell(self, coordinate):
+    def _get_cell(self, row, column):
         """
         Internal method for getting a cell from a worksheet.
         Will create a new cell if one doesn't already exist.
         """
-        coordinate = coordinate.upper()
-        if not coordinate in self._cells:
-            column, row = coordinate_from_string(coordinate)
-            self._new_cell(column, row)
-        return self._cells[coordinate]
+        key = (row, column)
+        try:
+            return self._cells[key]
+        except KeyError:
+            self._add_cell(Cell(self, row=row, col_idx=column))
+            return self._cells[key]
 
 
     def _new_cell(self, column, row, value=None):
@@ -379,14 +392,27 @@ class Worksheet(object):
         """
         Internal method for adding cell objects.
         """
-        column = cell.column
         row = cell.row
-        self._cells[cell.coordinate] = cell
-        if column not in self.column_dimensions:
-            self.column_dimensions[column] = ColumnDimension(index=column, worksheet=self)
-        if row not in self.row_dimensions:
-            self.row_dimensions[row] = RowDimension(index=row, worksheet=self)
-        self._cells[cell.coordinate] = cell
+        col_idx = cell.col_idx
+        self._track_row(row)
+        self._track_column(col_idx)
+        self._cells[(row, col_idx)] = cell
+
+
+    def _track_row(self, row):
+        """Extend the bounds of the worksheet to the row"""
+        if row > self._max_row:
+            self._max_row = row
+        if row < self._min_row or not self._min_row:
+            self._min_row = row
+
+
+    def _track_column(self, col_idx):
+        """Extend the bounds of the worksheet to the column"""
+        if col_idx > self._max_col:
+            self._max_col = col_idx
+        if col_idx < self._min_col or not self._min_col:
+            self._min_col = col_idx
 
 
     def __getitem__(self, key):
@@ -395,7 +421,7 @@ class Worksheet(object):
             return self.iter_rows("{0}:{1}".format(key.start, key.stop))
         if ":" in key:
             return self.iter_rows(key)
-        return self._get_cell(key)
+        return self.cell(coordinate=key)
 
     def __setitem__(self, key, value):
         self[key].value = value
@@ -405,17 +431,11 @@ class Worksheet(object):
 
         :rtype: int
         """
-        if self.row_dimensions:
-            return max(self.row_dimensions)
-        else:
-            return 0
+        return self._max_row
 
     @property
     def min_row(self):
-        if self.row_dimensions:
-            return min(self.row_dimensions)
-        else:
-            return 1
+        return self._min_row or 1
 
     @property
     def max_row(self):
@@ -426,19 +446,11 @@ class Worksheet(object):
 
         :rtype: int
         """
-        if self.column_dimensions:
-            return max([column_index_from_string(column_index)
-                        for column_index in self.column_dimensions])
-        else:
-            return 1
+        return self._max_col or 1
 
     @property
     def min_col(self):
-        if self.column_dimensions:
-            return max([column_index_from_string(column_index)
-                        for column_index in self.column_dimensions])
-        else:
-            return 1
+        return self._min_col or 1
 
     @property
     def max_column(self):
@@ -458,7 +470,9 @@ class Worksheet(object):
         return self.calculate_dimension()
 
 
-    def iter_rows(self, range_string=None, row_offset=0, column_offset=0):
+    def iter_rows(self, range_string=None, row_offset=0, column_offset=0,
+                  values_only=False, columns=None, key_column=None,
+                  predicate=None):
         """
         Returns a squared range based on the `range_string` parameter,
         using generators.
@@ -473,6 +487,18 @@ class Worksheet(object):
         :param column_offset: additonal columns (e.g. 3)
         :type column: int
 
+        :param values_only: return the values of the cells instead of the cells
+        :type values_only: bool
+
+        :param columns: only return these columns, in this order (e.g. ['A', 'D'] or [1, 4])
+        :type columns: list
+
+        :param key_column: column whose value is passed to the predicate, by default the first one returned
+        :type key_column: string or int
+
+        :param predicate: rows are only returned if this is true for the value of their key column
+        :type predicate: callable
+
         :rtype: generator
         """
         if range_string is not None:
@@ -483,14 +509,48 @@ class Worksheet(object):
             max_col += column_offset
         if max_row is not None:
             max_row += row_offset
-        return self.get_squared_range(min_col + column_offset,
-                                      min_row + row_offset,
-                                      max_col,
-                                      max_row)
+        min_col += column_offset
+        min_row += row_offset
+        if columns is None and predicate is None:
+            return self.get_squared_range(min_col, min_row, max_col, max_row,
+                                          values_only)
+
+        if columns is None:
+            if max_col is None:
+                raise ValueError("Columns must be given for worksheets of unknown size")
+            columns = range(min_col, max_col + 1)
+        columns = [_column_index(col) for col in columns]
+        if key_column is None:
+            key_column = columns[0]
+        return self._iter_selection(min_row, max_row, columns,
+                                    _column_index(key_column), predicate,
+                                    values_only)
+
+
+    def _iter_selection(self, min_row, max_row, columns, key_column,
+                        predicate, values_only):
+        """
+        Rows of a set of columns for which the predicate, if any, is true
+        for the value of the key column
+        """
+        get = self._cells.get
+        for row in range(min_row, max_row + 1):
+            if predicate is not None:
+                cell = get((row, key_column))
+                if not predicate(cell.value if cell is not None else None):
+                    continue
+            if values_only:
+                cells = (get((row, col)) for col in columns)
+                yield tuple(cell.value if cell is not None else None
+                            for cell in cells)
+            else:
+                yield tuple(self._get_cell(row, col) for col in columns)
 
 
-    def get_squared_range(self, min_col, min_row, max_col, max_row):
-        """Returns a 2D array of cells
+    def get_squared_range(self, min_col, min_row, max_col, max_row,
+                          values_only=False):
+        """Returns a 2D array of cells, or of their values with `values_only`.
+        Missing cells are created unless only values are returned.
 
         :param min_col: smallest column index (1-based index)
         :type min_col: int
@@ -504,15 +564,32 @@ class Worksheet(object):
         :param max_row: smallest row index (1-based index)
         :type max_row: int
 
+        :param values_only: return the values of the cells instead of the cells
+        :type values_only: bool
+
         :rtype: generator
         """
-        # Column name cache is very important in large files.
-        cache = dict((col, get_column_letter(col)) for col in range(min_col, max_col + 1))
+        if values_only:
+            for row in self._iter_values(min_col, min_row, max_col, max_row):
+                yield row
+            return
         for row in range(min_row, max_row + 1):
-            yield tuple(self._get_cell('%s%d' % (cache[col], row))
+            yield tuple(self._get_cell(row, col)
                         for col in range(min_col, max_col + 1))
 
 
+    def _iter_values(self, min_col, min_row, max_col, max_row):
+        """Values of a range, cells are only looked up"""
+        get = self._cells.get
+        columns = range(min_col, max_col + 1)
+        for row in range(min_row, max_row + 1):
+            values = []
+            for col in columns:
+                cell = get((row, col))
+                values.append(cell.value if cell is not None else None)
+            yield tuple(values)
+
+
     def get_named_range(self, range_string):
         """
         Returns a 2D array of cells, with optional row and column offsets.
@@ -674,8 +751,10 @@ class Worksheet(object):
         cells = cells_from_range(range_string)
         # only the top-left cell is preserved
         for c in islice(chain.from_iterable(cells), 1, None):
-            if c in self._cells:
-                del self._cells[c]
+            column, row = coordinate_from_string(c)
+            key = (row, column_index_from_string(column))
+            if key in self._cells:
+                del self._cells[key]
 
 
     @property
@@ -739,17 +818,15 @@ class Worksheet(object):
         if (isinstance(iterable, (list, tuple, range))
             or isgenerator(iterable)):
             for col_idx, content in enumerate(iterable, 1):
-                col = get_column_letter(col_idx)
                 if isinstance(content, Cell):
                     # compatible with write-only mode
                     cell = content
                     cell.parent = self
-                    cell.column = col
+                    cell.col_idx = col_idx
                     cell.row = row_idx
-                    cell.coordinate = "%s%s" % (col, row_idx)
-                    self._add_cell(cell)
                 else:
-                    cell = self._new_cell(col, row_idx, content)
+                    cell = Cell(self, row=row_idx, col_idx=col_idx, value=content)
+                self._add_cell(cell)
 
         elif isinstance(iterable, dict):
             for col_idx, content in iteritems(iterable):
@@ -759,7 +836,57 @@ class Worksheet(object):
 
         else:
             self._invalid_row(iterable)
-        self.row_dimensions[row_idx] = RowDimension(worksheet=self, index=row_idx)
+        self._track_row(row_idx)
+
+    def write_block(self, block, row=None, column=1):
+        """
+        Write a 2D NumPy array, or a dict of columns with their names as a
+        header, as a rectangular block with its top left cell at the row and
+        column. By default the block is written below the last row.
+
+        Columns of numbers, booleans or strings are converted in one pass.
+        Missing values (masked, NaN or None) are left empty and infinities
+        raise a ValueError.
+        """
+        if not NUMPY:
+            raise ImportError("You must install numpy to write blocks")
+        guess_types = getattr(self.parent, '_guess_types', False)
+        header, columns = block_columns(block, self.encoding, guess_types,
+                                        self.parent.excel_base_date)
+
+        if row is None:
+            row = self.max_row + 1
+        if header is not None:
+            for col_idx, value in enumerate(header, column):
+                self.cell(row=row, column=col_idx, value=value)
+            row += 1
+
+        cells = self._cells
+        height = 0
+        for col_idx, col in enumerate(columns, column):
+            data_type = col.data_type
+            missing = col.missing
+            if missing is not None:
+                missing = missing.tolist()
+
+            height = len(col.values)
+            for row_idx, value in enumerate(col.values, row):
+                if missing is not None and missing[row_idx - row]:
+                    continue
+                if data_type is None:
+                    cell = Cell(self, row=row_idx, col_idx=col_idx, value=value)
+                else:
+                    cell = Cell(self, row=row_idx, col_idx=col_idx)
+                    cell._value = value
+                    cell.data_type = data_type
+                    if col.number_format is not None:
+                        cell.number_format = col.number_format
+                cells[(row_idx, col_idx)] = cell
+            self._track_column(col_idx)
+
+        if height:
+            self._track_row(row)
+            self._track_row(row + height - 1)
 
     def _invalid_row(self, iterable):
         raise TypeError('Value must be a list, tuple, range or generator, or a dict. Supplied value is {0}'.format(
@@ -0,0 +1,359 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Write members of a zip archive as a stream.
+
+From Python 3.6 members can be opened for writing and are compressed as they
+are written, otherwise they are buffered and added when they are closed.
+
+An `ArchiveWriter` can also choose the compression level of each member from
+its path and compress members in a pool of threads. Members are then cut
+into blocks which are deflated separately and joined, so that large
+worksheets are compressed in parallel as well. Blocks are written to the
+archive in order as soon as they are compressed.
+"""
+
+import sys
+import time
+import zipfile
+import zlib
+from collections import deque
+from fnmatch import fnmatch
+from io import BytesIO
+from multiprocessing.pool import ThreadPool
+from zipfile import ZipInfo, ZIP_STORED, ZIP_DEFLATED, LargeZipFile
+
+from openpyxl.compat import range
+
+STREAMING = sys.version_info >= (3, 6)
+
+DEFAULT_LEVEL = zlib.Z_DEFAULT_COMPRESSION
+BLOCK_SIZE = 2**20
+
+
+class BufferedMember(BytesIO):
+    """
+    Member kept in memory until it is closed
+    """
+
+    def __init__(self, archive, info):
+        super(BufferedMember, self).__init__()
+        self.archive = archive
+        self.info = info
+
+    def close(self):
+        if not self.closed:
+            self.archive.writestr(self.info, self.getvalue())
+        super(BufferedMember, self).close()
+
+
+def _member_info(arcname, compress_type):
+    info = ZipInfo(arcname, date_time=time.localtime(time.time())[:6])
+    info.compress_type = compress_type
+    info.external_attr = 0o600 << 16
+    return info
+
+
+def open_member(archive, arcname):
+    """
+    Return a binary file-like object writing a member of the archive.
+    It must be closed before anything else is written to the archive.
+    """
+    if isinstance(archive, ArchiveWriter):
+        return archive.open(arcname)
+    info = _member_info(arcname, archive.compression)
+    if STREAMING:
+        # the size is not known in advance, make room for a large member
+        return archive.open(info, 'w', force_zip64=archive._allowZip64)
+    return BufferedMember(archive, info)
+
+
+# ZipFile has no public way of adding data which is already compressed, so
+# members are added the way ZipFile.writestr() adds them. This only differs
+# between versions in what is handled below: Python 2.6 works out the ZIP64
+# fields from the sizes, 3.5 added start_dir and unseekable files and 3.6
+# refuses writes while a member is open.
+
+def _file_header(info, zip64):
+    if sys.version_info < (2, 7):
+        return info.FileHeader()
+    return info.FileHeader(zip64)
+
+
+def can_rewrite(archive):
+    """
+    Whether the header of a member can be written before its data and
+    completed afterwards
+    """
+    return sys.version_info >= (2, 7) and getattr(archive, '_seekable', True)
+
+
+def needs_zip64(info):
+    return (info.file_size > zipfile.ZIP64_LIMIT
+            or info.compress_size > zipfile.ZIP64_LIMIT)
+
+
+def start_raw(archive, info, zip64):
+    """
+    Write the header of a member whose data is compressed already. If the
+    CRC and sizes of the info are not known yet the header is rewritten by
+    `end_raw()`.
+    """
+    if getattr(archive, '_writing', False):
+        raise ValueError("A member of the archive is open for writing")
+    if zip64 and not archive._allowZip64:
+        raise LargeZipFile("Filesize would require ZIP64 extensions")
+    fp = archive.fp
+    if getattr(archive, 'start_dir', None) is not None and can_rewrite(archive):
+        fp.seek(archive.start_dir)
+    info.header_offset = fp.tell()
+    archive._writecheck(info)
+    archive._didModify = True
+    fp.write(_file_header(info, zip64))
+
+
+def end_raw(archive, info, zip64, rewrite=False):
+    """
+    Add a member once its data has been written, rewriting the header with
+    the CRC and sizes of the info
+    """
+    if not zip64 and needs_zip64(info):
+        raise LargeZipFile("Filesize would require ZIP64 extensions")
+    fp = archive.fp
+    if rewrite:
+        end = fp.tell()
+        fp.seek(info.header_offset)
+        fp.write(_file_header(info, zip64))
+        fp.seek(end)
+    if getattr(archive, 'start_dir', None) is not None:
+        archive.start_dir = fp.tell()
+    archive.filelist.append(info)
+    archive.NameToInfo[info.filename] = info
+
+
+def write_raw(archive, info, blocks):
+    """
+    Add a member whose data has already been compressed. The CRC and sizes
+    of the info must be set.
+    """
+    zip64 = needs_zip64(info)
+    start_raw(archive, info, zip64)
+    for data in blocks:
+        archive.fp.write(data)
+    end_raw(archive, info, zip64)
+
+
+def _deflate(data, level, last):
+    """
+    Raw deflate stream of a block. All but the last block end on a byte
+    boundary so that they can be joined.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    data = compressor.compress(data)
+    if last:
+        return data + compressor.flush()
+    return data + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+class _Done(object):
+    """Result of a block compressed in the calling thread"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def ready(self):
+        return True
+
+    def get(self):
+        return self.value
+
+
+class CompressedMember(object):
+    """
+    Binary file-like object compressing a member block by block.
+    `blocks` holds the blocks which have not been written to the archive.
+    """
+
+    def __init__(self, writer, info, level):
+        self.writer = writer
+        self.info = info
+        info.CRC = info.file_size = info.compress_size = 0
+        self.level = level
+        self.blocks = deque()
+        self.started = False
+        self.closed = False
+        self._buffer = []
+        self._buffered = 0
+        self._size = 0
+        self._crc = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write(self, data):
+        self._buffer.append(data)
+        self._buffered += len(data)
+        if self._buffered >= BLOCK_SIZE:
+            self._flush(False)
+            self.writer._drain()
+
+    def _flush(self, last):
+        data = b"".join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        self._size += len(data)
+        self._crc = zlib.crc32(data, self._crc) & 0xffffffff
+        if self.info.compress_type == ZIP_STORED:
+            self.blocks.append(_Done(data))
+        else:
+            self.blocks.append(self.writer._compress(data, self.level, last))
+
+    def close(self):
+        if self.closed:
+            return
+        self._flush(True)
+        self.info.file_size = self._size
+        self.info.CRC = self._crc
+        self.closed = True
+        self.writer._drain()
+
+    def ready(self):
+        return self.closed and all(block.ready() for block in self.blocks)
+
+
+class ArchiveWriter(object):
+    """
+    Add members to a zip archive in order.
+
+    `levels` maps path patterns such as 'xl/worksheets/*' to zlib
+    compression levels; the most specific pattern matching a member is used
+    and level 0 stores the member. With `threads` members are compressed in
+    a pool of threads, zlib releases the GIL while it compresses.
+    """
+
+    def __init__(self, archive, levels=None, threads=None):
+        self.archive = archive
+        self.levels = levels or {}
+        self.threads = threads
+        self.pool = None
+        if threads:
+            self.pool = ThreadPool(threads)
+        self._pending = deque()
+        self._running = deque()
+
+    def level(self, arcname):
+        """Compression level of a member"""
+        matches = [pattern for pattern in self.levels if fnmatch(arcname, pattern)]
+        if not matches:
+            return DEFAULT_LEVEL
+        return self.levels[max(matches, key=len)]
+
+    def _compress(self, data, level, last):
+        if self.pool is None:
+            return _Done(_deflate(data, level, last))
+        running = self._running
+        while running and running[0].ready():
+            running.popleft()
+        # limit the uncompressed blocks held in memory
+        if len(running) >= 2 * self.threads:
+            running.popleft().wait()
+        result = self.pool.apply_async(_deflate, (data, level, last))
+        running.append(result)
+        return result
+
+    def _direct(self, level):
+        """Whether members can be left to the archive"""
+        return (self.pool is None and level == DEFAULT_LEVEL
+                and self.archive.compression == ZIP_DEFLATED)
+
+    def open(self, arcname):
+        """Return a binary file-like object writing a member"""
+        level = self.level(arcname)
+        if self._direct(level):
+            self.finish()
+            return open_member(self.archive, arcname)
+        compress_type = ZIP_DEFLATED
+        if level == 0 or self.archive.compression == ZIP_STORED:
+            compress_type = ZIP_STORED
+        member = CompressedMember(self, _member_info(arcname, compress_type),
+                                  level)
+        self._pending.append(member)
+        return member
+
+    def writestr(self, arcname, data):
+        if self._direct(self.level(arcname)):
+            self.finish()
+            self.archive.writestr(arcname, data)
+            return
+        if not isinstance(data, bytes):
+            data = data.encode("utf-8")
+        with self.open(arcname) as member:
+            for start in range(0, len(data), BLOCK_SIZE):
+                member.write(data[start:start + BLOCK_SIZE])
+
+    def write(self, filename, arcname):
+        if self._direct(self.level(arcname)):
+            self.finish()
+            self.archive.write(filename, arcname)
+            return
+        with open(filename, 'rb') as src:
+            with self.open(arcname) as member:
+                for data in iter(lambda: src.read(BLOCK_SIZE), b""):
+                    member.write(data)
+
+    def _drain(self):
+        """
+        Write the compressed blocks at the front of the queue and add the
+        members which are complete. The header of a member whose size is
+        not known yet is written with room for ZIP64 sizes and completed
+        when it is added.
+        """
+        archive = self.archive
+        while self._pending:
+            member = self._pending[0]
+            info = member.info
+            blocks = member.blocks
+            if not member.started:
+                if member.ready():
+                    blocks = [block.get() for block in blocks]
+                    info.compress_size = sum(len(block) for block in blocks)
+                    write_raw(archive, info, blocks)
+                    self._pending.popleft()
+                    continue
+                if not (blocks and blocks[0].ready() and can_rewrite(archive)):
+                    break
+                start_raw(archive, info, archive._allowZip64)
+                member.started = True
+
+            while blocks and blocks[0].ready():
+                data = blocks.popleft().get()
+                info.compress_size += len(data)
+                archive.fp.write(data)
+            if not member.ready():
+                break
+            end_raw(archive, info, archive._allowZip64, rewrite=True)
+            self._pending.popleft()
+
+    def finish(self):
+        """Wait for all members to be added to the archive"""
+        while self._pending:
+            member = self._pending[0]
+            if not member.closed:
+                raise ValueError("Member %s has not been closed" % member.info.filename)
+            for block in member.blocks:
+                block.get()
+            self._drain()
+
+    def close(self):
+        """Add all pending members, the archive itself is left open"""
+        try:
+            self.finish()
+        finally:
+            if self.pool is not None:
+                self.pool.close()
+                self.pool.join()
+                self.pool = None
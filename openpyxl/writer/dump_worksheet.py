@@ -7,24 +7,44 @@ from __future__ import absolute_import
 from fileinput import FileInput
 from inspect import isgenerator
 import os
-from tempfile import NamedTemporaryFile
+from shutil import copyfileobj
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
+from zipfile import ZipFile, ZIP_DEFLATED
 import atexit
 
-from openpyxl.compat import OrderedDict
+from openpyxl.compat import OrderedDict, NUMERIC_TYPES, range, unicode, zip
 from openpyxl.cell import get_column_letter, Cell
+from openpyxl.cell.cell import ERROR_CODES, ILLEGAL_CHARACTERS_RE
 from openpyxl.worksheet import Worksheet
+from openpyxl.worksheet.block import is_block, block_columns
 from openpyxl.worksheet.properties import write_sheetPr
 
-from openpyxl.utils.exceptions import WorkbookAlreadySaved
+from openpyxl.utils.exceptions import (
+    WorkbookAlreadySaved,
+    IllegalCharacterError,
+)
 from openpyxl.writer.excel import ExcelWriter
+from openpyxl.writer.archive import ArchiveWriter, open_member, BLOCK_SIZE
 from openpyxl.writer.comments import CommentWriter
 from .relations import write_rels
+from .sheet_data import (
+    ColumnPrefixes,
+    ROWS_PER_WRITE,
+    NUMERIC_CELL,
+    BOOL_CELL,
+    STRING_CELL,
+    INLINE_STRING_CELL,
+    STYLED_INLINE_STRING_CELL,
+    inline_text,
+)
 from .worksheet import (
     write_autofilter,
     write_datavalidation,
     write_cell,
     write_cols,
     write_format,
+    WORKSHEET_START,
+    WORKSHEET_END,
 )
 from openpyxl.xml.constants import (
     PACKAGE_WORKSHEETS,
@@ -34,10 +54,34 @@ from openpyxl.xml.constants import (
     MAX_ROW,
     PACKAGE_XL
 )
-from openpyxl.xml.functions import tostring, xmlfile, Element, SubElement
+from openpyxl.xml.functions import tostring, Element
 
 
 DESCRIPTORS_CACHE_SIZE = 50
+
+# cells of typed block columns, completed with str.format by the row and
+# the value
+BLOCK_CELL = {
+    'n': '%s{0}" t="n"><v>{%d:.16g}</v></c>',
+    'b': '%s{0}" t="b"><v>{%d:d}</v></c>',
+    's': '%s{0}" t="s"><v>{%d:d}</v></c>',
+    'inlineStr': '%s{0}" t="inlineStr"><is>{%d}</is></c>',
+}
+STYLED_NUMERIC_BLOCK_CELL = '%s{0}" s="%d" t="n"><v>{%d:.16g}</v></c>'
+
+
+def _block_cell(kind, prefix, style_id, field):
+    """Template of a cell of a block, its value is the given field"""
+    if style_id is None:
+        return BLOCK_CELL[kind] % (prefix, field)
+    return STYLED_NUMERIC_BLOCK_CELL % (prefix, style_id, field)
+
+STRING_MODES = ('shared', 'inline', 'hybrid')
+
+FAST_TYPES = dict((t, 'n') for t in NUMERIC_TYPES)
+FAST_TYPES[bool] = 'b'
+FAST_TYPES[unicode] = 's'
+FAST_TYPES[str] = 's'
 ALL_TEMP_FILES = []
 
 
@@ -58,9 +102,9 @@ class CommentParentCell(object):
         self.column = cell.column
 
 
-def create_temporary_file(suffix=''):
+def create_temporary_file(suffix='', dir=None):
     fobj = NamedTemporaryFile(mode='w+', suffix=suffix,
-                              prefix='openpyxl.', delete=False)
+                              prefix='openpyxl.', delete=False, dir=dir)
     filename = fobj.name
     ALL_TEMP_FILES.append(filename)
     return filename
@@ -76,10 +120,24 @@ class DumpWorksheet(Worksheet):
     Optimised to reduce memory by writing rows just in time
     Cells can be styled and have comments
     Styles for rows and columns must be applied before writing cells
+
+    Strings are shared by default, which keeps all distinct strings in
+    memory until the workbook is saved. With `string_mode` "inline" they are
+    written in the cells instead; with "hybrid" only the first
+    `max_shared_strings` distinct strings of each column are shared.
+
+    Rows are written to a temporary file in `temp_dir` until the workbook
+    is saved. Worksheets up to `spool_size` bytes are kept in memory
+    instead. Worksheets of a workbook opened with `stream_to()` are written
+    directly into the archive.
     """
 
     __saved = False
     writer = None
+    string_mode = 'shared'
+    max_shared_strings = 1000
+    temp_dir = None
+    spool_size = 0
 
     def __init__(self, parent_workbook, title):
         Worksheet.__init__(self, parent_workbook, title)
@@ -88,9 +146,14 @@ class DumpWorksheet(Worksheet):
         self._max_row = 0
         self._parent = parent_workbook
 
-        self._fileobj_name = create_temporary_file()
+        self._fileobj_name = None
+        self._fileobj = None
+        self._member = None
 
         self._comments = []
+        self._cell = WriteOnlyCell(self)  # reused for cells without style
+        self._prefixes = ColumnPrefixes()
+        self._distinct_strings = {}
 
 
     @property
@@ -98,46 +161,73 @@ class DumpWorksheet(Worksheet):
         return self._fileobj_name
 
 
+    @property
+    def closed(self):
+        return self.__saved
+
+
+    def _open_output(self):
+        """Binary file-like object receiving the xml of the worksheet"""
+        stream = getattr(self.parent, '_stream', None)
+        if stream is not None:
+            return stream.open_worksheet(self)
+        if self.spool_size:
+            self._fileobj = SpooledTemporaryFile(self.spool_size, dir=self.temp_dir)
+            return self._fileobj
+        self._fileobj_name = create_temporary_file(dir=self.temp_dir)
+        return open(self._fileobj_name, 'wb')
+
+
     def _write_header(self):
         """
-        Generator that creates the XML file and the sheet header
+        Generator that creates the XML file and the sheet header.
+        Rows are sent either as elements or as serialised xml
         """
 
-        with xmlfile(self.filename) as xf:
-            with xf.element("worksheet", xmlns=SHEET_MAIN_NS):
-
-                if self.sheet_properties:
-                    pr = write_sheetPr(self.sheet_properties)
-
-                xf.write(pr)
-                views = Element('sheetViews')
-                views.append(self.sheet_view.to_tree())
-                xf.write(views)
-                xf.write(write_format(self))
-
-                cols = write_cols(self)
-                if cols is not None:
-                    xf.write(cols)
-
-                with xf.element("sheetData"):
-                    try:
-                        while True:
-                            r = (yield)
-                            xf.write(r)
-                    except GeneratorExit:
-                        pass
-                if self.protection.sheet:
-                    prot = Element('sheetProtection', dict(self.protection))
-                    xf.write(prot)
-                af = write_autofilter(self)
-                if af is not None:
-                    xf.write(af)
-                dv = write_datavalidation(self)
-                if dv is not None:
-                    xf.write(dv)
-                if self._comments:
-                    comments = Element('legacyDrawing', {'{%s}id' % REL_NS: 'commentsvml'})
-                    xf.write(comments)
+        if self.string_mode not in STRING_MODES:
+            raise ValueError("String mode must be one of %s" % (STRING_MODES,))
+
+        out = self._open_output()
+        try:
+            out.write(WORKSHEET_START)
+
+            if self.sheet_properties:
+                out.write(tostring(write_sheetPr(self.sheet_properties)))
+            views = Element('sheetViews')
+            views.append(self.sheet_view.to_tree())
+            out.write(tostring(views))
+            out.write(tostring(write_format(self)))
+
+            cols = write_cols(self)
+            if cols is not None:
+                out.write(tostring(cols))
+
+            out.write(b'<sheetData>')
+            try:
+                while True:
+                    r = (yield)
+                    if not isinstance(r, bytes):
+                        r = tostring(r)
+                    out.write(r)
+            except GeneratorExit:
+                pass
+            out.write(b'</sheetData>')
+
+            if self.protection.sheet:
+                prot = Element('sheetProtection', dict(self.protection))
+                out.write(tostring(prot))
+            af = write_autofilter(self)
+            if af is not None:
+                out.write(tostring(af))
+            dv = write_datavalidation(self)
+            if dv is not None:
+                out.write(tostring(dv))
+            if self._comments:
+                out.write(b'<legacyDrawing r:id="commentsvml"/>')
+            out.write(WORKSHEET_END)
+        finally:
+            if out is not self._fileobj:
+                out.close()
 
     def close(self):
         if self.__saved:
@@ -148,59 +238,298 @@ class DumpWorksheet(Worksheet):
         self.writer.close()
         self.__saved = True
 
+    def _copy_to(self, archive, path):
+        """Add the xml of the worksheet to the archive"""
+        if self.filename is not None:
+            archive.write(self.filename, path)
+        elif self._fileobj is not None:
+            self._fileobj.seek(0)
+            with open_member(archive, path) as out:
+                copyfileobj(self._fileobj, out, BLOCK_SIZE)
+
     def _cleanup(self):
-        os.remove(self.filename)
+        if self.filename is not None:
+            os.remove(self.filename)
+        elif self._fileobj is not None:
+            self._fileobj.close()
 
     def append(self, row):
         """
         :param row: iterable containing values to append
         :type row: iterable
         """
-        if (not isgenerator(row) and
-            not isinstance(row, (list, tuple, range))
-            ):
-            self._invalid_row(row)
-        cell = WriteOnlyCell(self)  # singleton
+        self._write_rows([row])
 
-        self._max_row += 1
-        row_idx = self._max_row
+
+    def append_rows(self, rows):
+        """
+        Append several rows at once. Rows are serialised in batches which is
+        much faster than appending them one by one.
+
+        :param rows: iterable of rows, each as accepted by `append`
+        """
+        self._write_rows(rows)
+
+
+    def write_block(self, block):
+        """
+        Append a rectangular block of values: a sequence of rows which all
+        have the same length, a 2D NumPy array, or a dict of columns with
+        their names as a header.
+        """
+        if is_block(block):
+            guess_types = getattr(self.parent, '_guess_types', False)
+            header, columns = block_columns(block, self.encoding, guess_types,
+                                            self.parent.excel_base_date)
+            if header is not None:
+                self._write_rows([header])
+            self._write_columns(columns)
+            return
+
+        block = [tuple(row) for row in block]
+        if block:
+            width = len(block[0])
+            for row in block:
+                if len(row) != width:
+                    raise ValueError("All rows of a block must have the same length")
+        self._write_rows(block)
+
+
+    def _write_rows(self, rows):
         if self.writer is None:
             self.writer = self._write_header()
             next(self.writer)
 
-        el = Element("row", r='%d' % self._max_row)
+        buf = []
+        try:
+            for row in rows:
+                if (not isgenerator(row) and
+                    not isinstance(row, (list, tuple, range))
+                    ):
+                    self._invalid_row(row)
+                buf.append(self._encode_row(row))
+                if len(buf) == ROWS_PER_WRITE:
+                    self._send(buf)
+                    buf = []
+        finally:
+            if buf:
+                self._send(buf)
+
+
+    def _write_columns(self, columns):
+        """
+        Write converted columns. When all of them are typed, complete rows
+        are formatted with one template and the others cell by cell.
+        """
+        if not columns or any(col.data_type is None for col in columns):
+            self._write_rows(zip(*[self._column_values(col) for col in columns]))
+            return
 
-        col_idx = None
-        for col_idx, value in enumerate(row, 1):
-            if value is None:
-                continue
-            column = get_column_letter(col_idx)
+        if self.writer is None:
+            self.writer = self._write_header()
+            next(self.writer)
 
-            if isinstance(value, Cell):
-                cell = value
+        strings = self.parent.shared_strings
+        fields = []
+        cell_templates = []
+        templates = []
+        missing = None
+        for col_idx, col in enumerate(columns, 1):
+            kind = col.data_type
+            if kind != 's':
+                fields.append(col.values)
+            elif self._share_column(col):
+                fields.append(col.string_indices(strings))
             else:
-                cell.value = value
-
-            cell.coordinate = '%s%d' % (column, row_idx)
-            if cell.comment is not None:
-                comment = cell.comment
-                comment._parent = CommentParentCell(cell)
-                self._comments.append(comment)
-
-            tree = write_cell(self, cell)
-            el.append(tree)
-            if cell.has_style: # styled cell or datetime
+                kind = 'inlineStr'
+                texts = [inline_text(value) for value in col.strings] + [None]
+                fields.append([texts[idx] for idx in col.inverse.tolist()])
+            if col.missing is not None:
+                if missing is None:
+                    missing = col.missing.copy()
+                else:
+                    missing |= col.missing
+            prefix = self._column_prefix(col_idx)
+            style_id = None
+            if col.number_format is not None:
                 cell = WriteOnlyCell(self)
+                cell.number_format = col.number_format
+                style_id = cell.style_id
+            templates.append((kind, prefix, style_id))
+            cell_templates.append(_block_cell(kind, prefix, style_id, 1))
+        if missing is not None:
+            missing = missing.tolist()
+        width = len(columns)
+
+        row_start = '<row r="{0}" spans="1:%d">' % width
+        row_template = row_start + "".join(
+            _block_cell(kind, prefix, style_id, col_idx)
+            for col_idx, (kind, prefix, style_id) in enumerate(templates, 1)
+            ) + '</row>'
+        col_missing = [col.missing is not None and col.missing.tolist() or None
+                       for col in columns]
+
+        buf = []
+        for idx, values in enumerate(zip(*fields)):
+            self._max_row += 1
+            row_idx = self._max_row
+            if missing is None or not missing[idx]:
+                buf.append(row_template.format(row_idx, *values))
+            else:
+                cells = [row_start.format(row_idx)]
+                for col, template, value in zip(col_missing, cell_templates, values):
+                    if col is None or not col[idx]:
+                        cells.append(template.format(row_idx, value))
+                cells.append('</row>')
+                buf.append("".join(cells))
+            if len(buf) == ROWS_PER_WRITE:
+                self._send(buf)
+                buf = []
+        if buf:
+            self._send(buf)
+        self._max_col = max(self._max_col, width)
+
+
+    def _column_values(self, column):
+        """Values of a column to be written row by row"""
+        if column.number_format is None:
+            return column.values
+        missing = column.missing
+        if missing is not None:
+            missing = missing.tolist()
+        values = []
+        for idx, value in enumerate(column.values):
+            if missing is not None and missing[idx]:
+                values.append(None)
+                continue
+            cell = WriteOnlyCell(self, value)
+            cell.number_format = column.number_format
+            values.append(cell)
+        return values
 
-        if col_idx:
-            self._max_col = max(self._max_col, col_idx)
-            el.set('spans', '1:%d' % col_idx)
+
+    def _send(self, rows):
         try:
-            self.writer.send(el)
+            self.writer.send(u"".join(rows).encode("utf-8"))
         except StopIteration:
             self._already_saved()
 
 
+    def _share_string(self, col_idx, value):
+        """Whether a string of a column goes to the shared strings"""
+        mode = self.string_mode
+        if mode == 'shared':
+            return True
+        elif mode == 'inline':
+            return False
+        distinct = self._distinct_strings.get(col_idx)
+        if distinct is None:
+            distinct = self._distinct_strings[col_idx] = set()
+        if value in distinct:
+            return True
+        if len(distinct) < self.max_shared_strings:
+            distinct.add(value)
+            return True
+        return False
+
+
+    def _share_column(self, column):
+        """Whether the strings of a block column are shared"""
+        mode = self.string_mode
+        if mode == 'hybrid':
+            return len(column.strings) <= self.max_shared_strings
+        return mode == 'shared'
+
+
+    def _column_prefix(self, col_idx):
+        prefixes = self._prefixes
+        if col_idx >= len(prefixes):
+            prefixes.extend_to(col_idx)
+        return prefixes[col_idx]
+
+
+    def _encode_row(self, row):
+        """
+        Serialise a row. Numbers, booleans and plain strings are written using
+        templates, everything else goes through a cell.
+        """
+        self._max_row += 1
+        row_idx = '%d' % self._max_row
+        prefixes = self._prefixes
+        strings = self.parent.shared_strings
+        guess_types = getattr(self.parent, '_guess_types', False)
+        shared = self.string_mode == 'shared'
+        cells = []
+
+        col_idx = 0
+        for col_idx, value in enumerate(row, 1):
+            if value is None:
+                continue
+            if col_idx < len(prefixes):
+                prefix = prefixes[col_idx]
+            else:
+                prefix = self._column_prefix(col_idx)
+
+            kind = FAST_TYPES.get(type(value))
+            if kind == 'n':
+                cells.append(NUMERIC_CELL % (prefix, row_idx, value))
+                continue
+            elif kind == 'b':
+                cells.append(BOOL_CELL % (prefix, row_idx, value))
+                continue
+            elif (kind == 's' and not guess_types
+                  and not (len(value) > 1 and value.startswith("="))
+                  and value not in ERROR_CODES):
+                if not isinstance(value, unicode):
+                    value = unicode(value, self.encoding)
+                value = value[:32767]
+                if ILLEGAL_CHARACTERS_RE.search(value) is not None:
+                    raise IllegalCharacterError
+                if shared or self._share_string(col_idx, value):
+                    cells.append(STRING_CELL % (prefix, row_idx, strings.add(value)))
+                else:
+                    cells.append(INLINE_STRING_CELL % (prefix, row_idx, inline_text(value)))
+                continue
+
+            cells.append(self._encode_cell(value, col_idx))
+
+        if not col_idx:
+            return '<row r="%s"/>' % row_idx
+        self._max_col = max(self._max_col, col_idx)
+        return '<row r="%s" spans="1:%d">%s</row>' % (row_idx, col_idx, "".join(cells))
+
+
+    def _encode_cell(self, value, col_idx):
+        if isinstance(value, Cell):
+            cell = value
+        else:
+            cell = self._cell
+            cell.value = value
+
+        cell.col_idx = col_idx
+        cell.row = self._max_row
+        if cell.comment is not None:
+            comment = cell.comment
+            comment._parent = CommentParentCell(cell)
+            self._comments.append(comment)
+
+        value = cell._value
+        if (cell.data_type == 's' and value
+            and not self._share_string(col_idx, value)):
+            prefix = self._column_prefix(col_idx)
+            row_idx = '%d' % cell.row
+            if cell.has_style:
+                xml = STYLED_INLINE_STRING_CELL % (prefix, row_idx, cell.style_id,
+                                                   inline_text(value))
+            else:
+                xml = INLINE_STRING_CELL % (prefix, row_idx, inline_text(value))
+        else:
+            xml = tostring(write_cell(self, cell)).decode("utf-8")
+        if cell.has_style: # styled cell or datetime
+            self._cell = WriteOnlyCell(self)
+        return xml
+
+
     def _already_saved(self):
         raise WorkbookAlreadySaved('Workbook has already been saved and cannot be modified or saved anymore.')
 
@@ -220,14 +549,83 @@ setattr(DumpWorksheet, 'range', removed_method)
 setattr(DumpWorksheet, 'merge_cells', removed_method)
 
 
-def save_dump(workbook, filename):
+def save_dump(workbook, filename, compression=None, compress_threads=None):
     if workbook.worksheets == []:
         workbook.create_sheet()
-    writer = ExcelDumpWriter(workbook)
+    stream = workbook._stream
+    if stream is not None:
+        stream.save(workbook, filename, compression, compress_threads)
+        return True
+    writer = ExcelDumpWriter(workbook, compression=compression,
+                             compress_threads=compress_threads)
     writer.save(filename)
     return True
 
 
+class WorksheetStream(object):
+    """
+    Archive of a write-only workbook into which worksheets are written as
+    they are filled. Only one worksheet is written at a time: starting the
+    next one closes the previous one.
+    """
+
+    def __init__(self, filename, compression=None, compress_threads=None):
+        self.filename = filename
+        self.compression = compression
+        self.compress_threads = compress_threads
+        self.archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
+        self.writer = ArchiveWriter(self.archive, compression, compress_threads)
+        self.current = None
+        self.saved = False
+
+    def open_worksheet(self, ws):
+        if self.saved:
+            raise WorkbookAlreadySaved('Workbook has already been saved and cannot be modified or saved anymore.')
+        if self.current is not None and not self.current.closed:
+            self.current.close()
+        self.current = ws
+        idx = ws.parent.worksheets.index(ws) + 1
+        ws._member = PACKAGE_WORKSHEETS + '/sheet%d.xml' % idx
+        return open_member(self.writer, ws._member)
+
+    def save(self, workbook, filename, compression=None, compress_threads=None):
+        """Close the worksheets and add the other parts of the workbook"""
+        if self.saved:
+            raise WorkbookAlreadySaved('Workbook has already been saved and cannot be modified or saved anymore.')
+        if filename is not self.filename and filename != self.filename:
+            raise ValueError("A streamed workbook can only be saved to %s" % self.filename)
+        if compression is None:
+            compression = self.compression
+        if compress_threads is None:
+            compress_threads = self.compress_threads
+        try:
+            for ws in workbook.worksheets:
+                if not ws.closed:
+                    ws.close()
+            self.saved = True
+            self.writer.close()
+            writer = ExcelDumpWriter(workbook, compression=compression,
+                                     compress_threads=compress_threads)
+            writer.write_data(self.archive)
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Close the worksheet being written and the archive, which is left
+        without the other parts of the workbook unless it was saved
+        """
+        try:
+            if self.current is not None and not self.current.closed:
+                self.current.close()
+        finally:
+            self.saved = True
+            try:
+                self.writer.close()
+            finally:
+                self.archive.close()
+
+
 class DumpCommentWriter(CommentWriter):
     def extract_comments(self):
         for comment in self.sheet._comments:
@@ -244,9 +642,13 @@ class ExcelDumpWriter(ExcelWriter):
         vba_controls_id = 1
 
         for i, sheet in enumerate(self.workbook.worksheets, 1):
-            sheet.close()
-            archive.write(sheet.filename, PACKAGE_WORKSHEETS + '/sheet%d.xml' % i)
-            sheet._cleanup()
+            path = PACKAGE_WORKSHEETS + '/sheet%d.xml' % i
+            if sheet._member is None:
+                sheet.close()
+                sheet._copy_to(archive, path)
+                sheet._cleanup()
+            elif sheet._member != path:
+                raise ValueError("Worksheets cannot be moved once they are streamed")
 
             # write comments
             if sheet._comments:
@@ -3,13 +3,13 @@ from __future__ import absolute_import
 
 from openpyxl.compat import iterkeys, itervalues, safe_string
 
-from openpyxl.utils import COORD_RE, column_index_from_string
+from openpyxl.utils import COORD_RE
 from openpyxl.xml.functions import xmlfile, Element, SubElement
 
 
 def row_sort(cell):
-    """Translate column names for sorting."""
-    return column_index_from_string(cell.column)
+    """Sort cells by column index."""
+    return cell.col_idx
 
 
 def get_rows_to_write(worksheet):
@@ -40,10 +40,11 @@ def write_rows(xf, worksheet):
     with xf.element("sheetData"):
         for row_idx in sorted(cells_by_row):
             # row meta data
-            row_dimension = worksheet.row_dimensions[row_idx]
+            row_dimension = worksheet.row_dimensions.get(row_idx)
             attrs = {'r': '%d' % row_idx,
                      'spans': '1:%d' % worksheet.max_column}
-            attrs.update(dict(row_dimension))
+            if row_dimension is not None:
+                attrs.update(dict(row_dimension))
 
             with xf.element("row", attrs):
 
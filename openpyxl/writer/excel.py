@@ -6,6 +6,7 @@ from __future__ import absolute_import
 # Python stdlib imports
 from io import BytesIO
 from re import match
+from warnings import warn
 from zipfile import ZipFile, ZIP_DEFLATED
 
 # package imports
@@ -39,7 +40,12 @@ from openpyxl.writer.styles import StyleWriter
 from openpyxl.writer.drawings import DrawingWriter, ShapeWriter
 from openpyxl.charts.writer import ChartWriter
 from .relations import write_rels
-from openpyxl.writer.worksheet import write_worksheet
+from openpyxl.writer.worksheet import (
+    stream_worksheet,
+    render_worksheets,
+    can_fork
+    )
+from openpyxl.writer.archive import open_member, ArchiveWriter
 from openpyxl.workbook.names.external import (
     write_external_link,
     write_external_book_rel
@@ -53,13 +59,26 @@ ARC_VBA = ('xl/vba', r'xl/drawings/.*\.vml', 'xl/ctrlProps', 'customUI',
 class ExcelWriter(object):
     """Write a workbook object to an Excel file."""
 
-    def __init__(self, workbook):
+    def __init__(self, workbook, workers=None, compression=None,
+                 compress_threads=None):
         self.workbook = workbook
+        self.workers = workers
+        self.compression = compression
+        self.compress_threads = compress_threads
         self.style_writer = StyleWriter(workbook)
+        self._sources = {}
 
     def write_data(self, archive, as_template=False):
         """Write the various xml files into the zip archive."""
+        archive = ArchiveWriter(archive, self.compression, self.compress_threads)
+        try:
+            self._write_data(archive, as_template)
+        finally:
+            archive.close()
+
+    def _write_data(self, archive, as_template):
         # cleanup all worksheets
+        self._prepare_worksheets()
 
         archive.writestr(ARC_CONTENT_TYPES, write_content_types(self.workbook,
                                                                 as_template=as_template))
@@ -82,13 +101,29 @@ class ExcelWriter(object):
                         break
 
         for sheet in self.workbook.worksheets:
-            sheet.conditional_formatting._save_styles(self.workbook)
+            if id(sheet) not in self._sources:
+                sheet.conditional_formatting._save_styles(self.workbook)
 
         self._write_worksheets(archive)
         self._write_string_table(archive)
         self._write_external_links(archive)
         archive.writestr(ARC_STYLE, self.style_writer.write_table())
 
+    def _prepare_worksheets(self):
+        """
+        Worksheets which have been read lazily and not used since are copied
+        from the source, all others are loaded so that they can be written
+        """
+        self._sources = {}
+        for sheet in self.workbook.worksheets:
+            if getattr(sheet, 'loaded', True):
+                continue
+            xml = sheet.source_xml()
+            if xml is None:
+                sheet.load()
+            else:
+                self._sources[id(sheet)] = xml
+
     def _write_string_table(self, archive):
         archive.writestr(ARC_SHARED_STRINGS,
                 write_string_table(self.workbook.shared_strings))
@@ -109,10 +144,29 @@ class ExcelWriter(object):
         comments_id = 1
         vba_controls_id = 1
 
+        rendered = None
+        workers = self.workers
+        if workers and not can_fork():
+            if workers > 1:
+                warn("Worksheets can only be serialised in worker processes "
+                     "where processes are forked, saving them one by one")
+            workers = None
+        if workers:
+            indices = [idx for idx, sheet in enumerate(self.workbook.worksheets)
+                       if id(sheet) not in self._sources]
+            rendered = render_worksheets(self.workbook, indices, workers)
+
         for i, sheet in enumerate(self.workbook.worksheets):
-            archive.writestr(PACKAGE_WORKSHEETS + '/sheet%d.xml' % (i + 1),
-                             write_worksheet(sheet, self.workbook.shared_strings,
-                                             ))
+            path = PACKAGE_WORKSHEETS + '/sheet%d.xml' % (i + 1)
+            xml = self._sources.get(id(sheet))
+            if xml is not None:
+                archive.writestr(path, xml)
+                continue
+            if rendered is not None:
+                archive.writestr(path, next(rendered))
+            else:
+                with open_member(archive, path) as out:
+                    stream_worksheet(out, sheet)
             if (sheet._charts or sheet._images
                 or sheet.relationships
                 or sheet._comment_count > 0
@@ -178,11 +232,14 @@ class ExcelWriter(object):
     def save(self, filename, as_template=False):
         """Write data into the archive."""
         archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
-        self.write_data(archive, as_template=as_template)
-        archive.close()
+        try:
+            self.write_data(archive, as_template=as_template)
+        finally:
+            archive.close()
 
 
-def save_workbook(workbook, filename, as_template=False):
+def save_workbook(workbook, filename, as_template=False, workers=None,
+                  compression=None, compress_threads=None):
     """Save the given workbook on the filesystem under the name filename.
 
     :param workbook: the workbook to save
@@ -191,10 +248,19 @@ def save_workbook(workbook, filename, as_template=False):
     :param filename: the path to which save the workbook
     :type filename: string
 
+    :param workers: number of processes used to serialise worksheets, worksheets are serialised one after another by default and where processes cannot be forked
+    :type workers: int
+
+    :param compression: zlib compression levels by path pattern, eg. {'xl/worksheets/*': 1, 'xl/media/*': 0}
+    :type compression: dict
+
+    :param compress_threads: number of threads used to compress the archive
+    :type compress_threads: int
+
     :rtype: bool
 
     """
-    writer = ExcelWriter(workbook)
+    writer = ExcelWriter(workbook, workers, compression, compress_threads)
     writer.save(filename, as_template=as_template)
     return True
 
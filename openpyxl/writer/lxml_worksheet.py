@@ -47,10 +47,11 @@ def write_rows(xf, worksheet):
     with xf.element("sheetData"):
         for row_idx in sorted(cells_by_row):
             # row meta data
-            row_dimension = worksheet.row_dimensions[row_idx]
+            row_dimension = worksheet.row_dimensions.get(row_idx)
             attrs = {'r': '%d' % row_idx,
                      'spans': '1:%d' % worksheet.max_column}
-            attrs.update(dict(row_dimension))
+            if row_dimension is not None:
+                attrs.update(dict(row_dimension))
 
             with xf.element("row", attrs):
 
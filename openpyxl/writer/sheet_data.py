@@ -0,0 +1,178 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Serialise the rows of a worksheet straight to xml.
+
+Cells are formatted from one template per data type instead of building an
+element for each of them, and the rows are written in large chunks.
+"""
+
+from openpyxl.compat import safe_string, iterkeys, range, NUMERIC_TYPES
+from openpyxl.utils import get_column_letter, COORD_RE
+
+
+ROWS_PER_WRITE = 1000
+
+# templates for cells, completed by the column prefix ('<c r="A'), the row
+# and the value
+NUMERIC_CELL = '%s%s" t="n"><v>%.16g</v></c>'
+BOOL_CELL = '%s%s" t="b"><v>%d</v></c>'
+STRING_CELL = '%s%s" t="s"><v>%d</v></c>'
+INLINE_STRING_CELL = '%s%s" t="inlineStr"><is>%s</is></c>'
+# the same with a style
+STYLED_NUMERIC_CELL = '%s%s" s="%d" t="n"><v>%.16g</v></c>'
+STYLED_BOOL_CELL = '%s%s" s="%d" t="b"><v>%d</v></c>'
+STYLED_STRING_CELL = '%s%s" s="%d" t="s"><v>%d</v></c>'
+STYLED_INLINE_STRING_CELL = '%s%s" s="%d" t="inlineStr"><is>%s</is></c>'
+
+
+def escape(text):
+    """Escape text for an element or a double quoted attribute"""
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    if '"' in text:
+        text = text.replace('"', '&quot;')
+    return text
+
+
+def inline_text(value):
+    """Text element of an inline string"""
+    if value[:1].isspace() or value[-1:].isspace():
+        return '<t xml:space="preserve">%s</t>' % escape(value)
+    return '<t>%s</t>' % escape(value)
+
+
+class ColumnPrefixes(list):
+    """
+    Start of the cell element for each column, '<c r="A' for column 1
+    """
+
+    def __init__(self):
+        super(ColumnPrefixes, self).__init__([None])
+
+    def extend_to(self, col_idx):
+        for idx in range(len(self), col_idx + 1):
+            self.append('<c r="%s' % get_column_letter(idx))
+
+
+def _attributes(attrs):
+    return "".join(' %s="%s"' % (key, escape(safe_string(value)))
+                   for key, value in sorted(attrs.items()))
+
+
+def encode_cell(prefix, row, cell, strings, formula_attributes):
+    """
+    Return the xml for a cell, None for cells without value or style
+    """
+    value = cell._value
+    data_type = cell.data_type
+    style_id = None
+    if cell.has_style:
+        style_id = cell.style_id
+    elif value is None:
+        return
+
+    if data_type == 'n' and type(value) in NUMERIC_TYPES:
+        if style_id is None:
+            return NUMERIC_CELL % (prefix, row, value)
+        return STYLED_NUMERIC_CELL % (prefix, row, style_id, value)
+    elif data_type == 's' and value:
+        if style_id is None:
+            return STRING_CELL % (prefix, row, strings.add(value))
+        return STYLED_STRING_CELL % (prefix, row, style_id, strings.add(value))
+    elif data_type == 'b' and type(value) is bool:
+        if style_id is None:
+            return BOOL_CELL % (prefix, row, value)
+        return STYLED_BOOL_CELL % (prefix, row, style_id, value)
+
+    start = prefix + row
+    if style_id is not None:
+        start += '" s="%d' % style_id
+    if data_type != 'f':
+        start += '" t="%s' % data_type
+
+    if value is None or value == '':
+        return start + '"/>'
+
+    if data_type == 'f':
+        attrs = formula_attributes.get(cell.coordinate, {})
+        if attrs.get('t') == 'shared' and 'ref' not in attrs:
+            formula = '<f%s/>' % _attributes(attrs)
+        else:
+            formula = '<f%s>%s</f>' % (_attributes(attrs), escape(value[1:]))
+        return '%s">%s<v/></c>' % (start, formula)
+
+    return '%s"><v>%s</v></c>' % (start, escape(safe_string(value)))
+
+
+def iter_rows(worksheet):
+    """
+    Cells of the worksheet by row, in order, as lists of (column, cell).
+    Rows which only have a dimension are included.
+    """
+    # Ensure a blank cell exists if it has a style
+    for coord in iterkeys(worksheet._styles):
+        if isinstance(coord, str) and COORD_RE.search(coord):
+            worksheet.cell(coord)
+
+    cells = worksheet._cells
+    # integer keys sort in one pass, no need to sort the cells of each row
+    keys = sorted(cells)
+    dims = iter(sorted(worksheet.row_dimensions))
+    next_dim = next(dims, None)
+
+    idx = 0
+    count = len(keys)
+    while idx < count or next_dim is not None:
+        if idx < count:
+            row = keys[idx][0]
+        else:
+            row = next_dim
+        if next_dim is not None and next_dim <= row:
+            row = next_dim
+            next_dim = next(dims, None)
+        start = idx
+        while idx < count and keys[idx][0] == row:
+            idx += 1
+        yield row, [(key[1], cells[key]) for key in keys[start:idx]]
+
+
+def write_sheet_data(out, worksheet):
+    """
+    Write the sheetData element of a worksheet to a binary file-like object
+    """
+    strings = worksheet.parent.shared_strings
+    formula_attributes = worksheet.formula_attributes
+    row_dimensions = worksheet.row_dimensions
+    spans = '1:%d' % worksheet.max_column
+    prefixes = ColumnPrefixes()
+
+    out.write(b'<sheetData>')
+    buf = []
+    for row_idx, cells in iter_rows(worksheet):
+        row = '%d' % row_idx
+        attrs = ''
+        dim = row_dimensions.get(row_idx)
+        if dim is not None:
+            attrs = _attributes(dict(dim))
+        parts = ['<row r="%s" spans="%s"%s>' % (row, spans, attrs)]
+        for col_idx, cell in cells:
+            if col_idx >= len(prefixes):
+                prefixes.extend_to(col_idx)
+            xml = encode_cell(prefixes[col_idx], row, cell, strings,
+                              formula_attributes)
+            if xml is not None:
+                parts.append(xml)
+        parts.append('</row>')
+        buf.append("".join(parts))
+        if len(buf) == ROWS_PER_WRITE:
+            out.write("".join(buf).encode("utf-8"))
+            buf = []
+    if buf:
+        out.write("".join(buf).encode("utf-8"))
+    out.write(b'</sheetData>')
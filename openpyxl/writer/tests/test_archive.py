@@ -0,0 +1,107 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+
+import pytest
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_open_member(monkeypatch, streaming):
+    from .. import archive as module
+    if streaming and not module.STREAMING:
+        pytest.skip("Members can only be streamed from Python 3.6")
+    monkeypatch.setattr(module, "STREAMING", streaming)
+
+    buf = BytesIO()
+    archive = ZipFile(buf, "w", ZIP_DEFLATED)
+    with module.open_member(archive, "xl/worksheets/sheet1.xml") as out:
+        out.write(b"<worksheet>")
+        out.write(b"</worksheet>")
+    archive.writestr("other.xml", b"<other/>")
+    archive.close()
+
+    archive = ZipFile(buf)
+    info = archive.getinfo("xl/worksheets/sheet1.xml")
+    assert info.compress_type == ZIP_DEFLATED
+    assert archive.read(info) == b"<worksheet></worksheet>"
+    assert archive.namelist() == ["xl/worksheets/sheet1.xml", "other.xml"]
+
+
+def test_level():
+    from ..archive import ArchiveWriter, DEFAULT_LEVEL
+    writer = ArchiveWriter(None, {'xl/*': 9, 'xl/worksheets/*': 1})
+    assert writer.level("xl/worksheets/sheet1.xml") == 1
+    assert writer.level("xl/styles.xml") == 9
+    assert writer.level("[Content_Types].xml") == DEFAULT_LEVEL
+
+
+@pytest.mark.parametrize("threads", [None, 2])
+def test_archive_writer(monkeypatch, threads):
+    from .. import archive as module
+    monkeypatch.setattr(module, "BLOCK_SIZE", 10)
+
+    buf = BytesIO()
+    archive = ZipFile(buf, "w", ZIP_DEFLATED)
+    writer = module.ArchiveWriter(archive, {'*.png': 0, '*.xml': 1}, threads)
+    writer.writestr("image.png", b"0123456789" * 3)
+    with writer.open("xl/worksheets/sheet1.xml") as out:
+        for idx in range(10):
+            out.write(("<row>%d</row>" % idx).encode("ascii"))
+    writer.writestr("empty.xml", b"")
+    writer.writestr("other.txt", "text")
+    writer.close()
+    archive.close()
+
+    archive = ZipFile(buf)
+    assert archive.testzip() is None
+    assert archive.namelist() == ["image.png", "xl/worksheets/sheet1.xml",
+                                  "empty.xml", "other.txt"]
+    assert archive.getinfo("image.png").compress_type == ZIP_STORED
+    assert archive.read("image.png") == b"0123456789" * 3
+    sheet = "".join("<row>%d</row>" % idx for idx in range(10)).encode("ascii")
+    assert archive.read("xl/worksheets/sheet1.xml") == sheet
+    assert archive.read("empty.xml") == b""
+    assert archive.read("other.txt") == b"text"
+
+
+def test_stream_blocks(monkeypatch):
+    from .. import archive as module
+    monkeypatch.setattr(module, "BLOCK_SIZE", 10)
+
+    buf = BytesIO()
+    archive = ZipFile(buf, "w", ZIP_DEFLATED)
+    writer = module.ArchiveWriter(archive, {'*.xml': 1})
+    out = writer.open("sheet.xml")
+    for idx in range(100):
+        out.write(b"0123456789")
+    assert len(out.blocks) == 0
+    assert out.info.compress_size > 0
+    out.close()
+    writer.close()
+    archive.close()
+
+    archive = ZipFile(buf)
+    assert archive.testzip() is None
+    assert archive.read("sheet.xml") == b"0123456789" * 100
+
+
+@pytest.mark.parametrize("write_only", [False, True])
+@pytest.mark.parametrize("threads", [None, 2])
+def test_zip64(monkeypatch, tmpdir, write_only, threads):
+    import zipfile
+    from openpyxl import Workbook, load_workbook
+    from .. import archive as module
+    monkeypatch.setattr(zipfile, "ZIP64_LIMIT", 1000)
+    monkeypatch.setattr(module, "BLOCK_SIZE", 100)
+    tmpdir.chdir()
+    wb = Workbook(write_only=write_only)
+    ws = wb.create_sheet()
+    for idx in range(100):
+        ws.append([idx, "row %d" % idx])
+    wb.save("zip64.xlsx", compress_threads=threads)
+
+    ws = load_workbook("zip64.xlsx").worksheets[-1]
+    assert ws['A100'].value == 99
+    assert ws['B100'].value == "row 99"
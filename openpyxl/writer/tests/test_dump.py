@@ -6,7 +6,7 @@ import datetime
 import decimal
 from io import BytesIO
 
-from openpyxl.xml.functions import tostring, xmlfile
+from openpyxl.xml.functions import tostring
 
 from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.utils.datetime  import CALENDAR_WINDOWS_1900
@@ -40,6 +40,17 @@ class DummyWorkbook:
 
 
 
+def _writer(doc):
+    doc.write(b"<sheetData>")
+    try:
+        while True:
+            body = (yield)
+            doc.write(body)
+    except GeneratorExit:
+        pass
+    doc.write(b"</sheetData>")
+
+
 @pytest.fixture
 def DumpWorksheet():
     from .. dump_worksheet import DumpWorksheet
@@ -78,16 +89,6 @@ def test_write_header(DumpWorksheet):
 def test_append(DumpWorksheet):
     ws = DumpWorksheet
 
-    def _writer(doc):
-        with xmlfile(doc) as xf:
-            with xf.element('sheetData'):
-                try:
-                    while True:
-                        body = (yield)
-                        xf.write(body)
-                except GeneratorExit:
-                    pass
-
     doc = BytesIO()
     ws.writer = _writer(doc)
     next(ws.writer)
@@ -132,16 +133,6 @@ def test_append(DumpWorksheet):
 def test_dirty_cell(DumpWorksheet):
     ws = DumpWorksheet
 
-    def _writer(doc):
-        with xmlfile(doc) as xf:
-            with xf.element('sheetData'):
-                try:
-                    while True:
-                        body = (yield)
-                        xf.write(body)
-                except GeneratorExit:
-                    pass
-
     doc = BytesIO()
     ws.writer = _writer(doc)
     next(ws.writer)
@@ -161,6 +152,242 @@ def test_dirty_cell(DumpWorksheet):
     assert diff is None, diff
 
 
+def test_append_rows(DumpWorksheet):
+    ws = DumpWorksheet
+    doc = BytesIO()
+    ws.writer = _writer(doc)
+    next(ws.writer)
+
+    ws.append_rows([[1.5, None, True], ("s", "=A1", "#N/A")])
+    ws.append_rows(range(i, i+2) for i in range(2))
+    ws.writer.close()
+    xml = doc.getvalue()
+    expected = """
+    <sheetData>
+      <row r="1" spans="1:3">
+        <c r="A1" t="n"><v>1.5</v></c>
+        <c r="C1" t="b"><v>1</v></c>
+      </row>
+      <row r="2" spans="1:3">
+        <c r="A2" t="s"><v>0</v></c>
+        <c r="B2"><f>A1</f><v></v></c>
+        <c r="C2" t="e"><v>#N/A</v></c>
+      </row>
+      <row r="3" spans="1:2">
+        <c r="A3" t="n"><v>0</v></c>
+        <c r="B3" t="n"><v>1</v></c>
+      </row>
+      <row r="4" spans="1:2">
+        <c r="A4" t="n"><v>1</v></c>
+        <c r="B4" t="n"><v>2</v></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+    assert ws._max_row == 4
+    assert ws._max_col == 3
+
+
+def test_write_block(DumpWorksheet):
+    ws = DumpWorksheet
+    doc = BytesIO()
+    ws.writer = _writer(doc)
+    next(ws.writer)
+
+    ws.write_block([[1, "a"], [2, "a"]])
+    with pytest.raises(ValueError):
+        ws.write_block([[1, 2], [3]])
+    ws.writer.close()
+    xml = doc.getvalue()
+    expected = """
+    <sheetData>
+      <row r="1" spans="1:2">
+        <c r="A1" t="n"><v>1</v></c>
+        <c r="B1" t="s"><v>0</v></c>
+      </row>
+      <row r="2" spans="1:2">
+        <c r="A2" t="n"><v>2</v></c>
+        <c r="B2" t="s"><v>0</v></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+@pytest.mark.numpy_required
+def test_write_array(DumpWorksheet):
+    import numpy
+    ws = DumpWorksheet
+    doc = BytesIO()
+    ws.writer = _writer(doc)
+    next(ws.writer)
+
+    ws.write_block({
+        'n': numpy.array([1.5, numpy.nan]),
+        's': numpy.array(['a', 'b']),
+        'b': numpy.array([True, False]),
+    })
+    ws.write_block(numpy.array([[datetime.date(2001, 1, 1)]]))
+    ws.writer.close()
+    xml = doc.getvalue()
+    expected = """
+    <sheetData>
+      <row r="1" spans="1:3">
+        <c r="A1" t="s"><v>0</v></c>
+        <c r="B1" t="s"><v>1</v></c>
+        <c r="C1" t="s"><v>2</v></c>
+      </row>
+      <row r="2" spans="1:3">
+        <c r="A2" t="n"><v>1.5</v></c>
+        <c r="B2" t="s"><v>3</v></c>
+        <c r="C2" t="b"><v>1</v></c>
+      </row>
+      <row r="3" spans="1:3">
+        <c r="B3" t="s"><v>2</v></c>
+        <c r="C3" t="b"><v>0</v></c>
+      </row>
+      <row r="4" spans="1:1">
+        <c r="A4" t="n" s="1"><v>36892</v></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+    assert ws._max_row == 4
+
+
+@pytest.mark.numpy_required
+def test_write_date_array(DumpWorksheet):
+    from collections import OrderedDict
+    import numpy
+    ws = DumpWorksheet
+    doc = BytesIO()
+    ws.writer = _writer(doc)
+    next(ws.writer)
+
+    dates = numpy.array(['2015-01-01T12:00', 'NaT'], dtype='datetime64[m]')
+    ws.write_block(numpy.ma.masked_array(dates).reshape(2, 1))
+    ws.write_block(OrderedDict([('date', dates[:1]),
+                                ('text', numpy.array(['=A1']))]))
+    ws.writer.close()
+    xml = doc.getvalue()
+    expected = """
+    <sheetData>
+      <row r="1" spans="1:1">
+        <c r="A1" s="1" t="n"><v>42005.5</v></c>
+      </row>
+      <row r="2" spans="1:1" />
+      <row r="3" spans="1:2">
+        <c r="A3" t="s"><v>0</v></c>
+        <c r="B3" t="s"><v>1</v></c>
+      </row>
+      <row r="4" spans="1:2">
+        <c r="A4" s="1" t="n"><v>42005.5</v></c>
+        <c r="B4"><f>A1</f><v></v></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+def test_inline_strings(DumpWorksheet):
+    ws = DumpWorksheet
+    ws.string_mode = "inline"
+    doc = BytesIO()
+    ws.writer = _writer(doc)
+    next(ws.writer)
+
+    ws.append(["a & b", " padded "])
+    ws.writer.close()
+    xml = doc.getvalue()
+    expected = """
+    <sheetData>
+      <row r="1" spans="1:2">
+        <c r="A1" t="inlineStr"><is><t>a &amp; b</t></is></c>
+        <c r="B1" t="inlineStr"><is><t xml:space="preserve"> padded </t></is></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+    assert len(ws.parent.shared_strings) == 0
+
+
+def test_hybrid_strings(DumpWorksheet):
+    ws = DumpWorksheet
+    ws.string_mode = "hybrid"
+    ws.max_shared_strings = 2
+    doc = BytesIO()
+    ws.writer = _writer(doc)
+    next(ws.writer)
+
+    ws.append_rows([["a", "x"], ["b", "x"], ["c", "x"], ["a", "x"]])
+    ws.writer.close()
+    xml = doc.getvalue()
+    expected = """
+    <sheetData>
+      <row r="1" spans="1:2">
+        <c r="A1" t="s"><v>0</v></c>
+        <c r="B1" t="s"><v>1</v></c>
+      </row>
+      <row r="2" spans="1:2">
+        <c r="A2" t="s"><v>2</v></c>
+        <c r="B2" t="s"><v>1</v></c>
+      </row>
+      <row r="3" spans="1:2">
+        <c r="A3" t="inlineStr"><is><t>c</t></is></c>
+        <c r="B3" t="s"><v>1</v></c>
+      </row>
+      <row r="4" spans="1:2">
+        <c r="A4" t="s"><v>0</v></c>
+        <c r="B4" t="s"><v>1</v></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+    assert list(ws.parent.shared_strings) == ["a", "x", "b"]
+
+
+@pytest.mark.numpy_required
+def test_write_array_inline(DumpWorksheet):
+    import numpy
+    ws = DumpWorksheet
+    ws.string_mode = "hybrid"
+    ws.max_shared_strings = 1
+    doc = BytesIO()
+    ws.writer = _writer(doc)
+    next(ws.writer)
+
+    ws.write_block(numpy.array([["a", "x"], ["b", "x"]]))
+    ws.writer.close()
+    xml = doc.getvalue()
+    expected = """
+    <sheetData>
+      <row r="1" spans="1:2">
+        <c r="A1" t="inlineStr"><is><t>a</t></is></c>
+        <c r="B1" t="s"><v>0</v></c>
+      </row>
+      <row r="2" spans="1:2">
+        <c r="A2" t="inlineStr"><is><t>b</t></is></c>
+        <c r="B2" t="s"><v>0</v></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+def test_illegal_string(DumpWorksheet):
+    from openpyxl.utils.exceptions import IllegalCharacterError
+    ws = DumpWorksheet
+    with pytest.raises(IllegalCharacterError):
+        ws.append(["\x01"])
+
+
 @pytest.mark.parametrize("row", ("string", dict()))
 def test_invalid_append(DumpWorksheet, row):
     ws = DumpWorksheet
@@ -335,3 +562,72 @@ def test_write_empty_row(DumpWorksheet):
     """
     diff = compare_xml(xml, expected)
     assert diff is None, diff
+
+
+def test_spooled_worksheet():
+    from openpyxl import Workbook, load_workbook
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.spool_size = 2**20
+    ws.append([1, "a"])
+    assert ws.filename is None
+    out = BytesIO()
+    wb.save(out)
+    ws = load_workbook(out).active
+    assert [[c.value for c in row] for row in ws.rows] == [[1, "a"]]
+
+
+def test_temp_dir(tmpdir):
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.temp_dir = str(tmpdir)
+    ws.append([1])
+    assert tmpdir.listdir() == [tmpdir.join(ws.filename.split(tmpdir.sep)[-1])]
+    wb.save(BytesIO())
+    assert tmpdir.listdir() == []
+
+
+def test_stream_to(tmpdir):
+    from openpyxl import Workbook, load_workbook
+    from .. dump_worksheet import WorkbookAlreadySaved
+    tmpdir.chdir()
+    wb = Workbook(write_only=True)
+    wb.stream_to("streamed.xlsx")
+    ws1 = wb.create_sheet()
+    ws1.append(["a", 1])
+    assert ws1.filename is None
+    ws2 = wb.create_sheet()
+    ws2.append(["b", 2])
+    with pytest.raises(WorkbookAlreadySaved):
+        ws1.append(["c", 3])
+    with pytest.raises(ValueError):
+        wb.create_sheet(index=0)
+    wb.create_sheet() # left empty
+    with pytest.raises(ValueError):
+        wb.save("other.xlsx")
+    wb.save("streamed.xlsx")
+    with pytest.raises(WorkbookAlreadySaved):
+        wb.save("streamed.xlsx")
+
+    wb = load_workbook("streamed.xlsx")
+    rows = [[[c.value for c in row] for row in ws.rows] for ws in wb]
+    assert rows == [[["a", 1]], [["b", 2]], []]
+
+
+def test_stream_to_error(tmpdir):
+    from zipfile import ZipFile
+    from openpyxl import Workbook
+    from openpyxl.utils.exceptions import IllegalCharacterError
+    tmpdir.chdir()
+    wb = Workbook(write_only=True)
+    wb.stream_to("streamed.xlsx")
+    ws = wb.create_sheet()
+    ws.append(["a", 1])
+    with pytest.raises(IllegalCharacterError):
+        ws.append(["\x01"])
+    archive = wb._stream.archive
+    wb.close()
+    assert archive.fp is None
+    assert ws.closed
+    assert ZipFile("streamed.xlsx").namelist() == ["xl/worksheets/sheet1.xml"]
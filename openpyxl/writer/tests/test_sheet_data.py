@@ -0,0 +1,85 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+from io import BytesIO
+
+import pytest
+
+from openpyxl.workbook import Workbook
+from openpyxl.styles import Font
+
+from openpyxl.tests.helper import compare_xml
+
+
+@pytest.fixture
+def ws():
+    wb = Workbook()
+    return wb.active
+
+
+def test_iter_rows(ws):
+    from .. sheet_data import iter_rows
+    ws['B3'] = 1
+    ws['A3'] = 2
+    ws['C1'] = 3
+    ws.row_dimensions[2].height = 10
+    ws.row_dimensions[3].height = 10
+    rows = [(row, [col for col, cell in cells]) for row, cells in iter_rows(ws)]
+    assert rows == [(1, [3]), (2, []), (3, [1, 2])]
+
+
+@pytest.mark.parametrize("value, expected",
+                         [
+                             (1, '<c r="B2" t="n"><v>1</v></c>'),
+                             (2.5, '<c r="B2" t="n"><v>2.5</v></c>'),
+                             (True, '<c r="B2" t="b"><v>1</v></c>'),
+                             ("a", '<c r="B2" t="s"><v>0</v></c>'),
+                             ("", '<c r="B2" t="s"/>'),
+                             ("#N/A", '<c r="B2" t="e"><v>#N/A</v></c>'),
+                             ("=A1&\"<\"", '<c r="B2"><f>A1&amp;&quot;&lt;&quot;</f><v/></c>'),
+                             (None, None),
+                         ]
+                         )
+def test_encode_cell(ws, value, expected):
+    from .. sheet_data import encode_cell
+    cell = ws['B2']
+    cell.value = value
+    xml = encode_cell('<c r="B', '2', cell, ws.parent.shared_strings, {})
+    assert xml == expected
+
+
+def test_encode_styled_cell(ws):
+    from .. sheet_data import encode_cell
+    cell = ws['B2']
+    cell.font = Font(bold=True)
+    assert encode_cell('<c r="B', '2', cell, [], {}) == '<c r="B2" s="1" t="n"/>'
+    cell.value = 3
+    assert encode_cell('<c r="B', '2', cell, [], {}) == '<c r="B2" s="1" t="n"><v>3</v></c>'
+    cell.value = False
+    assert encode_cell('<c r="B', '2', cell, [], {}) == '<c r="B2" s="1" t="b"><v>0</v></c>'
+
+
+def test_write_sheet_data(ws):
+    from .. sheet_data import write_sheet_data
+    ws['A1'] = "hello"
+    ws['C1'] = 2
+    ws['B3'] = "=A1"
+    ws.formula_attributes['B3'] = {'t': 'shared', 'si': '0'}
+    ws.row_dimensions[2].height = 30
+    out = BytesIO()
+    write_sheet_data(out, ws)
+    xml = out.getvalue()
+    expected = """
+    <sheetData>
+      <row r="1" spans="1:3">
+        <c r="A1" t="s"><v>0</v></c>
+        <c r="C1" t="n"><v>2</v></c>
+      </row>
+      <row r="2" spans="1:3" customHeight="1" ht="30"/>
+      <row r="3" spans="1:3">
+        <c r="B3"><f si="0" t="shared"/><v/></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
@@ -78,6 +78,44 @@ def test_write_empty_workbook(tmpdir):
     assert os.path.isfile(dest_filename)
 
 
+def test_save_workbook_with_workers(tmpdir):
+    from openpyxl.styles import Font
+    tmpdir.chdir()
+    wb = Workbook()
+    ws1 = wb.active
+    ws1.append(["a", "b", 1])
+    ws1['A2'].font = Font(bold=True)
+    ws1['A2'] = "c"
+    ws2 = wb.create_sheet()
+    ws2.append(["d", "a", 2.5])
+    ws2.row_dimensions[1].font = Font(italic=True)
+    ws2['C1'].font = Font(size=20)
+
+    save_workbook(wb, "serial.xlsx")
+    styles = len(wb._cell_styles)
+    wb.shared_strings = type(wb.shared_strings)()
+    save_workbook(wb, "parallel.xlsx", workers=2)
+    assert len(wb._cell_styles) == styles
+
+    serial = ZipFile("serial.xlsx")
+    parallel = ZipFile("parallel.xlsx")
+    for name in ["xl/worksheets/sheet1.xml", "xl/worksheets/sheet2.xml",
+                 "xl/sharedStrings.xml", "xl/styles.xml"]:
+        assert parallel.read(name) == serial.read(name)
+
+
+def test_save_workbook_without_fork(tmpdir, monkeypatch, recwarn):
+    from .. import excel
+    monkeypatch.setattr(excel, "can_fork", lambda: False)
+    tmpdir.chdir()
+    wb = Workbook()
+    wb.active.append([1, "a"])
+    save_workbook(wb, "serial.xlsx", workers=2)
+    w = recwarn.pop(UserWarning)
+    assert "forked" in str(w.message)
+    assert load_workbook("serial.xlsx").active['B1'].value == "a"
+
+
 def test_write_virtual_workbook():
     old_wb = Workbook()
     saved_wb = save_virtual_workbook(old_wb)
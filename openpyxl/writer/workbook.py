@@ -278,7 +278,10 @@ def write_workbook(workbook):
 
     # Defined names -> autoFilter
     for i, sheet in enumerate(workbook.worksheets):
-        auto_filter = sheet.auto_filter.ref
+        if getattr(sheet, 'loaded', True):
+            auto_filter = sheet.auto_filter.ref
+        else:
+            auto_filter = sheet.source_auto_filter()
         if not auto_filter:
             continue
         name = SubElement(
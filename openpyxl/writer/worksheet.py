@@ -4,23 +4,27 @@ from __future__ import absolute_import
 """Write worksheets to xml representations."""
 
 # Python stdlib imports
+import multiprocessing
+import os
+import re
 from io import BytesIO
+from multiprocessing import Pool
 
 # compatibility imports
 
-from openpyxl.compat import safe_string, itervalues, iteritems
+from openpyxl.compat import safe_string, itervalues, iteritems, range
 
-from openpyxl import LXML
 
 # package imports
 from openpyxl.utils import (
     coordinate_from_string,
     column_index_from_string,
 )
+from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.xml.functions import (
     Element,
     SubElement,
-    xmlfile,
+    tostring,
 )
 from openpyxl.xml.constants import (
     SHEET_MAIN_NS,
@@ -31,6 +35,11 @@ from openpyxl.worksheet.datavalidation import writer
 from openpyxl.worksheet.properties import WorksheetProperties, write_sheetPr
 
 from .etree_worksheet import write_cell
+from .sheet_data import write_sheet_data
+
+
+WORKSHEET_START = ('<worksheet xmlns="%s" xmlns:r="%s">' % (SHEET_MAIN_NS, REL_NS)).encode("utf-8")
+WORKSHEET_END = b'</worksheet>'
 
 
 def write_properties(worksheet):
@@ -206,101 +215,167 @@ def write_pagebreaks(worksheet):
 
 def write_worksheet(worksheet, shared_strings):
     """Write a worksheet to an xml file."""
-    if LXML is True:
-        from .lxml_worksheet import write_cell, write_rows
-    else:
-        from .etree_worksheet import write_cell, write_rows
-
     out = BytesIO()
-
-    with xmlfile(out) as xf:
-        with xf.element('worksheet', xmlns=SHEET_MAIN_NS):
-
-            props = write_properties(worksheet)
-            xf.write(props)
-
-            dim = Element('dimension', {'ref': '%s' % worksheet.calculate_dimension()})
-            xf.write(dim)
-
-            views = Element('sheetViews')
-            views.append(worksheet.sheet_view.to_tree())
-            xf.write(views)
-
-            xf.write(write_format(worksheet))
-            cols = write_cols(worksheet)
-            if cols is not None:
-                xf.write(cols)
-            write_rows(xf, worksheet)
-
-            if worksheet.protection.sheet:
-                prot = Element('sheetProtection', dict(worksheet.protection))
-                xf.write(prot)
-
-            af = write_autofilter(worksheet)
-            if af is not None:
-                xf.write(af)
-
-            merge = write_mergecells(worksheet)
-            if merge is not None:
-                xf.write(merge)
-
-            cfs = write_conditional_formatting(worksheet)
-            for cf in cfs:
-                xf.write(cf)
-
-            dv = write_datavalidation(worksheet)
-            if dv is not None:
-                xf.write(dv)
-
-            hyper = write_hyperlinks(worksheet)
-            if hyper is not None:
-                xf.write(hyper)
-
-
-            options = worksheet.print_options
-            if len(dict(options)) > 0:
-                new_element = options.write_xml_element()
-                xf.write(new_element)
-                del new_element
-
-            margins = Element('pageMargins', dict(worksheet.page_margins))
-            xf.write(margins)
-            del margins
-
-            setup = worksheet.page_setup
-            if len(dict(setup)) > 0:
-                new_element = setup.write_xml_element()
-                xf.write(new_element)
-                del new_element
-
-            hf = write_header_footer(worksheet)
-            if hf is not None:
-                xf.write(hf)
-
-            if worksheet._charts or worksheet._images:
-                drawing = Element('drawing', {'{%s}id' % REL_NS: 'rId1'})
-                xf.write(drawing)
-                del drawing
-
-            pb = write_pagebreaks(worksheet)
-            if pb is not None:
-                xf.write(pb)
-
-            # If vba is being preserved then add a legacyDrawing element so
-            # that any controls can be drawn.
-            if worksheet.vba_controls is not None:
-                xml = Element("{%s}legacyDrawing" % SHEET_MAIN_NS,
-                              {"{%s}id" % REL_NS : worksheet.vba_controls})
-                xf.write(xml)
-            elif worksheet._comment_count > 0:
-                # add a legacyDrawing so that excel can draw comments
-                # If a legacyDrawing element has already been added then
-                # we have to hope it already contains the vml for
-                # comments because we cannot add another.
-                comments = Element('{%s}legacyDrawing' % SHEET_MAIN_NS,
-                                {'{%s}id' % REL_NS: 'commentsvml'})
-                xf.write(comments)
-
+    stream_worksheet(out, worksheet)
     xml = out.getvalue()
     out.close()
     return xml
+
+
+def stream_worksheet(out, worksheet):
+    """Write a worksheet to a binary file-like object"""
+    out.write(WORKSHEET_START)
+    for el in write_head(worksheet):
+        out.write(tostring(el))
+    write_sheet_data(out, worksheet)
+    for el in write_tail(worksheet):
+        out.write(tostring(el))
+    out.write(WORKSHEET_END)
+
+
+SHARED_STRING_RE = re.compile(br't="s"><v>(\d+)</v>')
+
+_worker = {}
+
+
+def can_fork():
+    """Whether worker processes share the workbook of the main process"""
+    get_start_method = getattr(multiprocessing, 'get_start_method', None)
+    if get_start_method is not None:
+        return get_start_method() == 'fork'
+    return hasattr(os, 'fork')
+
+
+def _cache_style_ids(worksheet):
+    """
+    Add the styles of the worksheet to the workbook so that worker processes
+    only look them up
+    """
+    for cell in itervalues(worksheet._cells):
+        if cell.has_style:
+            cell.style_id
+    for dims in (worksheet.row_dimensions, worksheet.column_dimensions):
+        for dim in itervalues(dims):
+            if dim.has_style:
+                dim.style_id
+
+
+def _init_worker(workbook):
+    _worker['workbook'] = workbook
+
+
+def _render_worksheet(idx):
+    """
+    Serialise a worksheet with a string table of its own, return the xml
+    and the strings
+    """
+    wb = _worker['workbook']
+    wb.shared_strings = IndexedList()
+    out = BytesIO()
+    stream_worksheet(out, wb.worksheets[idx])
+    return out.getvalue(), list(wb.shared_strings)
+
+
+def _remap_strings(xml, strings, shared_strings):
+    """Replace the indices of a local string table with the shared ones"""
+    indices = [shared_strings.add(s) for s in strings]
+    if indices == list(range(len(indices))):
+        return xml
+
+    def remap(match):
+        return ('t="s"><v>%d</v>' % indices[int(match.group(1))]).encode("utf-8")
+
+    return SHARED_STRING_RE.sub(remap, xml)
+
+
+def render_worksheets(workbook, indices, workers):
+    """
+    Serialise the worksheets at the given positions in a pool of forked
+    processes. The xml is yielded in order with shared string indices.
+    """
+    for idx in indices:
+        _cache_style_ids(workbook.worksheets[idx])
+    shared_strings = workbook.shared_strings
+    pool = Pool(workers, _init_worker, (workbook,))
+    try:
+        for xml, strings in pool.imap(_render_worksheet, indices):
+            yield _remap_strings(xml, strings, shared_strings)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def write_head(worksheet):
+    """Elements of a worksheet before its cells"""
+    yield write_properties(worksheet)
+
+    yield Element('dimension', {'ref': '%s' % worksheet.calculate_dimension()})
+
+    views = Element('sheetViews')
+    views.append(worksheet.sheet_view.to_tree())
+    yield views
+
+    yield write_format(worksheet)
+    cols = write_cols(worksheet)
+    if cols is not None:
+        yield cols
+
+
+def write_tail(worksheet):
+    """Elements of a worksheet after its cells"""
+    if worksheet.protection.sheet:
+        yield Element('sheetProtection', dict(worksheet.protection))
+
+    af = write_autofilter(worksheet)
+    if af is not None:
+        yield af
+
+    merge = write_mergecells(worksheet)
+    if merge is not None:
+        yield merge
+
+    cfs = write_conditional_formatting(worksheet)
+    for cf in cfs:
+        yield cf
+
+    dv = write_datavalidation(worksheet)
+    if dv is not None:
+        yield dv
+
+    hyper = write_hyperlinks(worksheet)
+    if hyper is not None:
+        yield hyper
+
+    options = worksheet.print_options
+    if len(dict(options)) > 0:
+        yield options.write_xml_element()
+
+    yield Element('pageMargins', dict(worksheet.page_margins))
+
+    setup = worksheet.page_setup
+    if len(dict(setup)) > 0:
+        yield setup.write_xml_element()
+
+    hf = write_header_footer(worksheet)
+    if hf is not None:
+        yield hf
+
+    if worksheet._charts or worksheet._images:
+        yield Element('drawing', {'{%s}id' % REL_NS: 'rId1'})
+
+    pb = write_pagebreaks(worksheet)
+    if pb is not None:
+        yield pb
+
+    # If vba is being preserved then add a legacyDrawing element so
+    # that any controls can be drawn.
+    if worksheet.vba_controls is not None:
+        yield Element("{%s}legacyDrawing" % SHEET_MAIN_NS,
+                      {"{%s}id" % REL_NS : worksheet.vba_controls})
+    elif worksheet._comment_count > 0:
+        # add a legacyDrawing so that excel can draw comments
+        # If a legacyDrawing element has already been added then
+        # we have to hope it already contains the vml for
+        # comments because we cannot add another.
+        yield Element('{%s}legacyDrawing' % SHEET_MAIN_NS,
+                      {'{%s}id' % REL_NS: 'commentsvml'})
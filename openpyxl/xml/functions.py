@@ -11,6 +11,7 @@ Shortcut functions taken from:
 # Python stdlib imports
 import re
 from functools import partial
+from io import BytesIO
 from xml.sax.saxutils import XMLGenerator
 
 XMLGenerator = partial(XMLGenerator, encoding="utf-8")
@@ -73,8 +74,8 @@ from openpyxl.xml.constants import (
 
 # allow LXML interface
 _iterparse = iterparse
-def safe_iterparse(source, *args, **kw):
-    return _iterparse(source)
+def safe_iterparse(source, events=None, *args, **kw):
+    return _iterparse(source, events)
 
 iterparse = safe_iterparse
 
@@ -148,3 +149,22 @@ NS_REGEX = re.compile("{(?P<namespace>.*)}(?P<localname>.*)")
 def localname(node):
     m = NS_REGEX.match(node.tag)
     return m.group('localname')
+
+
+def get_xml_iter(xml_source):
+    """
+    Possible inputs: strings, bytes, members of zipfile, temporary file
+    Always return a file like object
+    """
+    if not hasattr(xml_source, 'read'):
+        try:
+            xml_source = xml_source.encode("utf-8")
+        except (AttributeError, UnicodeDecodeError):
+            pass
+        return BytesIO(xml_source)
+    else:
+        try:
+            xml_source.seek(0)
+        except:
+            pass
+        return xml_source
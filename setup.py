@@ -68,9 +68,6 @@ setup(name='openpyxl',
     requires=[
         'python (>=2.6.0)',
         ],
-    install_requires=[
-        'jdcal',
-        ],
     classifiers=[
                  'Development Status :: 5 - Production/Stable',
                  'Operating System :: MacOS :: MacOS X',